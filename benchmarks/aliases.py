@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmark rendering equivalent rulesets once in format_number.
+
+Formats random numbers for cardinal and ordinal purposes in every language,
+with and without ruleset aliases (see RbnfEngine.get_ruleset_aliases).
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.engine import RbnfError, _RulesetAliases
+
+
+def format_all(engine: RbnfEngine, numbers: List[int]) -> float:
+    """Format numbers for cardinal and ordinal purposes and return seconds."""
+    start_time = time.perf_counter()
+    for purpose in (FormatPurpose.CARDINAL, FormatPurpose.ORDINAL):
+        for number in numbers:
+            try:
+                engine.format_number(number, purpose)
+            except (RbnfError, ValueError):
+                pass
+
+    return time.perf_counter() - start_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", nargs="*", help="Languages (default: all)")
+    parser.add_argument("--numbers", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    numbers = [rng.randrange(0, 10**7) for _ in range(args.numbers)]
+
+    total_seconds = {True: 0.0, False: 0.0}
+    for language in args.language or RbnfEngine.get_supported_languages():
+        seconds = {}
+        for use_aliases in (True, False):
+            engine = RbnfEngine.for_language(language)
+            if not use_aliases:
+                # No aliases means every ruleset is rendered
+                engine._aliases = _RulesetAliases()  # pylint: disable=protected-access
+
+            seconds[use_aliases] = format_all(engine.freeze(), numbers)
+            total_seconds[use_aliases] += seconds[use_aliases]
+
+        num_aliases = len(RbnfEngine.for_language(language).get_ruleset_aliases(True))
+        print(
+            language,
+            f"aliases={num_aliases}",
+            f"{seconds[False] / seconds[True]:.2f}x",
+            sep="|",
+        )
+
+    print(f"With aliases: {total_seconds[True]:.3f}s")
+    print(f"Without aliases: {total_seconds[False]:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark formatting an Arrow integer column.
+
+Compares format_arrow with converting the column to NumPy for format_array
+(and back), and with a Python loop over format_number (time is extrapolated).
+Peak memory is the largest allocation by Python objects (tracemalloc) plus the
+Arrow memory pool.
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.arrow import format_arrow
+from unicode_rbnf.batch import format_array
+
+
+def measure(function: Callable[[], pa.ChunkedArray]) -> Tuple[float, float]:
+    """Return seconds and peak MiB of a function."""
+    arrow_bytes = pa.total_allocated_bytes()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start_time
+    python_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    result_bytes = pa.total_allocated_bytes() - arrow_bytes
+    del result
+
+    return seconds, (python_bytes + result_bytes) / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--size", type=int, default=10_000_000, help="Column size")
+    parser.add_argument(
+        "--loop-size",
+        type=int,
+        default=20000,
+        help="Numbers formatted in the Python loop (time is extrapolated)",
+    )
+    parser.add_argument(
+        "--max-value", type=int, nargs="+", default=[10**3, 10**6, 10**9]
+    )
+    parser.add_argument(
+        "--skip-numpy",
+        action="store_true",
+        help="Don't run format_array on the whole column (needs a lot of memory)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = RbnfEngine.for_language(args.language).freeze()
+    rng = np.random.default_rng(args.seed)
+
+    for max_value in args.max_value:
+        column = pa.chunked_array([rng.integers(0, max_value, args.size)])
+        print(f"{args.size:,} rows from 0 to {max_value:,}:")
+
+        def with_numpy(column: pa.ChunkedArray = column) -> pa.ChunkedArray:
+            texts = format_array(engine, column.to_numpy())
+            return pa.chunked_array([pa.array(texts, type=pa.string())])
+
+        def with_arrow(column: pa.ChunkedArray = column) -> pa.ChunkedArray:
+            return format_arrow(engine, column)
+
+        loop_numbers = column.slice(0, args.loop_size).to_pylist()
+        start_time = time.perf_counter()
+        for number in loop_numbers:
+            engine.format_number(number)
+        loop_seconds = (time.perf_counter() - start_time) * (
+            args.size / len(loop_numbers)
+        )
+        print(f"  Python loop: {loop_seconds:.1f}s (extrapolated)")
+
+        functions = [("NumPy", with_numpy), ("Arrow", with_arrow)]
+        if args.skip_numpy:
+            functions = functions[1:]
+
+        for name, function in functions:
+            seconds, peak_mib = measure(function)
+            print(
+                f"  {name}: {seconds:.1f}s ({loop_seconds / seconds:.1f}x), "
+                f"peak {peak_mib:,.0f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Benchmark formatting a NumPy array vs. a Python loop over format_number."""
+import argparse
+import time
+
+import numpy as np
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.batch import format_array
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--size", type=int, default=1_000_000, help="Array size")
+    parser.add_argument(
+        "--loop-size",
+        type=int,
+        default=20000,
+        help="Numbers formatted in the Python loop (time is extrapolated)",
+    )
+    parser.add_argument(
+        "--max-value", type=int, nargs="+", default=[10**3, 10**6, 10**9]
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = RbnfEngine.for_language(args.language).freeze()
+    rng = np.random.default_rng(args.seed)
+
+    for max_value in args.max_value:
+        numbers = rng.integers(0, max_value, args.size)
+
+        start_time = time.perf_counter()
+        format_array(engine, numbers)
+        batch_seconds = time.perf_counter() - start_time
+
+        loop_numbers = numbers[: args.loop_size].tolist()
+        start_time = time.perf_counter()
+        for number in loop_numbers:
+            engine.format_number(number)
+        loop_seconds = (
+            (time.perf_counter() - start_time) * len(numbers) / len(loop_numbers)
+        )
+
+        print(
+            f"max={max_value:,}: batch={batch_seconds:.2f}s,",
+            f"loop={loop_seconds:.2f}s (estimated),",
+            f"speedup={loop_seconds / batch_seconds:.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
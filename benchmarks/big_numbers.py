@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Benchmark formatting numbers past the highest rule of a ruleset."""
+import argparse
+import random
+import time
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.engine import BigNumberMode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--digits", type=int, nargs="+", default=[20, 100, 1000])
+    parser.add_argument("--numbers", type=int, default=100, help="Numbers per size")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    engine = RbnfEngine.for_language(args.language).freeze()
+
+    for num_digits in args.digits:
+        numbers = [
+            rng.randrange(10 ** (num_digits - 1), 10**num_digits)
+            for _ in range(args.numbers)
+        ]
+        for big_number_mode in (BigNumberMode.DIGITS, BigNumberMode.SCALE_WORDS):
+            num_chars = 0
+            start_time = time.perf_counter()
+            for number in numbers:
+                num_chars += len(
+                    engine.format_number(number, big_number_mode=big_number_mode).text
+                )
+            seconds = time.perf_counter() - start_time
+
+            print(
+                f"{num_digits} digit(s), {big_number_mode.value}:",
+                f"{args.numbers / seconds:,.1f} numbers/s,",
+                f"{num_chars / seconds:,.0f} chars/s",
+            )
+
+
+if __name__ == "__main__":
+    main()
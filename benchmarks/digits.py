@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark reading digit strings with format_digits vs. format_number.
+
+Random IDs are read digit by digit and in pairs, once with format_digits and
+once with a format_number call per group (leading zeros read as digits).
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from unicode_rbnf import RbnfEngine
+
+
+def read_with_format_number(engine: RbnfEngine, digits: str, group_size: int) -> str:
+    """Read digits in groups with one format_number call per group or zero."""
+    texts: List[str] = []
+    for group_idx in range(0, len(digits), group_size):
+        group = digits[group_idx : group_idx + group_size]
+        no_zeros = group.lstrip("0")
+        texts.extend(
+            engine.format_number(0).text for _ in range(len(group) - len(no_zeros))
+        )
+        if no_zeros:
+            texts.append(engine.format_number(int(no_zeros)).text)
+
+    return " ".join(texts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", nargs="+", default=["en", "de", "ru"])
+    parser.add_argument("--ids", type=int, default=10_000, help="Number of IDs")
+    parser.add_argument("--length", type=int, default=20, help="Digits per ID")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    ids = [
+        "".join(rng.choice("0123456789") for _ in range(args.length))
+        for _ in range(args.ids)
+    ]
+
+    for language in args.language:
+        engine = RbnfEngine.for_language(language).freeze()
+        for group_size in (1, 2):
+            start_time = time.perf_counter()
+            digits_texts = [
+                engine.format_digits(digits, group_size=group_size) for digits in ids
+            ]
+            digits_seconds = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            number_texts = [
+                read_with_format_number(engine, digits, group_size) for digits in ids
+            ]
+            number_seconds = time.perf_counter() - start_time
+
+            assert digits_texts == number_texts, language
+            print(
+                language,
+                f"group_size={group_size}",
+                f"format_digits={digits_seconds * 1e6 / len(ids):.1f}us",
+                f"format_number={number_seconds * 1e6 / len(ids):.1f}us",
+                f"({number_seconds / digits_seconds:.0f}x)",
+                sep="|",
+            )
+
+
+if __name__ == "__main__":
+    main()
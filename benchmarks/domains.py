@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Benchmark skipping rulesets that can't format a number.
+
+Formats numbers past the highest rule and negative numbers in every language,
+with and without checking ruleset domains first.
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.engine import RbnfError
+
+
+def format_all(engine: RbnfEngine, numbers: List[int]) -> None:
+    """Format numbers for cardinal and ordinal purposes, ignoring failures."""
+    for purpose in (FormatPurpose.CARDINAL, FormatPurpose.ORDINAL):
+        for number in numbers:
+            try:
+                engine.format_number(number, purpose)
+            except (RbnfError, ValueError):
+                pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", nargs="*", help="Languages (default: all)")
+    parser.add_argument("--numbers", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    numbers = [rng.randrange(10**18, 10**24) for _ in range(args.numbers)]
+    numbers.extend(-rng.randrange(1, 10**6) for _ in range(args.numbers))
+
+    total_seconds = {True: 0.0, False: 0.0}
+    for language in args.language or RbnfEngine.get_supported_languages():
+        for use_domains in (True, False):
+            engine = RbnfEngine.for_language(language).freeze()
+            if not use_domains:
+                # No domains means every ruleset is rendered
+                engine._domains = {}  # pylint: disable=protected-access
+
+            start_time = time.perf_counter()
+            format_all(engine, numbers)
+            total_seconds[use_domains] += time.perf_counter() - start_time
+
+    print(f"With domains: {total_seconds[True]:.3f}s")
+    print(f"Without domains: {total_seconds[False]:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Measure memory of pre-forked workers that share loaded engines (Linux only).
+
+Engines are loaded in the parent, then workers are forked and format numbers
+with every engine. With regular engines, reference counting and GC write to
+the rule objects, so each worker ends up with private copies of their pages.
+With mapped engines, rules stay in a shared read-only mmap.
+"""
+import argparse
+import gc
+import multiprocessing
+import random
+import tempfile
+from multiprocessing.connection import Connection
+from typing import Dict, List, Mapping
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.compiled import preload
+
+
+def read_memory_kb() -> Dict[str, int]:
+    """Read memory totals of the current process from smaps_rollup."""
+    memory_kb: Dict[str, int] = {}
+    with open("/proc/self/smaps_rollup", "r", encoding="utf-8") as smaps_file:
+        for line in smaps_file:
+            parts = line.split()
+            if (len(parts) == 3) and (parts[2] == "kB"):
+                memory_kb[parts[0].rstrip(":")] = int(parts[1])
+
+    return memory_kb
+
+
+def run_worker(
+    engines: Mapping[str, RbnfEngine], numbers: List[int], conn: Connection
+) -> None:
+    for engine in engines.values():
+        for number in numbers:
+            engine.format_number(number)
+
+    # Simulate a long-running worker
+    gc.collect()
+
+    memory_kb = read_memory_kb()
+    conn.send(memory_kb)
+    conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=("objects", "mapped"), default="mapped")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--numbers", type=int, default=200)
+    parser.add_argument(
+        "--language",
+        action="append",
+        help="Language to load (default: all supported languages)",
+    )
+    args = parser.parse_args()
+
+    languages = args.language or RbnfEngine.get_supported_languages()
+    rng = random.Random(0)
+    numbers = [rng.randrange(0, 10**6) for _ in range(args.numbers)]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        engines: Mapping[str, RbnfEngine]
+        if args.mode == "mapped":
+            engines = preload(languages, cache_dir)
+        else:
+            engines = {
+                language: RbnfEngine.for_language(language).freeze()
+                for language in languages
+            }
+            gc.collect()
+            gc.freeze()
+
+        parent_kb = read_memory_kb()
+        context = multiprocessing.get_context("fork")
+        processes = []
+        connections = []
+        for _ in range(args.workers):
+            recv_conn, send_conn = context.Pipe(duplex=False)
+            process = context.Process(
+                target=run_worker, args=(engines, numbers, send_conn)
+            )
+            process.start()
+            processes.append(process)
+            connections.append(recv_conn)
+
+        worker_kbs = [conn.recv() for conn in connections]
+        for process in processes:
+            process.join()
+
+    print(f"mode={args.mode}, languages={len(languages)}, workers={args.workers}")
+    print(f"parent: Rss={parent_kb['Rss']:,} kB")
+    for key in ("Rss", "Pss", "Private_Clean", "Private_Dirty"):
+        average_kb = sum(kb.get(key, 0) for kb in worker_kbs) / len(worker_kbs)
+        print(f"worker average {key}={average_kb:,.0f} kB")
+
+
+if __name__ == "__main__":
+    main()
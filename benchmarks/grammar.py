@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark building a grammar for a range vs. formatting every number.
+
+The grammar of every ruleset for the purpose is built symbolically, and the
+time to collect the same texts with format_number is extrapolated from a
+sample of the range.
+"""
+import argparse
+import random
+import time
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.engine import NoRuleForNumberError
+from unicode_rbnf.grammar import build_number_grammar
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", nargs="+", default=["en", "de", "ru"])
+    parser.add_argument(
+        "--purpose",
+        choices=[v.value for v in FormatPurpose],
+        default=FormatPurpose.CARDINAL.value,
+    )
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--stop", type=int, default=1_000_000)
+    parser.add_argument(
+        "--sample-size",
+        type=int,
+        default=10_000,
+        help="Numbers formatted to extrapolate format_number time",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    purpose = FormatPurpose(args.purpose)
+    rng = random.Random(args.seed)
+    num_numbers = args.stop - args.start
+    sample = [
+        rng.randrange(args.start, args.stop)
+        for _ in range(min(args.sample_size, num_numbers))
+    ]
+
+    for language in args.language:
+        engine = RbnfEngine.for_language(language).freeze()
+
+        start_time = time.perf_counter()
+        grammar = build_number_grammar(engine, args.start, args.stop, purpose)
+        jsgf = grammar.to_jsgf()
+        vocabulary = grammar.get_vocabulary()
+        grammar_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for number in sample:
+            try:
+                engine.format_number(number, purpose)
+            except NoRuleForNumberError:
+                pass
+
+        format_seconds = (
+            (time.perf_counter() - start_time) * num_numbers / max(1, len(sample))
+        )
+
+        print(
+            language,
+            f"grammar={grammar_seconds:.3f}s",
+            f"format_number={format_seconds:.1f}s (extrapolated)",
+            f"({format_seconds / grammar_seconds:.0f}x)",
+            f"rules={len(grammar.rules)}",
+            f"jsgf={len(jsgf):,} chars",
+            f"vocabulary={len(vocabulary)}",
+            sep="|",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""Compare speed and output with ICU's RuleBasedNumberFormat (requires PyICU).
+
+Both engines format the same numbers with every public spellout ruleset they
+have in common. Throughput ratios are printed per language, and mismatches are
+counted per ruleset.
+
+With --write-golden, ICU output for a fixed set of numbers is saved (one JSON
+file per language) so tests/test_icu_parity.py can check parity without ICU:
+
+    python3 benchmarks/icu_parity.py --write-golden tests/golden/icu
+"""
+# PyICU members are created by its extension module
+# pylint: disable=no-member
+import argparse
+import json
+import random
+import statistics
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import icu  # pylint: disable=import-error
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.engine import RbnfError
+
+NumberType = Union[int, Decimal]
+
+# Numbers saved in golden files
+GOLDEN_NUMBERS: List[str] = [str(n) for n in range(0, 25)] + [
+    "30",
+    "42",
+    "57",
+    "99",
+    "100",
+    "101",
+    "121",
+    "200",
+    "999",
+    "1000",
+    "1001",
+    "1234",
+    "2000",
+    "21000",
+    "100000",
+    "1234567",
+    "1000000000",
+    "-1",
+    "-42",
+    "0.5",
+    "1.25",
+    "3.14",
+]
+
+# name -> random number generator
+DISTRIBUTIONS: Dict[str, Callable[[random.Random], NumberType]] = {
+    "small": lambda rng: rng.randrange(0, 100),
+    "medium": lambda rng: rng.randrange(0, 10**6),
+    "large": lambda rng: rng.randrange(0, 10**12),
+    "negative": lambda rng: -rng.randrange(1, 10**6),
+    "fraction": lambda rng: Decimal(rng.randrange(0, 100000)) / 100,
+}
+
+
+def to_icu_number(number: NumberType) -> Union[int, float]:
+    """ICU formats 64-bit integers and doubles."""
+    if isinstance(number, Decimal):
+        if number == number.to_integral_value():
+            return int(number)
+
+        return float(number)
+
+    return number
+
+
+def format_icu(icu_format, number: NumberType) -> str:
+    """Format with ICU (soft hyphens removed like format_number)."""
+    return icu_format.format(to_icu_number(number)).replace("\xad", "")
+
+
+def format_rbnf(
+    engine: RbnfEngine, number: NumberType, ruleset_name: str
+) -> Optional[str]:
+    """Format with this package (None if it has no rule for the number).
+
+    Other exceptions are bugs, not differences from ICU, and are raised.
+    """
+    try:
+        return engine.format_number(number, ruleset_names=[ruleset_name]).text
+    except RbnfError:
+        return None
+
+
+def get_icu_formats(language: str) -> Optional[Dict[str, object]]:
+    """Get ICU formatter for each public spellout ruleset (without %).
+
+    Returns None if ICU has no rules for the language.
+    """
+    locale = icu.Locale(language)
+    base_format = icu.RuleBasedNumberFormat(icu.URBNFRuleSetTag.SPELLOUT, locale)
+    actual_locale = base_format.getLocale(icu.ULocDataLocaleType.ACTUAL_LOCALE)
+    if actual_locale.getLanguage() != locale.getLanguage():
+        # ICU fell back to another language (usually English)
+        return None
+
+    icu_formats: Dict[str, object] = {}
+    for ruleset_idx in range(base_format.getNumberOfRuleSetNames()):
+        icu_ruleset_name = str(base_format.getRuleSetName(ruleset_idx))
+        icu_format = icu.RuleBasedNumberFormat(icu.URBNFRuleSetTag.SPELLOUT, locale)
+        icu_format.setDefaultRuleSet(icu_ruleset_name)
+        icu_formats[icu_ruleset_name.lstrip("%")] = icu_format
+
+    return icu_formats
+
+
+def get_common_rulesets(
+    engine: RbnfEngine, icu_formats: Dict[str, object]
+) -> List[str]:
+    """Public rulesets loaded in both engines."""
+    return sorted(
+        name
+        for name, ruleset in engine.rulesets.items()
+        if (not ruleset.is_private) and (name in icu_formats)
+    )
+
+
+def write_golden(language: str, golden_dir: Path) -> Optional[int]:
+    """Save ICU output for GOLDEN_NUMBERS and return number of mismatches.
+
+    Numbers that crash this package are saved separately from mismatches, so
+    tests/test_icu_parity.py still checks (and fails) them.
+    """
+    engine = RbnfEngine.for_language(language)
+    icu_formats = get_icu_formats(language)
+    if icu_formats is None:
+        return None
+
+    numbers = [Decimal(n) if "." in n else int(n) for n in GOLDEN_NUMBERS]
+
+    rulesets: Dict[str, Dict[str, str]] = {}
+    mismatches: Dict[str, List[str]] = {}
+    crashes: Dict[str, Dict[str, str]] = {}
+    for ruleset_name in get_common_rulesets(engine, icu_formats):
+        icu_texts: Dict[str, str] = {}
+        for number_str, number in zip(GOLDEN_NUMBERS, numbers):
+            icu_text = format_icu(icu_formats[ruleset_name], number)
+            icu_texts[number_str] = icu_text
+            try:
+                text = format_rbnf(engine, number, ruleset_name)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                crashes.setdefault(ruleset_name, {})[number_str] = repr(err)
+                continue
+
+            if text != icu_text:
+                mismatches.setdefault(ruleset_name, []).append(number_str)
+
+        rulesets[ruleset_name] = icu_texts
+
+    golden: Dict[str, Any] = {
+        "language": language,
+        "icu_version": icu.ICU_VERSION,
+        "rulesets": rulesets,
+        "mismatches": mismatches,
+        "icu_only_rulesets": sorted(set(icu_formats) - set(rulesets)),
+    }
+
+    if crashes:
+        golden["crashes"] = crashes
+
+    golden_dir.mkdir(parents=True, exist_ok=True)
+    with open(golden_dir / f"{language}.json", "w", encoding="utf-8") as golden_file:
+        json.dump(golden, golden_file, ensure_ascii=False, indent=1, sort_keys=True)
+        print("", file=golden_file)
+
+    for ruleset_name, crashed in crashes.items():
+        for number_str, error in crashed.items():
+            print(language, ruleset_name, number_str, "crashed:", error, sep="\t")
+
+    return sum(len(v) for v in mismatches.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--language", nargs="+", help="Languages (default: all supported)"
+    )
+    parser.add_argument(
+        "--numbers", type=int, default=200, help="Numbers per distribution"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--write-golden", help="Directory to write golden files")
+    parser.add_argument("--report", help="Path to write JSON mismatch report")
+    args = parser.parse_args()
+
+    languages = args.language or RbnfEngine.get_supported_languages()
+    print(f"ICU {icu.ICU_VERSION}, {len(languages)} language(s)")
+
+    if args.write_golden:
+        golden_dir = Path(args.write_golden)
+        for language in languages:
+            num_mismatches = write_golden(language, golden_dir)
+            if num_mismatches is None:
+                print(language, "not in ICU", sep="\t")
+            else:
+                print(language, f"mismatches={num_mismatches}", sep="\t")
+        return
+
+    rng = random.Random(args.seed)
+    numbers_by_distribution = {
+        name: [make_number(rng) for _ in range(args.numbers)]
+        for name, make_number in DISTRIBUTIONS.items()
+    }
+
+    # language -> ruleset -> distribution -> mismatch count
+    report: Dict[str, Dict[str, Dict[str, int]]] = {}
+    ratios: List[float] = []
+    for language in languages:
+        engine = RbnfEngine.for_language(language).freeze()
+        icu_formats = get_icu_formats(language)
+        if icu_formats is None:
+            print(language, "not in ICU", sep="\t")
+            continue
+
+        ruleset_names = get_common_rulesets(engine, icu_formats)
+        if not ruleset_names:
+            print(language, "no common rulesets", sep="\t")
+            continue
+
+        icu_seconds = 0.0
+        rbnf_seconds = 0.0
+        language_report: Dict[str, Dict[str, int]] = {}
+        for distribution, numbers in numbers_by_distribution.items():
+            for ruleset_name in ruleset_names:
+                icu_format = icu_formats[ruleset_name]
+                start_time = time.perf_counter()
+                icu_texts = [format_icu(icu_format, number) for number in numbers]
+                icu_seconds += time.perf_counter() - start_time
+
+                start_time = time.perf_counter()
+                rbnf_texts = [
+                    format_rbnf(engine, number, ruleset_name) for number in numbers
+                ]
+                rbnf_seconds += time.perf_counter() - start_time
+
+                num_mismatches = sum(
+                    1
+                    for icu_text, text in zip(icu_texts, rbnf_texts)
+                    if icu_text != text
+                )
+                if num_mismatches > 0:
+                    language_report.setdefault(ruleset_name, {})[
+                        distribution
+                    ] = num_mismatches
+
+        report[language] = language_report
+        ratio = rbnf_seconds / icu_seconds
+        ratios.append(ratio)
+
+        num_formatted = len(ruleset_names) * args.numbers * len(DISTRIBUTIONS)
+        total_mismatches = sum(
+            sum(counts.values()) for counts in language_report.values()
+        )
+        print(
+            language,
+            f"rulesets={len(ruleset_names)}",
+            f"icu={num_formatted / icu_seconds:,.0f}/s",
+            f"rbnf={num_formatted / rbnf_seconds:,.0f}/s",
+            f"ratio={ratio:.1f}x",
+            f"mismatches={total_mismatches}/{num_formatted}",
+            sep="\t",
+        )
+
+    if ratios:
+        print(
+            f"Geometric mean ratio (rbnf/icu time): {statistics.geometric_mean(ratios):.1f}x"
+        )
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark enumerating a range of numbers with iter_range vs. format_number.
+
+Each ruleset is enumerated separately (as when generating training data), and
+the texts of both methods are checked to be the same.
+"""
+import argparse
+import time
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", default="en")
+    parser.add_argument(
+        "--purpose",
+        choices=[v.value for v in FormatPurpose],
+        default=FormatPurpose.CARDINAL.value,
+    )
+    parser.add_argument("--ruleset", nargs="*", help="Rulesets (default: purpose's)")
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--stop", type=int, default=100_000)
+    parser.add_argument("--step", type=int, default=1)
+    args = parser.parse_args()
+
+    engine = RbnfEngine.for_language(args.language).freeze()
+    purpose = FormatPurpose(args.purpose)
+    numbers = range(args.start, args.stop, args.step)
+
+    total_range_seconds = 0.0
+    total_format_seconds = 0.0
+    for ruleset_name in args.ruleset or engine.get_ruleset_names(purpose):
+        start_time = time.perf_counter()
+        range_texts = [
+            text
+            for _number, text in engine.iter_range(
+                args.start,
+                args.stop,
+                args.step,
+                purpose=purpose,
+                ruleset_names=[ruleset_name],
+            )
+        ]
+        range_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        format_texts = [
+            engine.format_number(number, purpose, ruleset_names=[ruleset_name]).text
+            for number in numbers
+        ]
+        format_seconds = time.perf_counter() - start_time
+
+        assert range_texts == format_texts, ruleset_name
+        total_range_seconds += range_seconds
+        total_format_seconds += format_seconds
+        print(
+            ruleset_name,
+            f"iter_range={range_seconds:.3f}s",
+            f"format_number={format_seconds:.3f}s",
+            f"({format_seconds / range_seconds:.1f}x)",
+            sep="|",
+        )
+
+    print(
+        f"Total: iter_range={total_range_seconds:.3f}s",
+        f"format_number={total_format_seconds:.3f}s",
+        f"({total_format_seconds / total_range_seconds:.1f}x)",
+    )
+
+
+if __name__ == "__main__":
+    main()
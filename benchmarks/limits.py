@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark the cost of per-call formatting limits.
+
+Formats random numbers in every language with no limits, the default limits,
+and the default limits plus a timeout.
+"""
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.engine import FormatLimits, RbnfError
+
+LIMITS: Dict[str, FormatLimits] = {
+    "No limits": FormatLimits(max_depth=None, max_parts=None, timeout=None),
+    "Default limits": FormatLimits(),
+    "Default limits + timeout": FormatLimits(timeout=1.0),
+}
+
+
+def format_all(
+    engines: List[RbnfEngine], numbers: List[int], limits: FormatLimits
+) -> None:
+    """Format numbers for cardinal and ordinal purposes, ignoring failures."""
+    for engine in engines:
+        for purpose in (FormatPurpose.CARDINAL, FormatPurpose.ORDINAL):
+            for number in numbers:
+                try:
+                    engine.format_number(number, purpose, limits=limits)
+                except (RbnfError, ValueError):
+                    pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", nargs="*", help="Languages (default: all)")
+    parser.add_argument("--numbers", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    numbers = [rng.randrange(10 ** rng.randint(1, 12)) for _ in range(args.numbers)]
+    engines = [
+        RbnfEngine.for_language(language).freeze()
+        for language in (args.language or RbnfEngine.get_supported_languages())
+    ]
+
+    # Warm up domain and alias caches
+    format_all(engines, numbers[:1], FormatLimits())
+
+    best_seconds = {name: float("inf") for name in LIMITS}
+    for _ in range(args.repeat):
+        for name, limits in LIMITS.items():
+            start_time = time.perf_counter()
+            format_all(engines, numbers, limits)
+            best_seconds[name] = min(
+                best_seconds[name], time.perf_counter() - start_time
+            )
+
+    base_seconds = best_seconds["No limits"]
+    for name, seconds in best_seconds.items():
+        print(f"{name}: {seconds:.3f}s ({seconds / base_seconds - 1:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
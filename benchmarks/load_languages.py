@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Benchmark loading every language at startup.
+
+Compares loading languages one by one with RbnfEngine.for_language against
+load_languages with worker processes and threads.
+"""
+import argparse
+import os
+import time
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.loading import load_languages
+from unicode_rbnf.multi import ExecutorType
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", nargs="*", help="Languages (default: all)")
+    parser.add_argument(
+        "--max-workers", type=int, help="Number of workers (default: CPU count)"
+    )
+    args = parser.parse_args()
+
+    languages = args.language or RbnfEngine.get_supported_languages()
+    max_workers = args.max_workers or os.cpu_count() or 1
+    print(f"{len(languages)} language(s), {max_workers} worker(s)")
+
+    start_time = time.perf_counter()
+    for language in languages:
+        RbnfEngine.for_language(language)
+    sequential_seconds = time.perf_counter() - start_time
+    print(f"Sequential: {sequential_seconds:.3f}s")
+
+    for executor_type in ExecutorType:
+        start_time = time.perf_counter()
+        load_languages(languages, executor_type=executor_type, max_workers=max_workers)
+        seconds = time.perf_counter() - start_time
+        print(
+            f"{executor_type.value.title()}: {seconds:.3f}s "
+            f"({sequential_seconds / seconds:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Measure memory and load time of locale engines vs. separate engines.
+
+Each locale is loaded with for_locale, which shares parent rulesets, and with
+for_language on the most specific XML file of its fallback chain. The root
+layer (numbering systems shared by every locale engine) is reported apart.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import List
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.locales import (
+    _PARENT_LOCALES,
+    ROOT_LOCALE,
+    _get_layer,
+    clear_locale_cache,
+    for_locale,
+    get_supported_locales,
+    resolve_locale,
+)
+
+
+def get_default_locales() -> List[str]:
+    """Supported locales plus regions whose parent isn't their language."""
+    locales = get_supported_locales()
+    locales.extend(
+        name.replace("_", "-")
+        for name in _PARENT_LOCALES  # pylint: disable=protected-access
+        if name.count("_") == 1
+    )
+    return sorted(set(locales))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--locale",
+        nargs="*",
+        help="BCP 47 locales (default: supported locales and regional variants)",
+    )
+    args = parser.parse_args()
+
+    locales = args.locale or get_default_locales()
+    clear_locale_cache()
+    gc.collect()
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    _get_layer([ROOT_LOCALE])  # pylint: disable=protected-access
+    root_seconds = time.perf_counter() - start_time
+    gc.collect()
+    root_bytes = tracemalloc.get_traced_memory()[0]
+
+    start_time = time.perf_counter()
+    locale_engines = [for_locale(locale) for locale in locales]
+    locale_seconds = time.perf_counter() - start_time
+    gc.collect()
+    locale_bytes = tracemalloc.get_traced_memory()[0] - root_bytes
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    separate_engines = [
+        RbnfEngine.for_language(resolve_locale(locale)[0]).freeze()
+        for locale in locales
+    ]
+    separate_seconds = time.perf_counter() - start_time
+    gc.collect()
+    separate_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    num_unique = len({id(engine) for engine in locale_engines})
+    print(f"{len(locales)} locales, {num_unique} distinct locale engines")
+    print(f"root: {root_bytes / 1024**2:,.1f} MiB, {root_seconds:.3f}s")
+    print(f"for_locale: {locale_bytes / 1024**2:,.1f} MiB, {locale_seconds:.3f}s")
+    print(
+        f"for_language: {separate_bytes / 1024**2:,.1f} MiB,",
+        f"{separate_seconds:.3f}s ({len(separate_engines)} engines)",
+    )
+
+
+if __name__ == "__main__":
+    main()
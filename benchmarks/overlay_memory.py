@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Measure memory of tenant overlays vs. separate engines."""
+import argparse
+import gc
+import tracemalloc
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.overlay import OverlayEngine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--tenants", type=int, default=1000)
+    parser.add_argument(
+        "--engines", type=int, default=20, help="Number of separate engines to load"
+    )
+    parser.add_argument("--ruleset", default="spellout-cardinal")
+    parser.add_argument("--rule-value", default="7")
+    args = parser.parse_args()
+
+    base = RbnfEngine.for_language(args.language).freeze()
+    gc.collect()
+
+    tracemalloc.start()
+    overlays = []
+    for tenant_idx in range(args.tenants):
+        overlay = OverlayEngine(base)
+        overlay.add_rule(args.rule_value, f"tenant{tenant_idx};", args.ruleset)
+        overlays.append(overlay.freeze())
+
+    gc.collect()
+    overlay_bytes = tracemalloc.get_traced_memory()[0] / args.tenants
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    engines = []
+    for tenant_idx in range(args.engines):
+        engine = RbnfEngine.for_language(args.language)
+        engine.add_rule(args.rule_value, f"tenant{tenant_idx};", args.ruleset)
+        engines.append(engine.freeze())
+
+    gc.collect()
+    engine_bytes = tracemalloc.get_traced_memory()[0] / args.engines
+    tracemalloc.stop()
+
+    print(f"Overlay: {overlay_bytes / 1024:,.1f} KiB per tenant")
+    print(f"Engine: {engine_bytes / 1024:,.1f} KiB per tenant")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Benchmark parsing locale-formatted number strings.
+
+Random numbers are formatted with the language's grouping and decimal
+symbols (optionally with native digits), then parsed back with
+RbnfEngine.parse_numbers. Python's Decimal on plain strings is the baseline.
+"""
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.number_input import get_number_symbols
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", default="de")
+    parser.add_argument("--numbers", type=int, default=100_000)
+    parser.add_argument("--digits", help="Ten native digits to use (e.g., ٠١٢٣٤٥٦٧٨٩)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    symbols = get_number_symbols(args.language)
+    group = symbols.group[:1] or "\u00a0"  # no-break space
+    digit_table = str.maketrans("0123456789", args.digits) if args.digits else None
+
+    plain_texts = []
+    texts = []
+    for _ in range(args.numbers):
+        integer = rng.randrange(0, 10**9)
+        fraction = str(rng.randrange(0, 100)) if rng.random() < 0.5 else ""
+        plain_texts.append(f"{integer}.{fraction}" if fraction else str(integer))
+
+        text = f"{integer:,}".replace(",", group)
+        if fraction:
+            text = f"{text}{symbols.decimal[0]}{fraction}"
+
+        texts.append(text.translate(digit_table) if digit_table else text)
+
+    engine = RbnfEngine.for_language(args.language)
+
+    start_time = time.perf_counter()
+    parsed = engine.parse_numbers(texts)
+    parse_seconds = time.perf_counter() - start_time
+    assert [str(p) for p in parsed] == plain_texts
+
+    start_time = time.perf_counter()
+    for text in plain_texts:
+        Decimal(text)
+    decimal_seconds = time.perf_counter() - start_time
+
+    print(f"Examples: {texts[:3]}")
+    print(f"parse_numbers: {parse_seconds * 1e6 / len(texts):.2f}us/number")
+    print(f"Decimal (plain): {decimal_seconds * 1e6 / len(texts):.2f}us/number")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark parsing the rules of every supported language.
+
+Compares RbnfRule.parse with the character-by-character reference parser, and
+reports the total time to load every language.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+from xml.etree import ElementTree as et
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.engine import _LANG_DIR, SKIP_RULESETS, RbnfRule
+
+# Reference parser is only kept with the tests
+sys.path.insert(0, str(Path(__file__).parent.parent / "tests"))
+# pylint: disable=wrong-import-position,wrong-import-order,import-error
+from reference_parser import parse_reference  # noqa: E402
+
+
+def load_rules() -> List[Tuple[str, str]]:
+    """Load (value, text) of every rule in the built-in XML files."""
+    rules: List[Tuple[str, str]] = []
+    for language in RbnfEngine.get_supported_languages():
+        root = et.parse(_LANG_DIR / f"{language}.xml").getroot()
+        for group_elem in root.findall("rbnf//ruleset"):
+            if group_elem.attrib["type"] in SKIP_RULESETS:
+                continue
+
+            for rule_elem in group_elem.findall("rbnfrule"):
+                if rule_elem.text:
+                    rules.append((rule_elem.attrib["value"], rule_elem.text))
+
+    return rules
+
+
+def time_parse(
+    parse: Callable[[str, str], Optional[RbnfRule]],
+    rules: List[Tuple[str, str]],
+    repeat: int,
+) -> float:
+    """Get best time to parse all rules."""
+    best_seconds = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        for value_str, text in rules:
+            parse(value_str, text)
+
+        best_seconds = min(best_seconds, time.perf_counter() - start_time)
+
+    return best_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rules = load_rules()
+    num_chars = sum(len(text) for _value_str, text in rules)
+    print(f"{len(rules):,} rules, {num_chars:,} characters")
+
+    reference_seconds = time_parse(parse_reference, rules, args.repeat)
+    parse_seconds = time_parse(RbnfRule.parse, rules, args.repeat)
+    print(f"Reference: {reference_seconds:.3f}s")
+    print(f"Parse: {parse_seconds:.3f}s ({reference_seconds / parse_seconds:.1f}x)")
+
+    start_time = time.perf_counter()
+    for language in RbnfEngine.get_supported_languages():
+        RbnfEngine.for_language(language)
+    print(f"Load all languages: {time.perf_counter() - start_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
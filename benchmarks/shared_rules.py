@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmark sharing identical rules between engines.
+
+Loads every language with and without shared rules, and reports the memory
+allocated for the engines (tracemalloc) and the time to load them.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Dict, Optional, Tuple
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf import engine as engine_module
+from unicode_rbnf.engine import RbnfRule
+
+
+class UnsharedRules:
+    """Parses every rule into new objects."""
+
+    def parse(self, value_str: str, text: str, radix: int = 10) -> Optional[RbnfRule]:
+        return RbnfRule.parse(value_str, text, radix=radix)
+
+
+def load_all(share: bool) -> Tuple[Dict[str, RbnfEngine], float]:
+    """Load every language with an empty rule table."""
+    # pylint: disable=protected-access
+    engine_module._SHARED_RULES = (
+        engine_module._SharedRules() if share else UnsharedRules()  # type: ignore
+    )
+
+    start_time = time.perf_counter()
+    engines = {
+        language: RbnfEngine.for_language(language)
+        for language in RbnfEngine.get_supported_languages()
+    }
+    return engines, time.perf_counter() - start_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for share in (False, True):
+        best_seconds = min(load_all(share)[1] for _ in range(args.repeat))
+
+        gc.collect()
+        tracemalloc.start()
+        engines, _seconds = load_all(share)
+        gc.collect()
+        num_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        label = "Shared" if share else "Not shared"
+        print(
+            f"{label}: {len(engines)} languages, "
+            f"{num_bytes / 1024 / 1024:.1f} MiB, {best_seconds:.3f}s"
+        )
+        del engines
+
+
+if __name__ == "__main__":
+    main()
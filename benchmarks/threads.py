@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark formatting with one frozen engine shared between threads.
+
+On free-threaded CPython (3.13t), throughput should scale close to linearly
+with the number of threads. On regular CPython, the GIL serializes threads.
+"""
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from unicode_rbnf import RbnfEngine
+
+
+def format_all(engine: RbnfEngine, numbers: List[int]) -> int:
+    """Format numbers and return number of characters produced."""
+    num_chars = 0
+    for number in numbers:
+        num_chars += len(engine.format_number(number).text)
+
+    return num_chars
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", default="en")
+    parser.add_argument(
+        "--numbers", type=int, default=20000, help="Numbers formatted per thread"
+    )
+    parser.add_argument("--max-threads", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    numbers = [rng.randrange(0, 10**9) for _ in range(args.numbers)]
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {is_gil_enabled}")
+
+    # Single thread: unfrozen vs. frozen
+    engine = RbnfEngine.for_language(args.language)
+    format_all(engine, numbers[:100])  # warm up lazy state
+    start_time = time.perf_counter()
+    format_all(engine, numbers)
+    unfrozen_seconds = time.perf_counter() - start_time
+
+    engine.freeze()
+    start_time = time.perf_counter()
+    format_all(engine, numbers)
+    frozen_seconds = time.perf_counter() - start_time
+    print(
+        f"1 thread: unfrozen={args.numbers / unfrozen_seconds:,.0f}/s,",
+        f"frozen={args.numbers / frozen_seconds:,.0f}/s",
+    )
+
+    # Multiple threads sharing the frozen engine
+    num_threads = 1
+    while num_threads <= args.max_threads:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            start_time = time.perf_counter()
+            list(
+                executor.map(
+                    format_all, [engine] * num_threads, [numbers] * num_threads
+                )
+            )
+            seconds = time.perf_counter() - start_time
+
+        total_numbers = args.numbers * num_threads
+        print(
+            f"{num_threads} thread(s): {total_numbers / seconds:,.0f}/s,",
+            f"speedup={frozen_seconds * num_threads / seconds:.2f}x",
+        )
+        num_threads *= 2
+
+
+if __name__ == "__main__":
+    main()
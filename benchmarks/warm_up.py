@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark first-request latency with and without warm-up.
+
+A skewed (Zipf-like) stream of numbers is recorded on one engine. Fresh
+engines then format the same stream, either cold or after warm_up, and the
+latency percentiles of each call are compared. The cost of leaving the
+recorder on is measured too.
+"""
+import argparse
+import random
+import time
+from typing import List, Optional
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.engine import get_number_key
+from unicode_rbnf.warmup import UsageRecorder, warm_up
+
+
+def get_latencies(
+    engine: RbnfEngine, numbers: List[int], recorder: Optional[UsageRecorder] = None
+) -> List[float]:
+    """Format numbers one by one and return sorted latencies in microseconds."""
+    engine.recorder = recorder
+    latencies: List[float] = []
+    for number in numbers:
+        start_time = time.perf_counter()
+        engine.format_number(number)
+        latencies.append((time.perf_counter() - start_time) * 1e6)
+
+    engine.recorder = None
+    return sorted(latencies)
+
+
+def format_percentiles(latencies: List[float]) -> str:
+    """Format p50/p99/max of sorted latencies."""
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, (len(latencies) * 99) // 100)]
+    return f"p50={p50:.1f}us p99={p99:.1f}us max={latencies[-1]:.1f}us"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--numbers", type=int, default=20000)
+    parser.add_argument("--distinct", type=int, default=5000)
+    parser.add_argument("--time-budget", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    values = [rng.randrange(0, 10**7) for _ in range(args.distinct)]
+    weights = [1 / (rank + 1) for rank in range(args.distinct)]
+    numbers = rng.choices(values, weights=weights, k=args.numbers)
+
+    # Record a "previous deployment"
+    recorder = UsageRecorder()
+    recording_engine = RbnfEngine.for_language(args.language).freeze()
+    get_latencies(recording_engine, numbers, recorder)
+    print(f"Recorder: {len(recorder)} entries, {recorder.total} calls")
+
+    # Same work as format_number does per call when recording
+    overhead_recorder = UsageRecorder()
+    start_time = time.perf_counter()
+    for number in numbers:
+        overhead_recorder.record(FormatPurpose.CARDINAL, get_number_key(number))
+    overhead_seconds = time.perf_counter() - start_time
+    print(f"Recorder overhead: {overhead_seconds * 1e6 / len(numbers):.2f}us/call")
+
+    cold_engine = RbnfEngine.for_language(args.language).freeze()
+    print("Cold:  ", format_percentiles(get_latencies(cold_engine, numbers)))
+
+    warm_engine = RbnfEngine.for_language(args.language).freeze()
+    result = warm_up(warm_engine, recorder, time_budget_seconds=args.time_budget)
+    print(
+        f"Warm-up: {result.num_rendered} results in {result.seconds:.3f}s,",
+        f"coverage={result.coverage:.1%}",
+    )
+    print("Warm:  ", format_percentiles(get_latencies(warm_engine, numbers)))
+
+
+if __name__ == "__main__":
+    main()
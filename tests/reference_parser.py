@@ -0,0 +1,215 @@
+"""Reference parser that RbnfRule.parse is checked against.
+
+Used by tests/test_parse.py and benchmarks/parse_rules.py.
+"""
+
+# pylint: disable=protected-access
+
+from typing import Optional
+
+from unicode_rbnf.engine import (
+    ParseState,
+    PluralFormatPart,
+    RbnfRule,
+    RbnfRulePart,
+    ReplaceRulePart,
+    SubRulePart,
+    SubType,
+    TextRulePart,
+)
+
+
+def parse_reference(value_str: str, text: str, radix: int = 10) -> Optional[RbnfRule]:
+    """Parse RBNF rule for a value one character at a time.
+
+    This is the original parser. It's slower than RbnfRule.parse, which must
+    produce identical rules.
+    """
+    rule = RbnfRule._create(value_str, text, radix)
+    if rule is None:
+        return None
+
+    state = ParseState.TEXT
+    part: Optional[RbnfRulePart] = None
+    is_sub_optional = False
+    sub_text_before = ""
+    skip_next_char = False
+
+    for x, c in enumerate(text):
+        if skip_next_char:
+            skip_next_char = False
+            continue
+
+        if c == ";":
+            # End of rule text
+            break
+
+        if c == "'":
+            # Placeholder
+            continue
+
+        next_c: Optional[str] = None
+        if (x + 1) < len(text):
+            next_c = text[x + 1]
+
+        if c in (">", "→"):
+            # Divide the number by the rule's divisor and format the remainder
+            if state in {ParseState.TEXT, ParseState.SUB_OPTIONAL_BEFORE}:
+                state = ParseState.SUB_REMAINDER
+
+                if rule.parts and isinstance(rule.parts[-1], TextRulePart):
+                    # Shift whitespace before arrow here.
+                    # This is so it separates words in fractional mode.
+                    prev_text_part: TextRulePart = rule.parts[-1]
+                    prev_text_stripped = prev_text_part.text.rstrip()
+                    prev_whitespace = prev_text_part.text[len(prev_text_stripped) :]
+                    prev_text_part.text = prev_text_stripped
+                    sub_text_before += prev_whitespace
+
+                part = SubRulePart(
+                    SubType.REMAINDER,
+                    is_optional=is_sub_optional,
+                    text_before=sub_text_before,
+                )
+                rule.parts.append(part)
+                sub_text_before = ""
+
+            elif state in {ParseState.SUB_REMAINDER, ParseState.SUB_RULESET_NAME}:
+                if next_c in (">", "→"):
+                    # Ignore final arrow in triple arrow.
+                    # It means to render digit-by-digit, which we already do
+                    # in "fractional" mode.
+                    skip_next_char = True
+
+                if is_sub_optional:
+                    state = ParseState.SUB_OPTIONAL_AFTER
+                else:
+                    state = ParseState.TEXT
+                    part = None
+            else:
+                raise ValueError(f"Got {c} in {state}")
+        elif c in ("<", "←"):
+            # Divide the number by the rule's divisor and format the quotient
+            if state in {ParseState.TEXT, ParseState.SUB_OPTIONAL_BEFORE}:
+                state = ParseState.SUB_QUOTIENT
+                part = SubRulePart(SubType.QUOTIENT, is_optional=is_sub_optional)
+                rule.parts.append(part)
+            elif state in {ParseState.SUB_QUOTIENT, ParseState.SUB_RULESET_NAME}:
+                if (state == ParseState.SUB_RULESET_NAME) and (next_c in ("<", "←")):
+                    # Final arrow in <%ruleset<< reads leading zeros of a
+                    # fraction's numerator.
+                    assert isinstance(part, SubRulePart)
+                    part.with_zeros = True
+                    skip_next_char = True
+
+                if is_sub_optional:
+                    state = ParseState.SUB_OPTIONAL_AFTER
+                else:
+                    state = ParseState.TEXT
+                    part = None
+            else:
+                raise ValueError(f"Got {c} in {state}")
+        elif c == "%":
+            # =%rule_name= replacement
+            if state in {ParseState.SUB_QUOTIENT, ParseState.SUB_REMAINDER}:
+                assert isinstance(part, SubRulePart)
+                state = ParseState.SUB_RULESET_NAME
+                part.ruleset_name = ""
+            elif state in {
+                ParseState.REPLACE_RULESET_NAME,
+                ParseState.SUB_RULESET_NAME,
+            }:
+                pass
+            else:
+                raise ValueError(f"Got {c} in {state}")
+        elif c == "$":
+            # $(cardinal,plural syntax)$, $(ordinal,plural syntax)$
+            if text[x + 1] == "(":
+                _previous_state = state
+                _previous_part = part
+                state = ParseState.SUB_PLURAL_FORMAT
+                part = PluralFormatPart()
+                part.function_value = value_str
+                part.is_optional = _previous_state == ParseState.SUB_OPTIONAL_AFTER
+                part.previous_state = _previous_state
+                part.previous_part = _previous_part
+            elif state == ParseState.SUB_PLURAL_FORMAT and text[x - 1] == ")":
+                assert isinstance(part, PluralFormatPart)
+                assert part.previous_state is not None
+                rule.parts.append(part)
+                state = part.previous_state
+                if not part.is_optional:
+                    # Text after plural in an optional section stays in it
+                    part = part.previous_part
+            else:
+                raise ValueError(f"Got {c} in {state} fot text: {text} (x: {x})")
+        elif c == "[":
+            # [optional] (start)
+            if state == ParseState.TEXT:
+                is_sub_optional = True
+                state = ParseState.SUB_OPTIONAL_BEFORE
+                sub_text_before = ""
+            else:
+                raise ValueError(f"Got {c} in {state}")
+        elif c == "]":
+            # [optional] (end)
+            if state == ParseState.SUB_OPTIONAL_AFTER:
+                is_sub_optional = False
+                state = ParseState.TEXT
+                part = None
+            else:
+                raise ValueError(f"Got {c} in {state}")
+        elif c == "=":
+            # =%rule_name= replacement
+            if state == ParseState.TEXT:
+                part = ReplaceRulePart("")
+                rule.parts.append(part)
+                state = ParseState.REPLACE_RULESET_NAME
+            elif state == ParseState.REPLACE_RULESET_NAME:
+                part = None
+                state = ParseState.TEXT
+            else:
+                raise ValueError(f"Got {c} in {state}")
+        elif state == ParseState.SUB_OPTIONAL_BEFORE:
+            # [before ...]
+            sub_text_before += c
+        elif state == ParseState.SUB_OPTIONAL_AFTER:
+            # [... after]
+            assert isinstance(part, (SubRulePart, PluralFormatPart))
+            part.text_after += c
+        elif state == ParseState.SUB_PLURAL_FORMAT:
+            assert isinstance(part, PluralFormatPart)
+            if c not in ["(", ")"]:
+                part.function_name += c
+        elif state == ParseState.SUB_RULESET_NAME:
+            # %ruleset_name in << or >>
+            assert isinstance(part, SubRulePart)
+            assert part.ruleset_name is not None
+            part.ruleset_name += c
+        elif state == ParseState.REPLACE_RULESET_NAME:
+            # =%ruleset_name=
+            assert isinstance(part, ReplaceRulePart)
+            part.ruleset_name += c
+        elif state == ParseState.TEXT:
+            # literal text
+            if part is None:
+                part = TextRulePart("")
+                rule.parts.append(part)
+
+            assert isinstance(part, TextRulePart)
+            part.text += c
+        elif c in ("#", "0", ",", "."):
+            # decimal format pattern (e.g., #,##0.00)
+            assert isinstance(part, SubRulePart)
+            assert state in (
+                ParseState.SUB_REMAINDER,
+                ParseState.SUB_QUOTIENT,
+            ), state
+            if part.format_pattern is None:
+                part.format_pattern = ""
+
+            part.format_pattern += c
+        else:
+            raise ValueError(f"Got {c} in {state}")
+
+    return rule
@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.engine import RbnfError, _RulesetAliases
+
+
+def test_english_aliases():
+    engine = RbnfEngine.for_language("en")
+
+    # spellout-numbering has its own fraction rule
+    assert not engine.get_ruleset_aliases()
+    assert engine.get_ruleset_aliases(integers=True) == {
+        "spellout-numbering": "spellout-cardinal",
+        "spellout-numbering-verbose": "spellout-cardinal-verbose",
+    }
+
+    result = engine.format_number(21)
+    assert result.text_by_ruleset == {
+        "spellout-numbering": "twenty-one",
+        "spellout-cardinal": "twenty-one",
+    }
+
+
+def test_identical_rules():
+    engine = RbnfEngine.for_language("sv")
+    assert engine.get_ruleset_aliases()["spellout-cardinal-feminine"] == (
+        "spellout-cardinal-masculine"
+    )
+
+
+def test_aliases_updated():
+    engine = RbnfEngine.for_language("en")
+    engine.add_rule("1", "uno;", "spellout-numbering")
+    assert "spellout-numbering" not in engine.get_ruleset_aliases(integers=True)
+    assert engine.format_number(1).text_by_ruleset == {
+        "spellout-numbering": "uno",
+        "spellout-cardinal": "one",
+    }
+
+
+def test_same_as_without_aliases():
+    numbers = [0, 1, 21, 1234, 10**7 + 3, 10**21, -21, Decimal("3.25")]
+    for language in ("de", "ru", "sv", "pl", "fr"):
+        engine = RbnfEngine.for_language(language)
+        no_alias_engine = RbnfEngine.for_language(language)
+        # pylint: disable=protected-access
+        no_alias_engine._aliases = _RulesetAliases()
+
+        for purpose in FormatPurpose:
+            for number in numbers:
+                try:
+                    expected = no_alias_engine.format_number(number, purpose)
+                except (RbnfError, ArithmeticError, ValueError):
+                    continue
+
+                assert engine.format_number(number, purpose) == expected
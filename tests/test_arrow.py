@@ -0,0 +1,93 @@
+from decimal import Decimal
+
+import pytest
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+
+pa = pytest.importorskip("pyarrow")
+pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from unicode_rbnf.arrow import format_arrow, format_pandas, format_polars  # noqa: E402
+
+
+@pytest.mark.parametrize("language", ["en", "de", "ru"])
+def test_same_as_format_number(language: str):
+    engine = RbnfEngine.for_language(language)
+    numbers = list(range(-20, 150)) + [1234, 10**6 + 7, 10**15, 1234]
+    texts = format_arrow(engine, pa.array(numbers), chunk_size=100)
+
+    assert texts.type == pa.string()
+    assert texts.num_chunks == 2
+    assert texts.to_pylist() == [
+        engine.format_number(number).text for number in numbers
+    ]
+
+
+def test_nulls():
+    engine = RbnfEngine.for_language("en")
+    texts = format_arrow(
+        engine, pa.chunked_array([[1, None, 1], [None, 2]], type=pa.int32())
+    )
+    assert texts.to_pylist() == ["one", None, "one", None, "two"]
+
+
+def test_decimals_and_strings():
+    engine = RbnfEngine.for_language("en")
+    decimals = pa.array([Decimal("1.50"), None, Decimal("-2")], pa.decimal128(5, 2))
+    assert format_arrow(engine, decimals).to_pylist() == [
+        engine.format_number(Decimal("1.50")).text,
+        None,
+        engine.format_number(Decimal("-2.00")).text,
+    ]
+
+    strings = pa.array(["21", "3.25", None])
+    assert format_arrow(engine, strings).to_pylist() == [
+        "twenty-one",
+        "three point two five",
+        None,
+    ]
+
+
+def test_purpose_and_ruleset():
+    engine = RbnfEngine.for_language("en")
+    numbers = pa.array([1, 2, 3])
+    assert format_arrow(engine, numbers, FormatPurpose.ORDINAL).to_pylist() == [
+        "first",
+        "second",
+        "third",
+    ]
+    assert format_arrow(
+        engine, numbers, ruleset_name="spellout-numbering-year"
+    ).to_pylist() == ["one", "two", "three"]
+
+
+def test_unsupported_type():
+    with pytest.raises(TypeError):
+        format_arrow(RbnfEngine.for_language("en"), pa.array([True]))
+
+
+def test_pandas():
+    pd = pytest.importorskip("pandas")
+    engine = RbnfEngine.for_language("en")
+    numbers = pd.Series([1, 2, None], dtype="int64[pyarrow]", index=[5, 6, 7])
+    texts = format_pandas(engine, numbers.rename("n"))
+
+    assert texts.name == "n"
+    assert texts.index.tolist() == [5, 6, 7]
+    assert texts.tolist()[:2] == ["one", "two"]
+    assert pd.isna(texts.iloc[2])
+
+    # NumPy-backed
+    assert format_pandas(engine, pd.Series([3])).tolist() == ["three"]
+
+
+def test_polars():
+    pl = pytest.importorskip("polars")
+    engine = RbnfEngine.for_language("en")
+    df = pl.DataFrame({"n": [1, 2, None]}).with_columns(
+        text=pl.col("n").map_batches(
+            lambda numbers: format_polars(engine, numbers), return_dtype=pl.String
+        )
+    )
+    assert df["text"].to_list() == ["one", "two", None]
@@ -0,0 +1,74 @@
+import pytest
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.engine import NoRuleForNumberError
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from unicode_rbnf.batch import format_array  # noqa: E402
+
+
+@pytest.mark.parametrize("language", ["en", "de", "fr", "ko", "ru"])
+def test_same_as_format_number(language: str):
+    engine = RbnfEngine.for_language(language)
+    rng = np.random.default_rng(0)
+    numbers = np.concatenate(
+        [
+            np.arange(-20, 150),
+            rng.integers(-(10**6), 10**9, 500),
+            [10**12, 10**15 + 7],
+        ]
+    )
+
+    for purpose in (FormatPurpose.CARDINAL, FormatPurpose.ORDINAL):
+        numbers_ok, expected = _format_each(engine, numbers, purpose=purpose)
+        assert format_array(engine, numbers_ok, purpose).tolist() == expected
+
+    for ruleset_name in engine.get_ruleset_names(FormatPurpose.CARDINAL):
+        numbers_ok, expected = _format_each(
+            engine, numbers[:200], ruleset_names=[ruleset_name]
+        )
+        assert (
+            format_array(engine, numbers_ok, ruleset_name=ruleset_name).tolist()
+            == expected
+        )
+
+
+def test_shape_and_dtypes():
+    engine = RbnfEngine.for_language("en")
+
+    texts = format_array(engine, np.array([[1, 2], [3, 4]], dtype=np.uint8))
+    assert texts.shape == (2, 2)
+    assert texts.tolist() == [["one", "two"], ["three", "four"]]
+
+    # Fractions and special values are formatted one by one
+    assert format_array(engine, [2.0, 1.5, float("nan"), -3.0]).tolist() == [
+        "two",
+        "one point five",
+        "not a number",
+        "minus three",
+    ]
+
+    assert format_array(engine, np.array([], dtype=np.int64)).tolist() == []
+
+
+def test_no_rule():
+    engine = RbnfEngine.for_language("en")
+
+    with pytest.raises(NoRuleForNumberError):
+        format_array(engine, [1, 10**18], ruleset_name="spellout-cardinal")
+
+
+def _format_each(engine: RbnfEngine, numbers, **kwargs):
+    """Format numbers one by one, keeping only those that succeed."""
+    numbers_ok = []
+    expected = []
+    for number in numbers:
+        try:
+            expected.append(engine.format_number(int(number), **kwargs).text)
+            numbers_ok.append(number)
+        except NoRuleForNumberError:
+            pass
+
+    return np.array(numbers_ok, dtype=np.int64), expected
@@ -0,0 +1,133 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf import compiled as compiled_module
+from unicode_rbnf import engine as engine_module
+from unicode_rbnf.compiled import (
+    MappedEngine,
+    compile_engine,
+    get_cache_key,
+    preload,
+    save_compiled,
+)
+from unicode_rbnf.engine import EngineFrozenError
+
+NUMBERS = [0, 7, 15, 42, 143, 1999, 83145, 1000000, -3, 3.14, float("nan")]
+
+
+@pytest.mark.parametrize("language", ["en", "de", "ru", "ko"])
+def test_mapped_engine(language: str):
+    engine = RbnfEngine.for_language(language)
+    mapped_engine = MappedEngine(compile_engine(engine))
+    assert mapped_engine.language == language
+    assert mapped_engine.is_frozen
+    assert set(mapped_engine.rulesets) == set(engine.rulesets)
+
+    for purpose in (FormatPurpose.CARDINAL, FormatPurpose.ORDINAL):
+        for number in NUMBERS:
+            try:
+                expected = engine.format_number(number, purpose)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                with pytest.raises(type(err)):
+                    mapped_engine.format_number(number, purpose)
+                continue
+
+            assert mapped_engine.format_number(number, purpose) == expected
+
+
+def test_open_file(tmp_path: Path):
+    compiled_path = tmp_path / "en.rbnf"
+    save_compiled(RbnfEngine.for_language("en"), compiled_path)
+
+    mapped_engine = MappedEngine.open(compiled_path)
+    assert mapped_engine.format_number(1234).text == (
+        "one thousand two hundred thirty-four"
+    )
+
+    with pytest.raises(EngineFrozenError):
+        mapped_engine.add_rule("1", "one;", "spellout-numbering")
+
+    # Regular engine can be modified again
+    engine = mapped_engine.to_engine()
+    engine.add_rule("1", "uno;", "spellout-numbering")
+    assert engine.format_number(1).text == "uno"
+
+
+def test_bad_buffer():
+    with pytest.raises(ValueError):
+        MappedEngine(b"\0" * 64)
+
+
+def test_preload(tmp_path: Path):
+    try:
+        engines = preload(["en", "fr"], tmp_path)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    assert (tmp_path / f"en.{get_cache_key('en')}.rbnf").is_file()
+    assert engines["fr"].format_number(2).text == "deux"
+
+    # Reuses compiled files
+    engines = preload(["en"], tmp_path, freeze_gc=False)
+    assert engines["en"].format_number(2).text == "two"
+
+
+def test_preload_rebuilds(tmp_path: Path, monkeypatch):
+    # pylint: disable=protected-access
+    lang_dir = tmp_path / "rbnf"
+    lang_dir.mkdir()
+    xml_path = lang_dir / "en.xml"
+    xml_path.write_bytes((engine_module._LANG_DIR / "en.xml").read_bytes())
+    monkeypatch.setattr(engine_module, "_LANG_DIR", lang_dir)
+    monkeypatch.setattr(compiled_module, "_LANG_DIR", lang_dir)
+
+    cache_dir = tmp_path / "cache"
+    engines = preload(["en"], cache_dir, freeze_gc=False)
+    assert engines["en"].format_number(2).text == "two"
+
+    # Changed rules get a new key, and the old file is removed
+    old_key = get_cache_key("en")
+    xml_path.write_text(
+        xml_path.read_text(encoding="utf-8").replace(">two;<", ">deux;<"),
+        encoding="utf-8",
+    )
+    assert get_cache_key("en") != old_key
+
+    engines = preload(["en"], cache_dir, freeze_gc=False)
+    assert engines["en"].format_number(2).text == "deux"
+    assert [p.name for p in cache_dir.glob("en.*.rbnf")] == [
+        f"en.{get_cache_key('en')}.rbnf"
+    ]
+
+    # Package upgrade
+    key = get_cache_key("en")
+    monkeypatch.setattr(compiled_module, "__version__", "0.0.0")
+    assert get_cache_key("en") != key
+
+
+def test_preload_concurrent(tmp_path: Path):
+    # Each build writes its own temporary file before renaming
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda _: preload(["en"], tmp_path, freeze_gc=False), range(8))
+        )
+
+    assert all(engines["en"].format_number(2).text == "two" for engines in results)
+    assert [p.name for p in tmp_path.iterdir()] == [f"en.{get_cache_key('en')}.rbnf"]
+
+
+def test_preload_failed_write(tmp_path: Path, monkeypatch):
+    def fail_replace(src, dst):
+        raise OSError("rename failed")
+
+    monkeypatch.setattr(compiled_module.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        preload(["en"], tmp_path, freeze_gc=False)
+
+    # No temporary file is left behind
+    assert not list(tmp_path.iterdir())
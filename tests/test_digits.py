@@ -0,0 +1,103 @@
+import random
+
+import pytest
+
+from unicode_rbnf import FormatOptions, FormatPurpose, RbnfEngine
+from unicode_rbnf.engine import NoRuleForNumberError, RulesetNotFoundError
+
+
+@pytest.mark.parametrize(
+    "digits,kwargs,expected",
+    [
+        ("42", {}, "four two"),
+        ("0151", {}, "zero one five one"),
+        ("12345", {"group_size": 2}, "twelve thirty-four five"),
+        ("0500", {"group_size": 2}, "zero five zero zero"),
+        ("007123", {"group_size": 3}, "zero zero seven one hundred twenty-three"),
+        ("555-0123", {"group_size": 2}, "fifty-five five zero one twenty-three"),
+        ("(555) 01.23", {"run_separator": ", "}, "five five five, zero one, two three"),
+        ("1234", {"separator": "-"}, "one-two-three-four"),
+        (" 9 ", {}, "nine"),
+    ],
+)
+def test_format_digits(digits: str, kwargs, expected: str):
+    engine = RbnfEngine.for_language("en")
+    assert engine.format_digits(digits, **kwargs) == expected
+
+
+@pytest.mark.parametrize("language", ["en", "de", "ru", "ja", "fr"])
+def test_same_as_format_number(language: str):
+    engine = RbnfEngine.for_language(language).freeze()
+    rng = random.Random(0)
+    for group_size in (1, 2, 3, 4):
+        for _ in range(50):
+            digits = "".join(rng.choice("0123456789") for _ in range(20))
+            expected = []
+            for group_idx in range(0, len(digits), group_size):
+                group = digits[group_idx : group_idx + group_size]
+                no_zeros = group.lstrip("0")
+                expected.extend(
+                    [engine.format_number(0).text] * (len(group) - len(no_zeros))
+                )
+                if no_zeros:
+                    expected.append(engine.format_number(int(no_zeros)).text)
+
+            assert engine.format_digits(digits, group_size=group_size) == " ".join(
+                expected
+            ), (digits, group_size)
+
+
+def test_ruleset_and_purpose():
+    engine = RbnfEngine.for_language("en")
+    assert engine.format_digits("21", purpose=FormatPurpose.ORDINAL) == "second first"
+    assert (
+        engine.format_digits("21", ruleset_name="spellout-numbering-year", group_size=2)
+        == "twenty-one"
+    )
+
+    with pytest.raises(RulesetNotFoundError):
+        engine.format_digits("1", ruleset_name="no-such-ruleset")
+
+
+def test_scripts_and_soft_hyphens():
+    assert RbnfEngine.for_language("ar").format_digits("١٢") == "واحد إثنان"
+
+    engine = RbnfEngine.for_language("de")
+    assert engine.format_digits("21", group_size=2) == "einundzwanzig"
+    assert (
+        engine.format_digits(
+            "21", group_size=2, options=FormatOptions.PRESERVE_SOFT_HYPENS
+        )
+        == "ein\xadund\xadzwanzig"
+    )
+
+
+def test_tables_are_updated():
+    engine = RbnfEngine.for_language("en")
+    assert engine.format_digits("7", ruleset_name="spellout-numbering") == "seven"
+
+    engine.add_rule("7", "lucky seven;", "spellout-numbering")
+    assert engine.format_digits("7", ruleset_name="spellout-numbering") == (
+        "lucky seven"
+    )
+
+
+@pytest.mark.parametrize("digits", ["", "-", "12a", "+1 555", "1,5"])
+def test_not_digits(digits: str):
+    engine = RbnfEngine.for_language("en")
+    with pytest.raises(ValueError):
+        engine.format_digits(digits)
+
+
+def test_errors():
+    engine = RbnfEngine.for_language("en")
+    with pytest.raises(ValueError):
+        engine.format_digits("1", group_size=0)
+
+    # Ruleset that can't format 0
+    engine = RbnfEngine("xx")
+    engine.add_rule("0", "=%missing=;", "spellout-numbering")
+    engine.add_rule("1", "one;", "spellout-numbering")
+    assert engine.format_digits("11") == "one one"
+    with pytest.raises(NoRuleForNumberError):
+        engine.format_digits("10")
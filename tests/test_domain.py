@@ -0,0 +1,64 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.engine import NoRuleForNumberError, RbnfError, RulesetNotFoundError
+
+
+def test_english_domain():
+    engine = RbnfEngine.for_language("en")
+
+    domain = engine.get_domain("spellout-cardinal")
+    assert domain.min_value is None
+    assert domain.max_value == (10**18) - 1
+    assert domain.has_negative
+    assert domain.has_improper_fraction
+    assert domain.contains(-5)
+    assert domain.contains(Decimal("1.5"))
+    assert domain.contains((10**18) - 1)
+    assert not domain.contains(10**18)
+
+    # Follows =%spellout-cardinal=
+    assert engine.get_domain("spellout-numbering").max_value == (10**18) - 1
+
+    # Only =#,##0=
+    domain = engine.get_domain("digits-ordinal")
+    assert domain.max_value == -1
+    assert not domain.contains(0)
+
+    with pytest.raises(RulesetNotFoundError):
+        engine.get_domain("does-not-exist")
+
+    with pytest.raises(NoRuleForNumberError):
+        engine.format_number(10**18)
+
+
+def test_domain_updated():
+    engine = RbnfEngine.for_language("en")
+    assert engine.get_domain("spellout-cardinal").max_value == (10**18) - 1
+
+    engine.add_rule("1000000000000000000", "a lot;", "spellout-cardinal")
+    assert engine.get_domain("spellout-cardinal").max_value is None
+    assert engine.format_number(10**18).text == "a lot"
+
+
+def test_outside_domain_fails():
+    """Numbers outside of a ruleset's domain must fail when rendered."""
+    rng = random.Random(0)
+    for language in ("en", "de", "ru", "zu", "ja"):
+        engine = RbnfEngine.for_language(language)
+        for ruleset_name in engine.rulesets:
+            domain = engine.get_domain(ruleset_name)
+            numbers = [-1, 0, 1, Decimal("0.5"), Decimal("1.5")]
+            numbers.extend(rng.randrange(10**digits) for digits in range(1, 22))
+            if domain.max_value is not None:
+                numbers.extend([domain.max_value + 1, (domain.max_value + 1) * 7])
+
+            for number in numbers:
+                if domain.contains(number):
+                    continue
+
+                with pytest.raises(RbnfError):
+                    "".join(engine.iter_format_number(number, ruleset_name))
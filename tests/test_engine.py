@@ -1,9 +1,17 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from decimal import ROUND_DOWN, Decimal
+
 import pytest
 
+from unicode_rbnf import FormatPurpose
 from unicode_rbnf.engine import (
+    BigNumberMode,
+    EngineFrozenError,
     FormatResult,
     NoRuleForNumberError,
     RbnfEngine,
+    RbnfError,
     RbnfRule,
     SubRulePart,
     SubType,
@@ -100,3 +108,163 @@ def test_parse_remainder_whitespace():
             SubRulePart(SubType.REMAINDER, text_before=" "),
         ],
     )
+
+
+def test_exact_fractions():
+    engine = RbnfEngine.for_language("en")
+
+    # No exponent or float repr artifacts
+    assert engine.format_number(1e-7).text == (
+        "zero point zero zero zero zero zero zero one"
+    )
+    assert (
+        engine.format_number(0.1 + 0.2, max_fraction_digits=2).text
+        == "zero point three zero"
+    )
+    assert (
+        engine.format_number(Decimal("2.675"), max_fraction_digits=2).text
+        == "two point six eight"
+    )
+    assert (
+        engine.format_number("2.675", max_fraction_digits=2, rounding=ROUND_DOWN).text
+        == "two point six seven"
+    )
+    assert engine.format_number("2.999", max_fraction_digits=1).text == "three"
+    assert engine.format_number(-1.5).text == "minus one point five"
+
+
+def test_proper_fraction_rule():
+    engine = RbnfEngine("en")
+    engine.add_rule("0.x", "half;", "spellout-numbering")
+    engine.add_rule("x.x", "←← and a half;", "spellout-numbering")
+    engine.add_rule("1", "one;", "spellout-numbering")
+
+    assert engine.format_number(0.5).text == "half"
+    assert engine.format_number(1.5).text == "one and a half"
+
+
+@pytest.mark.parametrize(
+    "language,number,expected",
+    [
+        ("ru", 0.5, "пять десятых"),
+        ("ru", 1.5, "одна целая пять десятых"),
+        ("ru", 3.75, "три целых семьдесят пять сотых"),
+        ("ru", -3.75, "минус три целых семьдесят пять сотых"),
+        ("ru", "3.05", "три целых пять сотых"),
+        ("ru", 21.1, "двадцать одна целая одна десятая"),
+        ("ru", 1e-7, "одна десятимиллионная"),
+        ("kk", 0.001, "нөл бүтін мыңнан бір"),
+        ("pl", 3.05, "trzy przecinek zero pięć"),
+    ],
+)
+def test_fraction_rulesets(language: str, number, expected: str):
+    # Same as ICU: fractional digits are a numerator over 10, 100, etc.
+    engine = RbnfEngine.for_language(language)
+    assert engine.format_number(number).text == expected
+
+
+def test_fraction_ruleset_cases():
+    engine = RbnfEngine.for_language("ru")
+    assert (
+        engine.format_number(
+            3.75, ruleset_names=["spellout-cardinal-feminine-genitive"]
+        ).text
+        == "трех целых семидесяти пяти сотых"
+    )
+
+    # Too many fractional digits
+    with pytest.raises(NoRuleForNumberError):
+        engine.format_number(
+            "0.123456789012", ruleset_names=["spellout-cardinal-feminine"]
+        )
+
+
+def test_freeze():
+    # pylint: disable=protected-access
+    engine = RbnfEngine.for_language("en").freeze()
+    assert engine.is_frozen
+
+    with pytest.raises(EngineFrozenError):
+        engine.add_rule("1", "one;", "spellout-numbering")
+
+    with pytest.raises(EngineFrozenError):
+        engine.prune_rulesets(["spellout-numbering"])
+
+    # Formatting has no side effects
+    rulesets_before = copy.deepcopy(engine.rulesets)
+    digit_cache_before = copy.deepcopy(engine._digit_cache)
+    for number in (7, 20, 1999, 1234567, -3, 3.14159, "0.5", float("nan")):
+        for purpose in FormatPurpose:
+            try:
+                engine.format_number(number, purpose)
+            except (RbnfError, ValueError):
+                pass
+
+    assert engine.rulesets == rulesets_before
+    assert engine._digit_cache == digit_cache_before
+
+
+def test_frozen_threads():
+    engine = RbnfEngine.for_language("de").freeze()
+    numbers = list(range(0, 20000, 37))
+    expected = [engine.format_number(n).text_by_ruleset for n in numbers]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda n: engine.format_number(n).text_by_ruleset, numbers * 4)
+        )
+
+    assert results == expected * 4
+
+
+def test_big_numbers():
+    engine = RbnfEngine.for_language("en")
+    big_number = 2 * 10**30 + 10**15 + 7
+
+    with pytest.raises(NoRuleForNumberError):
+        engine.format_number(big_number, ruleset_names=["spellout-cardinal"])
+
+    assert (
+        engine.format_number(10**18, big_number_mode=BigNumberMode.SCALE_WORDS).text
+        == "one thousand quadrillion"
+    )
+    assert (
+        engine.format_number(big_number, big_number_mode=BigNumberMode.SCALE_WORDS).text
+        == "two quadrillion quadrillion one quadrillion seven"
+    )
+    assert (
+        engine.format_number(-(10**21), big_number_mode=BigNumberMode.SCALE_WORDS).text
+        == "minus one million quadrillion"
+    )
+    assert engine.format_number(
+        12 * 10**17, big_number_mode=BigNumberMode.DIGITS
+    ).text == "one two " + " ".join(["zero"] * 17)
+
+    # Rules are still used below the highest rule
+    assert (
+        engine.format_number(123, big_number_mode=BigNumberMode.DIGITS).text
+        == "one hundred twenty-three"
+    )
+
+    # Thousands of digits are rendered without recursion
+    result = engine.format_number(
+        int("9" * 3000), big_number_mode=BigNumberMode.SCALE_WORDS
+    )
+    assert result.text.count("nine hundred ninety-nine") == 1000
+
+
+@pytest.mark.parametrize(
+    "big_number_mode", [BigNumberMode.DIGITS, BigNumberMode.SCALE_WORDS]
+)
+def test_big_number_mode_fractions(big_number_mode: BigNumberMode):
+    # Ordinal fraction rules are decimal patterns (x.x: =#,##0.#=)
+    engine = RbnfEngine.for_language("en")
+    with pytest.raises(NoRuleForNumberError):
+        engine.format_number(
+            1.5, ruleset_names=["spellout-ordinal"], big_number_mode=big_number_mode
+        )
+
+    with pytest.raises(NoRuleForNumberError):
+        engine.format_number(
+            1.5, purpose=FormatPurpose.ORDINAL, big_number_mode=big_number_mode
+        )
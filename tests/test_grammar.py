@@ -0,0 +1,157 @@
+import re
+from typing import Set
+
+import pytest
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.__main__ import main
+from unicode_rbnf.engine import NoRuleForNumberError
+from unicode_rbnf.grammar import (
+    GrammarChoice,
+    GrammarExpression,
+    GrammarRuleRef,
+    GrammarSequence,
+    GrammarText,
+    NumberGrammar,
+    build_number_grammar,
+)
+
+
+def expand(grammar: NumberGrammar, expression: GrammarExpression) -> Set[str]:
+    """Get every text of an expression."""
+    if isinstance(expression, GrammarText):
+        return {expression.text}
+
+    if isinstance(expression, GrammarRuleRef):
+        return expand(grammar, grammar.rules[expression.name])
+
+    if isinstance(expression, GrammarSequence):
+        texts = {""}
+        for item in expression.items:
+            item_texts = expand(grammar, item)
+            texts = {text + item_text for text in texts for item_text in item_texts}
+
+        return texts
+
+    assert isinstance(expression, GrammarChoice)
+    return set().union(*(expand(grammar, option) for option in expression.options))
+
+
+def get_texts(
+    engine: RbnfEngine, start: int, stop: int, purpose: FormatPurpose
+) -> Set[str]:
+    """Get texts of every ruleset for numbers in range(start, stop)."""
+    texts: Set[str] = set()
+    for number in range(start, stop):
+        try:
+            texts.update(engine.format_number(number, purpose).text_by_ruleset.values())
+        except NoRuleForNumberError:
+            pass
+
+    return texts
+
+
+@pytest.mark.parametrize("language", ["en", "de", "ru", "pt", "pl", "ja"])
+def test_same_as_format_number(language: str):
+    engine = RbnfEngine.for_language(language)
+    for purpose in (FormatPurpose.CARDINAL, FormatPurpose.ORDINAL):
+        if not engine.get_ruleset_names(purpose):
+            continue
+
+        for start, stop in ((-25, 1200), (99_990, 101_010)):
+            texts = get_texts(engine, start, stop, purpose)
+            if not texts:
+                with pytest.raises(NoRuleForNumberError):
+                    build_number_grammar(engine, start, stop, purpose)
+                continue
+
+            grammar = build_number_grammar(engine, start, stop, purpose)
+            assert expand(grammar, grammar.root) == texts, (purpose, start, stop)
+
+
+def test_regex():
+    engine = RbnfEngine.for_language("en")
+    grammar = build_number_grammar(engine, 0, 1_000_000)
+    pattern = re.compile(grammar.to_regex())
+
+    for number in (0, 7, 21, 100, 999, 1001, 21_021, 999_999):
+        for text in engine.format_number(number).text_by_ruleset.values():
+            assert pattern.fullmatch(text), text
+
+    assert not pattern.fullmatch("one million")
+    assert not pattern.fullmatch("twenty-zero")
+
+
+def test_jsgf():
+    engine = RbnfEngine.for_language("en")
+    grammar = build_number_grammar(engine, 18, 23, ruleset_names=["spellout-numbering"])
+    assert grammar.to_jsgf("small") == (
+        "#JSGF V1.0;\n"
+        "grammar small;\n"
+        "public <small> = (eighteen | nineteen | twenty [one | two]);\n"
+    )
+
+
+def test_vocabulary():
+    engine = RbnfEngine.for_language("de")
+    grammar = build_number_grammar(engine, 0, 1000)
+
+    words = set()
+    for text in get_texts(engine, 0, 1000, FormatPurpose.CARDINAL):
+        words.update(word for word in re.split(r"[\s-]+", text) if word)
+
+    # Parts of joined words like einundzwanzig
+    vocabulary = grammar.get_vocabulary()
+    assert {"ein", "und", "zwanzig"} <= vocabulary
+    parts_pattern = re.compile(
+        "(?:" + "|".join(map(re.escape, sorted(vocabulary, key=len))) + ")+"
+    )
+    assert all(parts_pattern.fullmatch(word) for word in words)
+
+
+def test_large_range():
+    engine = RbnfEngine.for_language("ru")
+    grammar = build_number_grammar(
+        engine, 0, 10**9, ruleset_names=["spellout-cardinal-masculine"]
+    )
+
+    # Plural forms agree with the quotient
+    pattern = re.compile(grammar.to_regex())
+    for number in (2_000, 5_000, 21_000, 123_456_789, 999_999_999):
+        text = engine.format_number(
+            number, ruleset_names=["spellout-cardinal-masculine"]
+        ).text
+        assert pattern.fullmatch(text), text
+
+    assert not pattern.fullmatch("пять тысячи")
+    assert {"тысяча", "тысячи", "тысяч", "миллион"} <= grammar.get_vocabulary()
+
+
+def test_errors():
+    engine = RbnfEngine.for_language("en")
+    with pytest.raises(ValueError):
+        build_number_grammar(engine, 10, 10)
+
+    with pytest.raises(NoRuleForNumberError):
+        # Past the highest rule (=#,##0=)
+        build_number_grammar(engine, 10**18, 10**18 + 10)
+
+
+def test_cli(capsys):
+    main(["grammar", "--language", "en", "--stop", "3", "--format", "vocabulary"])
+    assert capsys.readouterr().out.split() == ["one", "two", "zero"]
+
+    main(
+        [
+            "grammar",
+            "--language",
+            "en",
+            "--purpose",
+            "ordinal",
+            "--stop",
+            "3",
+            "--format",
+            "vocabulary",
+        ]
+    )
+    assert capsys.readouterr().out.split() == ["first", "second", "zeroth"]
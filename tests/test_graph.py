@@ -0,0 +1,58 @@
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.graph import find_text_references
+
+
+def test_find_text_references():
+    assert find_text_references("←%spellout-numbering← hundred→%%th→;") == {
+        "spellout-numbering",
+        "th",
+    }
+    assert not find_text_references("=#,##0=;")
+
+
+def test_dangling_and_cycles():
+    engine = RbnfEngine("en")
+    engine.add_rule("0", "=%ruleset_2=;", "ruleset_1")
+    engine.add_rule("0", "=%ruleset_1=;", "ruleset_2")
+    engine.add_rule("1", "←%does_not_exist←;", "ruleset_3")
+    engine.add_rule("0", "=#,##0=;", "ruleset_4")
+
+    graph = engine.get_ruleset_graph()
+    assert graph.dangling == {"ruleset_3": {"does_not_exist"}}
+    assert graph.cycles == [["ruleset_1", "ruleset_2"]]
+
+
+def test_no_problems_in_xml():
+    for language in RbnfEngine.get_supported_languages():
+        graph = RbnfEngine.for_language(language).get_ruleset_graph()
+        assert not graph.dangling, language
+        assert not graph.cycles, language
+
+
+def test_load_pruned():
+    engine = RbnfEngine.for_language("en", ruleset_names=["spellout-ordinal"])
+    assert set(engine.rulesets.keys()) == {
+        "spellout-ordinal",
+        "spellout-numbering",
+        "spellout-cardinal",
+        "tieth",
+        "th",
+    }
+    assert engine.format_number(123, ruleset_names=["spellout-ordinal"]).text == (
+        "one hundred twenty-third"
+    )
+
+
+def test_prune_rulesets():
+    engine = RbnfEngine.for_language("en")
+    removed_names = engine.prune_rulesets(["spellout-numbering-year"])
+    assert "spellout-ordinal" in removed_names
+    assert set(engine.rulesets.keys()) == {
+        "spellout-numbering-year",
+        "2d-year",
+        "spellout-numbering",
+        "spellout-cardinal",
+    }
+    assert engine.format_number(
+        1999, ruleset_names=["spellout-numbering-year"]
+    ).text == ("nineteen ninety-nine")
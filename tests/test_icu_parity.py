@@ -0,0 +1,47 @@
+"""Check output against ICU without needing ICU installed.
+
+Golden files are written by benchmarks/icu_parity.py (requires PyICU).
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.engine import RbnfError
+
+_GOLDEN_DIR = Path(__file__).parent / "golden" / "icu"
+_GOLDEN_PATHS = sorted(_GOLDEN_DIR.glob("*.json"))
+
+
+@pytest.mark.parametrize("golden_path", _GOLDEN_PATHS, ids=lambda p: p.stem)
+def test_icu_parity(golden_path: Path):
+    with open(golden_path, "r", encoding="utf-8") as golden_file:
+        golden = json.load(golden_file)
+
+    # Crashes are bugs, not known differences from ICU
+    assert not golden.get("crashes"), golden["crashes"]
+
+    engine = RbnfEngine.for_language(golden["language"])
+    mismatches = {
+        (ruleset_name, number_str)
+        for ruleset_name, number_strs in golden["mismatches"].items()
+        for number_str in number_strs
+    }
+
+    for ruleset_name, icu_texts in golden["rulesets"].items():
+        for number_str, icu_text in icu_texts.items():
+            if (ruleset_name, number_str) in mismatches:
+                # Known difference from ICU (exceptions other than RbnfError
+                # are never listed, so they fail here)
+                continue
+
+            try:
+                text = engine.format_number(
+                    number_str, ruleset_names=[ruleset_name]
+                ).text
+            except RbnfError as err:
+                pytest.fail(f"{ruleset_name} {number_str}: {err}")
+
+            assert text == icu_text, (ruleset_name, number_str)
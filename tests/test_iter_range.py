@@ -0,0 +1,54 @@
+import pytest
+
+from unicode_rbnf import FormatOptions, FormatPurpose, RbnfEngine
+from unicode_rbnf.engine import NoRuleForNumberError
+
+
+@pytest.mark.parametrize("language", ["en", "de", "ja", "ru", "fr"])
+def test_same_as_format_number(language: str):
+    engine = RbnfEngine.for_language(language)
+    for purpose in (FormatPurpose.CARDINAL, FormatPurpose.ORDINAL):
+        for start, stop, step in ((-25, 1200, 1), (999_000, 1_002_000, 37)):
+            for ruleset_names in [None] + [
+                [name] for name in engine.get_ruleset_names(purpose)
+            ]:
+                numbers = range(start, stop, step)
+                texts = engine.iter_range(
+                    start, stop, step, purpose=purpose, ruleset_names=ruleset_names
+                )
+                try:
+                    expected = [
+                        (n, engine.format_number(n, purpose, ruleset_names).text)
+                        for n in numbers
+                    ]
+                except NoRuleForNumberError:
+                    with pytest.raises(NoRuleForNumberError):
+                        list(texts)
+                    continue
+
+                assert list(texts) == expected, (purpose, ruleset_names, numbers)
+
+
+def test_iter_range():
+    engine = RbnfEngine.for_language("en")
+    assert list(engine.iter_range(20, 23)) == [
+        (20, "twenty"),
+        (21, "twenty-one"),
+        (22, "twenty-two"),
+    ]
+    assert list(engine.iter_range(3, 0, -1)) == [(3, "three"), (2, "two"), (1, "one")]
+    assert not list(engine.iter_range(0, 0))
+
+
+def test_soft_hyphens():
+    engine = RbnfEngine.for_language("de")
+    assert list(engine.iter_range(21, 22)) == [(21, "einundzwanzig")]
+    assert list(
+        engine.iter_range(21, 22, options=FormatOptions.PRESERVE_SOFT_HYPENS)
+    ) == [(21, "ein\xadund\xadzwanzig")]
+
+
+def test_no_rule():
+    engine = RbnfEngine.for_language("en")
+    with pytest.raises(NoRuleForNumberError):
+        list(engine.iter_range(10**18 - 1, 10**18 + 1))
@@ -0,0 +1,93 @@
+import pytest
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.engine import (
+    BigNumberMode,
+    DeadlineExceededError,
+    FormatLimitError,
+    FormatLimits,
+    NoRuleForNumberError,
+    PartsLimitError,
+    RbnfError,
+    RecursionLimitError,
+)
+
+
+def test_replacement_cycle():
+    engine = RbnfEngine("xx")
+    engine.add_rule("0", "=%b=;", "a")
+    engine.add_rule("0", "=%a=;", "b")
+
+    with pytest.raises(RecursionLimitError):
+        engine.format_number(5, ruleset_names=["a"])
+
+    with pytest.raises(RecursionLimitError):
+        "".join(engine.iter_format_number(5, "a"))
+
+    # Special rules aren't found, but looking them up must stop
+    with pytest.raises(NoRuleForNumberError):
+        engine.format_number(-5, ruleset_names=["a"])
+
+
+def test_substitution_cycle():
+    engine = RbnfEngine("xx")
+    engine.add_rule("0", "x →%b→;", "a")
+    engine.add_rule("0", "y ←%a←;", "b")
+
+    with pytest.raises(RecursionLimitError) as exc_info:
+        engine.format_number(5, ruleset_names=["a"])
+
+    assert isinstance(exc_info.value, FormatLimitError)
+    assert isinstance(exc_info.value, RbnfError)
+
+
+def test_max_depth():
+    engine = RbnfEngine.for_language("en")
+    assert engine.format_number(123456).text == (
+        "one hundred twenty-three thousand four hundred fifty-six"
+    )
+
+    with pytest.raises(RecursionLimitError):
+        engine.format_number(123456, limits=FormatLimits(max_depth=1))
+
+    # Engine default
+    engine.limits = FormatLimits(max_depth=1)
+    with pytest.raises(RecursionLimitError):
+        engine.format_number(123456)
+
+
+def test_max_parts():
+    engine = RbnfEngine.for_language("en")
+    limits = FormatLimits(max_parts=3)
+    assert engine.format_number(21, limits=limits).text == "twenty-one"
+
+    with pytest.raises(PartsLimitError):
+        engine.format_number(123456, limits=limits)
+
+    with pytest.raises(PartsLimitError):
+        engine.format_tokens(123456, limits=limits)
+
+    with pytest.raises(PartsLimitError):
+        engine.format_number(
+            10**30,
+            big_number_mode=BigNumberMode.DIGITS,
+            limits=FormatLimits(max_parts=20),
+        )
+
+
+def test_timeout():
+    engine = RbnfEngine.for_language("en")
+    with pytest.raises(DeadlineExceededError):
+        engine.format_number(123456, limits=FormatLimits(timeout=0))
+
+    assert engine.format_number(
+        123456, limits=FormatLimits(timeout=60)
+    ).text.startswith("one hundred")
+
+
+def test_no_limits():
+    engine = RbnfEngine.for_language("en")
+    no_limits = FormatLimits(max_depth=None, max_parts=None, timeout=None)
+    assert engine.format_number(123456, limits=no_limits) == engine.format_number(
+        123456
+    )
@@ -7,3 +7,9 @@ from unicode_rbnf import RbnfEngine
 def test_load_language(language: str):
     engine = RbnfEngine.for_language(language)
     assert engine.format_number(0).text
+
+
+@pytest.mark.parametrize("language", RbnfEngine.get_supported_languages())
+def test_freeze_language(language: str):
+    engine = RbnfEngine.for_language(language).freeze()
+    assert engine.format_number(0).text
@@ -0,0 +1,54 @@
+from typing import List
+
+import pytest
+
+from unicode_rbnf import RbnfEngine, loading
+from unicode_rbnf.loading import LanguageLoaded, load_languages
+from unicode_rbnf.multi import ExecutorType
+
+LANGUAGES = ["en", "de", "fr"]
+
+
+@pytest.mark.parametrize("executor_type", list(ExecutorType))
+def test_load_languages(executor_type: ExecutorType):
+    progress: List[LanguageLoaded] = []
+    engines = load_languages(
+        LANGUAGES,
+        executor_type=executor_type,
+        max_workers=2,
+        progress=progress.append,
+    )
+
+    # Same order as requested
+    assert list(engines) == LANGUAGES
+    for language, engine in engines.items():
+        assert engine.language == language
+        assert not engine.is_frozen
+        assert engine.format_number(1234) == RbnfEngine.for_language(
+            language
+        ).format_number(1234)
+
+    assert sorted(loaded.language for loaded in progress) == sorted(LANGUAGES)
+    assert [loaded.num_loaded for loaded in progress] == [1, 2, 3]
+    assert all(loaded.num_languages == 3 for loaded in progress)
+    assert all(loaded.seconds >= 0 for loaded in progress)
+
+
+def test_load_sequential():
+    engines = load_languages(["en"], max_workers=1, freeze=True)
+    assert engines["en"].is_frozen
+    assert engines["en"].format_number(5).text == "five"
+
+
+def test_thread_fallback(monkeypatch):
+    def broken_pool(*args, **kwargs):
+        raise OSError("no processes")
+
+    monkeypatch.setattr(loading, "ProcessPoolExecutor", broken_pool)
+    engines = load_languages(LANGUAGES, max_workers=2)
+    assert list(engines) == LANGUAGES
+
+
+def test_unsupported_language():
+    with pytest.raises(ValueError):
+        load_languages(["en", "not-a-language"])
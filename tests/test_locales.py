@@ -0,0 +1,90 @@
+import pytest
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.locales import (
+    for_locale,
+    get_fallback_chain,
+    get_supported_locales,
+    normalize_locale,
+    resolve_locale,
+)
+from unicode_rbnf.overlay import OverlayEngine
+
+
+@pytest.mark.parametrize(
+    "locale,normalized",
+    [
+        ("de-CH", "de_CH"),
+        ("de_ch.UTF-8", "de_CH"),
+        ("SR-latn", "sr_Latn"),
+        ("zh-TW", "zh_Hant_TW"),
+        ("es-419", "es_419"),
+        ("en-US-u-nu-latn", "en_US"),
+        ("iw-IL", "he_IL"),
+    ],
+)
+def test_normalize_locale(locale: str, normalized: str):
+    assert normalize_locale(locale) == normalized
+
+
+def test_fallback_chain():
+    assert get_fallback_chain("de-CH") == ["de_CH", "de", "root"]
+    assert get_fallback_chain("en-GB") == ["en_GB", "en_001", "en", "root"]
+    assert get_fallback_chain("es-MX") == ["es_MX", "es_419", "es", "root"]
+    assert get_fallback_chain("sr-Latn-RS") == ["sr_Latn_RS", "sr_Latn", "root"]
+
+    # Only existing files
+    assert resolve_locale("pt-BR") == ["pt", "root"]
+    assert resolve_locale("en-IN") == ["en_IN", "en_001", "en", "root"]
+    assert resolve_locale("nb-NO") == ["nb", "no", "root"]
+
+
+@pytest.mark.parametrize("locale", ["xx", "xx-YY", "root", "not a locale"])
+def test_unsupported_locale(locale: str):
+    with pytest.raises(ValueError):
+        for_locale(locale)
+
+
+def test_for_locale():
+    assert for_locale("de-CH").format_number(1_000_000).text == "eine Million"
+    assert for_locale("pt-BR").format_number(21).text == "vinte e um"
+    assert for_locale("sr-Latn").format_number(21).text == "dvadeset i jedan"
+    assert for_locale("en-GB").format_number(21).text == "twenty-one"
+    result = for_locale("es-MX").format_number(1, FormatPurpose.ORDINAL)
+    assert result.text_by_ruleset["spellout-ordinal-masculine"] == "primero"
+
+    # Same output as the language's own XML file
+    for language in ("de_CH", "es", "fr_BE", "zh_Hant"):
+        expected = RbnfEngine.for_language(language).format_number(1234)
+        assert for_locale(language.replace("_", "-")).format_number(1234) == expected
+
+
+def test_shared_rulesets():
+    de_engine = for_locale("de")
+    de_ch_engine = for_locale("de-CH")
+    assert for_locale("de_CH") is de_ch_engine
+    assert isinstance(de_ch_engine, OverlayEngine)
+    assert de_ch_engine.is_frozen
+
+    # Numbering systems are shared from root
+    assert de_ch_engine.rulesets["roman-upper"] is de_engine.rulesets["roman-upper"]
+    assert (
+        de_ch_engine.format_number(1999, ruleset_names=["roman-upper"]).text
+        == "MCMXCIX"
+    )
+
+    # Spellout rules are replaced as a whole
+    assert de_ch_engine.rulesets["spellout-numbering"] is not (
+        de_engine.rulesets["spellout-numbering"]
+    )
+
+    # No regional differences
+    assert for_locale("es-MX") is for_locale("es-419")
+    assert for_locale("en-GB") is for_locale("en")
+
+
+def test_supported_locales():
+    locales = get_supported_locales()
+    assert "de-CH" in locales
+    assert "sr-Latn" in locales
+    assert "root" not in locales
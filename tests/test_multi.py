@@ -0,0 +1,67 @@
+from decimal import InvalidOperation
+
+import pytest
+
+from unicode_rbnf import FormatPurpose
+from unicode_rbnf.engine import NoRuleForNumberError
+from unicode_rbnf.multi import ExecutorType, MultiLanguageEngine
+
+
+@pytest.mark.parametrize("executor_type", list(ExecutorType))
+def test_format_numbers(executor_type: ExecutorType):
+    with MultiLanguageEngine(
+        ["en", "de", "zu"], executor_type=executor_type, max_workers=2
+    ) as engine:
+        results = engine.format_numbers([2, "3.5", 10**18])
+
+    assert results[0].results["en"].text == "two"
+    assert results[0].results["de"].text == "zwei"
+    assert results[1].results["en"].text == "three point five"
+    assert results[1].results["de"].text == "drei Komma fünf"
+
+    # English and German rules end before 10^18
+    assert results[2].results["zu"].text
+    assert set(results[2].errors) == {"en", "de"}
+    assert isinstance(results[2].errors["en"], NoRuleForNumberError)
+
+
+def test_format_number():
+    engine = MultiLanguageEngine(["en", "fr"])
+    result = engine.format_number(1, purpose=FormatPurpose.ORDINAL)
+    assert result.results["en"].text == "first"
+    assert (
+        result.results["fr"].text_by_ruleset["spellout-ordinal-masculine"] == "premier"
+    )
+    assert not result.errors
+
+
+def test_error_for_one_number(monkeypatch):
+    engine = MultiLanguageEngine(["en", "de"])
+    format_number = engine.engines["en"].format_number
+
+    def format_number_or_fail(number, *args, **kwargs):
+        if number == 2:
+            raise InvalidOperation()
+
+        return format_number(number, *args, **kwargs)
+
+    monkeypatch.setattr(engine.engines["en"], "format_number", format_number_or_fail)
+    results = engine.format_numbers([1, 2, 3])
+
+    # Other numbers in the language are still formatted
+    assert [r.results["en"].text for r in (results[0], results[2])] == ["one", "three"]
+    assert set(results[1].errors) == {"en"}
+    assert isinstance(results[1].errors["en"], ArithmeticError)
+    assert results[1].results["de"].text == "zwei"
+
+
+def test_invalid_number():
+    engine = MultiLanguageEngine(["en", "fr"])
+    result = engine.format_number("not a number")
+    assert not result.results
+    assert set(result.errors) == {"en", "fr"}
+
+
+def test_unsupported_language():
+    with pytest.raises(ValueError):
+        MultiLanguageEngine(["xx"], executor_type=ExecutorType.PROCESS)
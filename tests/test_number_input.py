@@ -0,0 +1,79 @@
+from decimal import Decimal
+
+import pytest
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.number_input import NumberParser, ParsedNumber
+
+
+@pytest.mark.parametrize(
+    "language,text,expected",
+    [
+        ("en", "1,234.5", "1234.5"),
+        ("en", "1 234", "1234"),
+        ("en", "-0.50", "-0.50"),
+        ("en", "−7", "-7"),
+        ("en", "+7", "7"),
+        ("en", ".5", "0.5"),
+        ("en", "007", "7"),
+        ("en_IN", "1,23,456", "123456"),
+        ("de", "1.234,5", "1234.5"),
+        ("de", "1.234", "1234"),
+        ("de_CH", "1’234.5", "1234.5"),
+        ("fr", "1 234,5", "1234.5"),
+        ("pt_PT", "1 234,5", "1234.5"),
+        ("ar", "١٢٣٫٤", "123.4"),
+        ("ar", "\u200f-١٬٢٣٤", "-1234"),
+        ("hi", "१,२३,४५६", "123456"),
+    ],
+)
+def test_parse(language: str, text: str, expected: str):
+    assert str(NumberParser.for_language(language).parse(text)) == expected
+
+
+@pytest.mark.parametrize(
+    "language,text",
+    [
+        ("en", ""),
+        ("en", "abc"),
+        ("en", "1,5"),
+        ("en", "1.234,5"),
+        ("en", "1,2345"),
+        ("en", "1e5"),
+        ("en", "--1"),
+        ("de", "1.5"),
+    ],
+)
+def test_not_a_number(language: str, text: str):
+    parser = NumberParser.for_language(language)
+    assert parser.try_parse(text) is None
+    with pytest.raises(ValueError):
+        parser.parse(text)
+
+
+def test_parsed_number():
+    assert ParsedNumber(integer_digits="12").to_value() == 12
+    assert ParsedNumber(True, "12", "50").to_value() == Decimal("-12.50")
+
+    # Exact digits
+    big = "123456789012345678901234567890"
+    assert ParsedNumber(integer_digits=big, fraction_digits="1").to_value() == (
+        Decimal(f"{big}.1")
+    )
+
+
+def test_engine():
+    engine = RbnfEngine.for_language("de")
+    assert engine.parse_numbers(["1.234,5", "x", "٣"]) == [
+        ParsedNumber(integer_digits="1234", fraction_digits="5"),
+        None,
+        ParsedNumber(integer_digits="3"),
+    ]
+
+    result = engine.format_number(engine.parse_number("1.234,5"))
+    assert result == engine.format_number("1234.5")
+
+    engine = RbnfEngine.for_language("ar")
+    assert engine.format_number(engine.parse_number("١٢٣")) == (
+        engine.format_number(123)
+    )
@@ -0,0 +1,84 @@
+import pytest
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.engine import EngineFrozenError
+from unicode_rbnf.overlay import OverlayEngine
+
+
+def test_overlay():
+    base = RbnfEngine.for_language("en").freeze()
+    overlay = OverlayEngine(base)
+    overlay.add_rule("7", "seventh heaven;", "spellout-cardinal")
+
+    assert overlay.format_number(27).text == "twenty-seventh heaven"
+    assert overlay.format_number("0.7").text == "zero point seventh heaven"
+    assert base.format_number(27).text == "twenty-seven"
+    assert overlay.own_ruleset_names == {"spellout-cardinal"}
+
+    # Unchanged rulesets and rules are shared
+    assert overlay.rulesets["spellout-ordinal"] is base.rulesets["spellout-ordinal"]
+    assert (
+        overlay.rulesets["spellout-cardinal"].numeric_rules[8]
+        is base.rulesets["spellout-cardinal"].numeric_rules[8]
+    )
+
+    # New ruleset
+    overlay.add_rule("0", "=%spellout-cardinal= units;", "spellout-units")
+    assert overlay.format_number(7, ruleset_names=["spellout-units"]).text == (
+        "seventh heaven units"
+    )
+    assert "spellout-units" not in base.rulesets
+
+    overlay.reset()
+    assert overlay.format_number(27).text == "twenty-seven"
+    assert not overlay.own_ruleset_names
+
+
+def test_frozen_overlay():
+    base = RbnfEngine.for_language("en").freeze()
+    overlays = []
+    for name in ("firstly", "1st"):
+        overlay = OverlayEngine(base)
+        overlay.add_rule("1", f"{name};", "spellout-ordinal")
+        overlays.append(overlay.freeze())
+
+    assert [o.format_number(1, FormatPurpose.ORDINAL).text for o in overlays] == [
+        "firstly",
+        "1st",
+    ]
+    assert overlays[1].format_number(21, FormatPurpose.ORDINAL).text == "twenty-1st"
+
+    # Digit renderings are shared for rulesets that don't use changed rules
+    # pylint: disable=protected-access
+    assert (
+        overlays[0]._digit_cache["spellout-cardinal"]
+        is base._digit_cache["spellout-cardinal"]
+    )
+
+    with pytest.raises(EngineFrozenError):
+        overlays[0].add_rule("2", "second;", "spellout-ordinal")
+
+
+def test_base_must_be_frozen():
+    with pytest.raises(ValueError):
+        OverlayEngine(RbnfEngine.for_language("en"))
+
+
+def test_set_remove_ruleset():
+    base = RbnfEngine.for_language("en").freeze()
+    other = RbnfEngine("en")
+    other.add_rule("0", "lots;", "spellout-numbering")
+
+    overlay = OverlayEngine(base, language="en_XX")
+    assert overlay.language == "en_XX"
+
+    overlay.remove_ruleset("spellout-cardinal")
+    assert "spellout-cardinal" not in overlay.rulesets
+    assert "spellout-cardinal" in base.rulesets
+
+    overlay.set_ruleset(other.rulesets["spellout-numbering"])
+    assert overlay.format_number(21).text == "lots"
+    assert overlay.own_ruleset_names == {"spellout-numbering"}
+
+    overlay.reset()
+    assert overlay.format_number(21).text == "twenty-one"
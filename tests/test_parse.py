@@ -0,0 +1,84 @@
+from xml.etree import ElementTree as et
+
+import pytest
+from reference_parser import parse_reference
+
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.engine import (
+    _LANG_DIR,
+    SKIP_RULESETS,
+    RbnfError,
+    RbnfParseError,
+    RbnfRule,
+)
+
+
+def test_parse_all_languages():
+    """Check fast parser against reference parser for every built-in rule."""
+    num_rules = 0
+    for language in RbnfEngine.get_supported_languages():
+        root = et.parse(_LANG_DIR / f"{language}.xml").getroot()
+        for group_elem in root.findall("rbnf//ruleset"):
+            if group_elem.attrib["type"] in SKIP_RULESETS:
+                continue
+
+            for rule_elem in group_elem.findall("rbnfrule"):
+                if not rule_elem.text:
+                    continue
+
+                value_str = rule_elem.attrib["value"]
+                assert RbnfRule.parse(value_str, rule_elem.text) == (
+                    parse_reference(value_str, rule_elem.text)
+                ), (language, value_str, rule_elem.text)
+                num_rules += 1
+
+    assert num_rules > 10000
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "' and =%spellout-cardinal=;",
+        "←← x →→→;",
+        "←%spellout-cardinal← hundred[ →%%and→];",
+        "foo [bar →→] baz;",
+        "[abc ←←] →→;",
+        "=#,##0.00=;",
+        "←#,##0←;",
+        "abc $(cardinal,one{x}other{y})$ def;",
+        "$(ordinal,one{st}other{th})$←←;",
+        "[←%foo← $(cardinal,one{x}other{y})$ ]→%%bar→;",
+        "←%foo←←;",
+        "one; two",
+        "",
+    ],
+)
+def test_parse_same_as_reference(text: str):
+    assert RbnfRule.parse("100", text) == parse_reference("100", text)
+
+
+@pytest.mark.parametrize(
+    "text,position",
+    [
+        ("abc]", 3),
+        ("→←;", 1),
+        ("[abc=", 4),
+        ("←#,##x0←;", 5),
+        ("%foo", 0),
+        ("abc $ def", 4),
+    ],
+)
+def test_parse_error(text: str, position: int):
+    with pytest.raises(ValueError):
+        parse_reference("1", text)
+
+    with pytest.raises(RbnfParseError) as exc_info:
+        RbnfRule.parse("1", text)
+
+    assert exc_info.value.position == position
+    assert exc_info.value.text == text
+    assert f"position {position}" in str(exc_info.value)
+
+    # Backwards compatible
+    assert isinstance(exc_info.value, RbnfError)
+    assert isinstance(exc_info.value, ValueError)
@@ -0,0 +1,95 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+from unicode_rbnf.reload import ReloadingEngine
+
+_OVERRIDE_XML = """<?xml version="1.0" encoding="UTF-8" ?>
+<ldml>
+    <identity>
+        <language type="en"/>
+    </identity>
+    <rbnf>
+        <rulesetGrouping type="SpelloutRules">
+            <ruleset type="spellout-cardinal">
+                <rbnfrule value="7">{seven};</rbnfrule>
+            </ruleset>
+        </rulesetGrouping>
+    </rbnf>
+</ldml>
+"""
+
+
+def _write_override(path: Path, seven: str, mtime: float) -> None:
+    path.write_text(_OVERRIDE_XML.format(seven=seven), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_check(tmp_path: Path):
+    override_path = tmp_path / "en.xml"
+    _write_override(override_path, "SEVEN", 1000)
+
+    with ReloadingEngine("en", [override_path], start=False) as engine:
+        first_engine = engine.engine
+        assert first_engine.is_frozen
+        assert engine.format_number(7).text == "SEVEN"
+        assert engine.format_number(27).text == "twenty-SEVEN"
+
+        # Unchanged
+        assert not engine.check()
+        assert engine.engine is first_engine
+
+        _write_override(override_path, "sieben", 2000)
+        assert engine.check()
+        assert engine.format_number(7).text == "sieben"
+        assert engine.metrics.num_reloads == 1
+        assert engine.metrics.last_load_seconds is not None
+
+        # Broken file keeps the previous engine
+        override_path.write_text("<ldml>", encoding="utf-8")
+        os.utime(override_path, (3000, 3000))
+        assert not engine.check()
+        assert engine.format_number(7).text == "sieben"
+        assert engine.metrics.num_failures == 1
+        assert engine.metrics.last_error
+
+        # Not retried until changed again
+        assert not engine.check()
+        assert engine.metrics.num_failures == 1
+
+        # Removing the file goes back to the built-in rules
+        override_path.unlink()
+        assert engine.check()
+        assert engine.format_number(7).text == "seven"
+
+
+def test_background_reload(tmp_path: Path):
+    override_path = tmp_path / "en.xml"
+    _write_override(override_path, "SEVEN", 1000)
+
+    stop_event = threading.Event()
+    texts = set()
+
+    def format_loop():
+        # In-flight calls always see a complete engine
+        while not stop_event.is_set():
+            texts.add(reloading_engine.format_number(7).text)
+
+    with ReloadingEngine("en", [override_path], poll_seconds=0.01) as reloading_engine:
+        thread = threading.Thread(target=format_loop)
+        thread.start()
+
+        _write_override(override_path, "sieben", 2000)
+        deadline = time.monotonic() + 10
+        while (reloading_engine.metrics.num_reloads < 1) and (
+            time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+
+        stop_event.set()
+        thread.join()
+
+        assert reloading_engine.metrics.num_reloads == 1
+        assert reloading_engine.format_number(7).text == "sieben"
+        assert texts <= {"SEVEN", "sieben"}
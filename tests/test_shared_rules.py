@@ -0,0 +1,50 @@
+from unicode_rbnf import RbnfEngine
+from unicode_rbnf.engine import RbnfRule, TextRulePart, _SharedRules
+
+
+def _get_rule_ids(engine: RbnfEngine):
+    return {
+        id(rule)
+        for ruleset in engine.rulesets.values()
+        for rules in (ruleset.numeric_rules, ruleset.special_rules)
+        for rule in rules.values()
+    }
+
+
+def test_engines_share_rules():
+    engine_1 = RbnfEngine.for_language("en")
+    engine_2 = RbnfEngine.for_language("en")
+    assert _get_rule_ids(engine_1) == _get_rule_ids(engine_2)
+
+    # Some rules are the same in English and Spanish
+    assert _get_rule_ids(engine_1) & _get_rule_ids(RbnfEngine.for_language("es"))
+
+
+def test_add_rule_doesnt_change_other_engines():
+    engine_1 = RbnfEngine.for_language("en")
+    engine_2 = RbnfEngine.for_language("en")
+    engine_1.add_rule("1", "uno;", "spellout-numbering")
+
+    assert engine_1.format_number(1).text == "uno"
+    assert engine_2.format_number(1).text == "one"
+
+
+def test_shared_parts():
+    shared_rules = _SharedRules()
+    rule = shared_rules.parse("1", "one;")
+    assert rule == RbnfRule.parse("1", "one;")
+    assert shared_rules.parse("1", "one;") is rule
+
+    # Different value, same parts
+    other_rule = shared_rules.parse("2", "one;")
+    assert other_rule is not None
+    assert other_rule is not rule
+    assert other_rule.parts[0] is rule.parts[0]
+    assert isinstance(rule.parts[0], TextRulePart)
+
+
+def test_max_size():
+    shared_rules = _SharedRules(max_size=0)
+    rule = shared_rules.parse("1", "one;")
+    assert rule == RbnfRule.parse("1", "one;")
+    assert shared_rules.parse("1", "one;") is not rule
@@ -0,0 +1,95 @@
+import itertools
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.engine import FormatOptions, NoRuleForNumberError, RbnfSpecialRule
+from unicode_rbnf.tokens import TokenKind
+
+
+def test_tokens():
+    engine = RbnfEngine.for_language("en")
+    tokens = engine.format_tokens(-21)
+
+    assert [t.text for t in tokens] == ["minus", " ", "twenty", "-", "one"]
+    assert [t.kind for t in tokens] == [
+        TokenKind.WORD,
+        TokenKind.SPACE,
+        TokenKind.WORD,
+        TokenKind.HYPHEN,
+        TokenKind.WORD,
+    ]
+    assert [t.is_separator for t in tokens] == [False, True, False, True, False]
+    assert tokens[0].rule_value == RbnfSpecialRule.NEGATIVE_NUMBER
+    assert tokens[2].rule_value == 20
+    assert tokens[4].rule_value == 1
+    assert tokens[2].ruleset_name == "spellout-cardinal"
+
+    # Same text gets the same id
+    vocabulary = engine.vocabulary
+    assert engine.format_tokens(1)[0].token_id == tokens[4].token_id
+    assert vocabulary.get_text(tokens[4].token_id) == "one"
+    assert "twenty" in vocabulary
+
+
+def test_same_text_as_format_number():
+    for language in ("en", "de", "fr", "ru", "ko", "ja"):
+        engine = RbnfEngine.for_language(language)
+        for number, purpose in itertools.product(
+            (0, 7, 21, 101, 1999, 123456, 10**9 + 1, -5),
+            (FormatPurpose.CARDINAL, FormatPurpose.ORDINAL),
+        ):
+            try:
+                result = engine.format_number(number, purpose)
+            except NoRuleForNumberError:
+                with pytest.raises(NoRuleForNumberError):
+                    engine.format_tokens(number, purpose)
+                continue
+
+            tokens = engine.format_tokens(number, purpose)
+            assert "".join(t.text for t in tokens) == result.text
+            assert tokens[0].ruleset_name
+
+            words = [t.text for t in tokens if not t.is_separator]
+            assert all(words)
+
+        if language in ("en", "de", "fr"):
+            result = engine.format_number("3.25")
+            tokens = engine.format_tokens("3.25")
+            assert "".join(t.text for t in tokens) == result.text
+
+
+def test_soft_hyphens():
+    engine = RbnfEngine.for_language("de")
+    assert [t.text for t in engine.format_tokens(121)] == ["einhunderteinundzwanzig"]
+
+    tokens = engine.format_tokens(121, options=FormatOptions.PRESERVE_SOFT_HYPENS)
+    assert [t.text for t in tokens if not t.is_separator] == [
+        "ein",
+        "hundert",
+        "ein",
+        "und",
+        "zwanzig",
+    ]
+    assert {t.kind for t in tokens if t.is_separator} == {TokenKind.SOFT_HYPHEN}
+
+
+def test_vocabulary_threads():
+    engine = RbnfEngine.for_language("en").freeze()
+    numbers = list(range(1000))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(engine.format_tokens, numbers * 4))
+
+    # Every text has exactly one id
+    vocabulary = engine.vocabulary.to_dict()
+    assert sorted(vocabulary.values()) == list(range(len(vocabulary)))
+    for tokens in results:
+        for token in tokens:
+            assert vocabulary[token.text] == token.token_id
+
+    # Engines can still be pickled
+    engine_copy = pickle.loads(pickle.dumps(engine))
+    assert engine_copy.vocabulary.to_dict() == vocabulary
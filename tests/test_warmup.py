@@ -0,0 +1,122 @@
+from decimal import Decimal
+from pathlib import Path
+
+from unicode_rbnf import FormatPurpose, RbnfEngine
+from unicode_rbnf.__main__ import main
+from unicode_rbnf.warmup import UsageRecorder, warm_up
+
+
+def test_recorder(tmp_path: Path):
+    engine = RbnfEngine.for_language("en")
+    engine.recorder = UsageRecorder(max_entries=3)
+
+    for number in (5, 5.0, "5", 12, Decimal("4.50"), "4.5"):
+        engine.format_number(number)
+
+    engine.format_number(1, FormatPurpose.ORDINAL)
+    engine.recorder.record(FormatPurpose.CARDINAL, 5)
+
+    # Integral values share a key, but 4.50 and 4.5 are formatted differently
+    assert engine.recorder.most_common(2) == [
+        ((FormatPurpose.CARDINAL, 5), 4),
+        ((FormatPurpose.CARDINAL, 12), 1),
+    ]
+    assert len(engine.recorder) == 3
+    assert engine.recorder.num_dropped == 2
+
+    for file_name in ("usage.tsv", "usage.tsv.gz"):
+        usage_path = tmp_path / file_name
+        engine.recorder.save(usage_path)
+        loaded = UsageRecorder.load(usage_path)
+        assert loaded.counts == engine.recorder.counts
+
+    # Merging
+    merged = UsageRecorder.load([tmp_path / "usage.tsv", tmp_path / "usage.tsv.gz"])
+    assert merged.counts[(FormatPurpose.CARDINAL, "4.50")] == 2
+    assert merged.total == 2 * engine.recorder.total
+
+
+def test_warm_up():
+    engine = RbnfEngine.for_language("en").freeze()
+    usage = UsageRecorder()
+    for number_key, count in ((7, 10), (11, 5), ("1.5", 3), (10**30, 1)):
+        for _ in range(count):
+            usage.record(FormatPurpose.CARDINAL, number_key)
+
+    result = warm_up(engine, usage, max_results=2)
+    assert result.num_rendered == 2
+    assert not result.is_complete
+    assert result.coverage == 15 / 19
+    assert engine.result_cache is not None
+    assert set(engine.result_cache) == {
+        (FormatPurpose.CARDINAL, 7),
+        (FormatPurpose.CARDINAL, 11),
+    }
+
+    # Warming up doesn't change usage
+    engine.recorder = usage
+    result = warm_up(engine, usage, max_results=None)
+    assert usage.total == 19
+    assert result.is_complete
+    assert result.num_rendered == 3
+    assert result.num_failed == 1  # past highest rule
+
+    # Cached results are copies
+    cached_result = engine.format_number(7)
+    assert cached_result.text == "seven"
+    cached_result.text_by_ruleset.clear()
+    assert engine.format_number(7).text_by_ruleset
+
+    assert engine.format_number("1.5").text == "one point five"
+    assert usage.total == 22
+
+    # Cache is only used with default settings
+    assert engine.result_cache is not None
+    seven_result = engine.result_cache.get((FormatPurpose.CARDINAL, 7))
+    assert seven_result is not None
+    seven_result.text = "SEVEN"
+    assert engine.format_number(7).text == "SEVEN"
+    assert engine.format_number(7, ruleset_names=["spellout-cardinal"]).text == (
+        "seven"
+    )
+
+
+def test_zero_budget():
+    engine = RbnfEngine.for_language("en")
+    usage = UsageRecorder()
+    usage.record(FormatPurpose.CARDINAL, 1)
+
+    result = warm_up(engine, usage, time_budget_seconds=0)
+    assert result.num_rendered == 0
+    assert not result.is_complete
+    assert engine.result_cache is not None
+    assert len(engine.result_cache) == 0
+
+
+def test_cache_cleared_by_add_rule():
+    engine = RbnfEngine.for_language("en")
+    usage = UsageRecorder()
+    usage.record(FormatPurpose.CARDINAL, 7)
+    warm_up(engine, usage)
+    assert engine.result_cache
+
+    engine.add_rule("7", "SEVEN;", "spellout-cardinal")
+    assert engine.result_cache is None
+    assert engine.format_number(7).text_by_ruleset["spellout-cardinal"] == "SEVEN"
+
+
+def test_cli(tmp_path: Path, capsys):
+    usage = UsageRecorder()
+    usage.record(FormatPurpose.CARDINAL, 7)
+    usage.record(FormatPurpose.ORDINAL, 2)
+    usage_path = tmp_path / "usage.tsv"
+    usage.save(usage_path)
+
+    main(["warm-up", "--language", "en", str(usage_path)])
+    lines = capsys.readouterr().out.splitlines()
+    assert "rendered|2" in lines
+    assert "coverage|1.0000" in lines
+
+    # Formatting still works without a subcommand
+    main(["--language", "en", "7"])
+    assert "7|spellout-cardinal|seven" in capsys.readouterr().out.splitlines()
@@ -1,10 +1,32 @@
 import argparse
+import sys
+import time
+from typing import List, Optional
 
 from unicode_rbnf import FormatPurpose, RbnfEngine
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser()
+def main(argv: Optional[List[str]] = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv[:1] == ["warm-up"]:
+        warm_up_main(argv[1:])
+        return
+
+    if argv[:1] == ["load"]:
+        load_main(argv[1:])
+        return
+
+    if argv[:1] == ["grammar"]:
+        grammar_main(argv[1:])
+        return
+
+    parser = argparse.ArgumentParser(
+        epilog="Use 'warm-up --help' to test warming up from a usage histogram, "
+        "'load --help' to time loading languages concurrently, "
+        "or 'grammar --help' to export a speech grammar for a range of numbers"
+    )
     parser.add_argument(
         "--language",
         choices=RbnfEngine.get_supported_languages(),
@@ -13,19 +35,164 @@ def main() -> None:
     )
     parser.add_argument(
         "--purpose",
-        choices=[v.value for v in FormatPurpose],
-        default=FormatPurpose.CARDINAL,
+        choices=[p.name.lower() for p in FormatPurpose],
+        default=FormatPurpose.CARDINAL.name.lower(),
         help="Format purpose",
     )
     parser.add_argument("number", nargs="+", help="Number(s) to turn into words")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     engine = RbnfEngine.for_language(args.language)
     for number_str in args.number:
-        result = engine.format_number(number_str, purpose=FormatPurpose(args.purpose))
+        result = engine.format_number(
+            number_str, purpose=FormatPurpose[args.purpose.upper()]
+        )
         for ruleset, words in result.text_by_ruleset.items():
             print(number_str, ruleset, words, sep="|")
 
 
+def warm_up_main(argv: List[str]) -> None:
+    """Warm up an engine from usage histogram(s) and report statistics."""
+    from unicode_rbnf.warmup import (  # pylint: disable=import-outside-toplevel
+        UsageRecorder,
+        warm_up,
+    )
+
+    parser = argparse.ArgumentParser(prog="unicode_rbnf warm-up")
+    parser.add_argument(
+        "--language",
+        choices=RbnfEngine.get_supported_languages(),
+        required=True,
+        help="Language code",
+    )
+    parser.add_argument(
+        "usage", nargs="+", help="Usage file(s) saved with UsageRecorder.save"
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=1.0,
+        help="Maximum seconds spent rendering (default: 1)",
+    )
+    parser.add_argument(
+        "--max-results",
+        type=int,
+        default=10_000,
+        help="Maximum number of cached results (default: 10000)",
+    )
+    args = parser.parse_args(argv)
+
+    usage = UsageRecorder.load(args.usage)
+    engine = RbnfEngine.for_language(args.language).freeze()
+    result = warm_up(
+        engine,
+        usage,
+        time_budget_seconds=args.time_budget,
+        max_results=args.max_results,
+    )
+
+    print("entries", len(usage), sep="|")
+    print("rendered", result.num_rendered, sep="|")
+    print("failed", result.num_failed, sep="|")
+    print("coverage", f"{result.coverage:.4f}", sep="|")
+    print("seconds", f"{result.seconds:.3f}", sep="|")
+    print("complete", result.is_complete, sep="|")
+
+
+def load_main(argv: List[str]) -> None:
+    """Load languages concurrently and report timings."""
+    # pylint: disable=import-outside-toplevel
+    from unicode_rbnf.loading import LanguageLoaded, load_languages
+    from unicode_rbnf.multi import ExecutorType
+
+    parser = argparse.ArgumentParser(prog="unicode_rbnf load")
+    parser.add_argument(
+        "--language",
+        nargs="+",
+        choices=RbnfEngine.get_supported_languages(),
+        help="Language code(s) (default: all)",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=[v.value for v in ExecutorType],
+        default=ExecutorType.PROCESS.value,
+        help="Type of worker pool (default: process)",
+    )
+    parser.add_argument(
+        "--max-workers", type=int, help="Number of workers (default: CPU count)"
+    )
+    parser.add_argument("--freeze", action="store_true", help="Freeze engines")
+    args = parser.parse_args(argv)
+
+    def print_progress(loaded: LanguageLoaded) -> None:
+        print(
+            loaded.language,
+            f"{loaded.seconds:.3f}",
+            f"{loaded.num_loaded}/{loaded.num_languages}",
+            sep="|",
+        )
+
+    start_time = time.perf_counter()
+    engines = load_languages(
+        args.language,
+        executor_type=ExecutorType(args.executor),
+        max_workers=args.max_workers,
+        freeze=args.freeze,
+        progress=print_progress,
+    )
+
+    print("languages", len(engines), sep="|")
+    print("seconds", f"{time.perf_counter() - start_time:.3f}", sep="|")
+
+
+def grammar_main(argv: List[str]) -> None:
+    """Print a grammar or vocabulary for a range of numbers."""
+    # pylint: disable=import-outside-toplevel
+    from unicode_rbnf.grammar import build_number_grammar
+
+    parser = argparse.ArgumentParser(prog="unicode_rbnf grammar")
+    parser.add_argument(
+        "--language",
+        choices=RbnfEngine.get_supported_languages(),
+        required=True,
+        help="Language code",
+    )
+    parser.add_argument(
+        "--purpose",
+        choices=[p.name.lower() for p in FormatPurpose],
+        default=FormatPurpose.CARDINAL.name.lower(),
+        help="Format purpose",
+    )
+    parser.add_argument("--ruleset", nargs="+", help="Rulesets (default: purpose's)")
+    parser.add_argument("--start", type=int, default=0, help="First number")
+    parser.add_argument(
+        "--stop", type=int, required=True, help="Number after the last number"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["jsgf", "regex", "vocabulary"],
+        default="jsgf",
+        help="Output format (default: jsgf)",
+    )
+    args = parser.parse_args(argv)
+
+    engine = RbnfEngine.for_language(args.language)
+    grammar = build_number_grammar(
+        engine,
+        args.start,
+        args.stop,
+        purpose=FormatPurpose[args.purpose.upper()],
+        ruleset_names=args.ruleset,
+    )
+
+    if args.format == "jsgf":
+        print(grammar.to_jsgf(), end="")
+    elif args.format == "regex":
+        print(grammar.to_regex())
+    else:
+        for word in sorted(grammar.get_vocabulary()):
+            print(word)
+
+
 if __name__ == "__main__":
     main()
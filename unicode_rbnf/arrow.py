@@ -0,0 +1,177 @@
+"""Format Apache Arrow arrays (optional dependencies: pyarrow and numpy).
+
+Columns are dictionary encoded by Arrow, so each unique value is rendered in
+Python only once (chunk_size values at a time), and the output string buffers
+are built by Arrow (take) instead of from a Python object per
+row. pandas and Polars series are converted to and from Arrow without copying
+where possible.
+"""
+
+from typing import TYPE_CHECKING, List, Optional, Union
+
+import pyarrow as pa
+
+from .batch import format_array
+from .engine import FormatOptions, FormatPurpose, RbnfEngine
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+ArrowArrayType = Union[pa.Array, pa.ChunkedArray]
+
+
+def format_arrow(
+    engine: RbnfEngine,
+    numbers: ArrowArrayType,
+    purpose: Optional[FormatPurpose] = None,
+    ruleset_name: Optional[str] = None,
+    options: Optional[FormatOptions] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> pa.ChunkedArray:
+    """Format an Arrow array of integers, decimals, floats, or number strings.
+
+    Returns a chunked string array (at most chunk_size rows per chunk) where
+    each element is identical to format_number(number, purpose, ...).text.
+    Nulls stay null. If ruleset_name is given, only that ruleset is used.
+
+    Raises NoRuleForNumberError if any number can't be formatted.
+    """
+    if isinstance(numbers, pa.Array):
+        numbers = pa.chunked_array([numbers])
+
+    value_type = numbers.type
+    if not (
+        pa.types.is_integer(value_type)
+        or pa.types.is_floating(value_type)
+        or pa.types.is_decimal(value_type)
+        or pa.types.is_string(value_type)
+        or pa.types.is_large_string(value_type)
+    ):
+        raise TypeError(f"Can't format Arrow type: {value_type}")
+
+    # One dictionary of unique values for all chunks
+    encoded = numbers.dictionary_encode().unify_dictionaries()
+    if encoded.num_chunks > 0:
+        unique_numbers = encoded.chunk(0).dictionary
+    else:
+        unique_numbers = pa.array([], type=value_type)
+
+    # Texts of unique values, rendered chunk_size values at a time.
+    # 64-bit offsets, since all texts together may be larger than 2 GiB.
+    unique_texts = pa.concat_arrays(
+        [pa.array([], type=pa.large_string())]
+        + [
+            _format_unique(
+                engine,
+                unique_numbers.slice(offset, chunk_size),
+                purpose,
+                ruleset_name,
+                options,
+            )
+            for offset in range(0, len(unique_numbers), chunk_size)
+        ]
+    )
+
+    text_chunks: List[pa.Array] = []
+    for chunk in encoded.chunks:
+        for offset in range(0, len(chunk), chunk_size):
+            chunk_texts = unique_texts.take(chunk.indices.slice(offset, chunk_size))
+            text_chunks.append(chunk_texts.cast(pa.string()))
+
+    return pa.chunked_array(text_chunks, type=pa.string())
+
+
+def format_pandas(
+    engine: RbnfEngine,
+    numbers: "pd.Series",
+    purpose: Optional[FormatPurpose] = None,
+    ruleset_name: Optional[str] = None,
+    options: Optional[FormatOptions] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> "pd.Series":
+    """Format a pandas series into an Arrow-backed string series.
+
+    Arrow-backed series are read without copying. The index and name are
+    kept.
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    arrow_numbers = numbers.array
+    if hasattr(arrow_numbers, "__arrow_array__"):
+        arrow_numbers = arrow_numbers.__arrow_array__()
+    else:
+        arrow_numbers = pa.Array.from_pandas(numbers)
+
+    texts = format_arrow(
+        engine,
+        arrow_numbers,
+        purpose=purpose,
+        ruleset_name=ruleset_name,
+        options=options,
+        chunk_size=chunk_size,
+    )
+
+    return pd.Series(
+        pd.arrays.ArrowExtensionArray(texts), index=numbers.index, name=numbers.name
+    )
+
+
+def format_polars(
+    engine: RbnfEngine,
+    numbers: "pl.Series",
+    purpose: Optional[FormatPurpose] = None,
+    ruleset_name: Optional[str] = None,
+    options: Optional[FormatOptions] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> "pl.Series":
+    """Format a Polars series into a string series with the same name.
+
+    Can be used in expressions with map_batches, e.g.
+    pl.col("n").map_batches(lambda s: format_polars(engine, s)).
+    """
+    import polars as pl  # pylint: disable=import-outside-toplevel
+
+    texts = format_arrow(
+        engine,
+        numbers.to_arrow(),
+        purpose=purpose,
+        ruleset_name=ruleset_name,
+        options=options,
+        chunk_size=chunk_size,
+    )
+
+    return pl.Series(numbers.name, texts)
+
+
+def _format_unique(
+    engine: RbnfEngine,
+    unique_numbers: pa.Array,
+    purpose: Optional[FormatPurpose],
+    ruleset_name: Optional[str],
+    options: Optional[FormatOptions],
+) -> pa.Array:
+    """Format unique, non-null values into a string array."""
+    value_type = unique_numbers.type
+    if pa.types.is_integer(value_type) or pa.types.is_floating(value_type):
+        # Vectorized
+        texts = format_array(
+            engine,
+            unique_numbers.to_numpy(zero_copy_only=False),
+            purpose=purpose,
+            ruleset_name=ruleset_name,
+            options=options,
+        ).tolist()
+    else:
+        # Decimals and strings are formatted one by one
+        ruleset_names = None if (ruleset_name is None) else [ruleset_name]
+        texts = [
+            engine.format_number(
+                number, purpose=purpose, ruleset_names=ruleset_names, options=options
+            ).text
+            for number in unique_numbers.to_pylist()
+        ]
+
+    return pa.array(texts, type=pa.large_string())
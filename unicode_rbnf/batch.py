@@ -0,0 +1,261 @@
+"""Format arrays of numbers with NumPy (optional dependency).
+
+Integers are assigned to rules with a single np.searchsorted, split into
+quotients and remainders per rule, and sub-renderings are only computed once
+for each unique value.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .engine import (
+    FormatOptions,
+    FormatPurpose,
+    NoRuleForNumberError,
+    PluralFormatPart,
+    RbnfEngine,
+    RbnfRule,
+    RbnfSpecialRule,
+    ReplaceRulePart,
+    SubRulePart,
+    SubType,
+    TextRulePart,
+)
+
+_INT64_MIN = int(np.iinfo(np.int64).min)
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def format_array(
+    engine: RbnfEngine,
+    numbers: Iterable,
+    purpose: Optional[FormatPurpose] = None,
+    ruleset_name: Optional[str] = None,
+    options: Optional[FormatOptions] = None,
+) -> np.ndarray:
+    """Format an array of numbers.
+
+    Returns an object array with the same shape as numbers, where each element
+    is identical to format_number(number, purpose, ...).text. If ruleset_name
+    is given, only that ruleset is used.
+
+    Raises NoRuleForNumberError if any number can't be formatted.
+    """
+    if purpose is None:
+        purpose = FormatPurpose.CARDINAL
+
+    if options is None:
+        options = FormatOptions(0)
+
+    number_array = np.asarray(numbers)
+    if ruleset_name is None:
+        ruleset_names = engine.get_ruleset_names(purpose)
+    else:
+        ruleset_names = [ruleset_name]
+
+    if not ruleset_names:
+        raise ValueError("No rulesets")
+
+    unique_numbers, inverse = np.unique(number_array.ravel(), return_inverse=True)
+    texts = np.empty(len(unique_numbers), dtype=object)
+    is_done = np.zeros(len(unique_numbers), dtype=bool)
+
+    # Only integers that fit in int64 take the vectorized path
+    int_mask = np.zeros(len(unique_numbers), dtype=bool)
+    if unique_numbers.dtype.kind in "iu":
+        int_mask[:] = (unique_numbers >= _INT64_MIN + 1) & (
+            unique_numbers <= _INT64_MAX
+        )
+    elif unique_numbers.dtype.kind == "f":
+        with np.errstate(invalid="ignore"):
+            int_mask[:] = (
+                np.isfinite(unique_numbers)
+                & (unique_numbers == np.round(unique_numbers))
+                & (np.abs(unique_numbers) < 2**63)
+            )
+
+    int_values = unique_numbers[int_mask].astype(np.int64)
+    int_idxs = np.flatnonzero(int_mask)
+
+    # Pick text from the first successful ruleset (same as format_number)
+    for text_ruleset in engine.get_text_ruleset_order(ruleset_names, purpose):
+        pending_mask = ~is_done[int_idxs]
+        if not pending_mask.any():
+            break
+
+        ruleset_texts, is_ok = _format_values(
+            engine, text_ruleset, int_values[pending_mask]
+        )
+        pending_idxs = int_idxs[pending_mask]
+        texts[pending_idxs[is_ok]] = ruleset_texts[is_ok]
+        is_done[pending_idxs[is_ok]] = True
+
+    if not (options & FormatOptions.PRESERVE_SOFT_HYPENS):
+        done_idxs = np.flatnonzero(is_done)
+        texts[done_idxs] = [text.replace("\xad", "") for text in texts[done_idxs]]
+
+    # Fractions, NaN, etc. are formatted one by one
+    for number_idx in np.flatnonzero(~int_mask):
+        number = unique_numbers[number_idx]
+        texts[number_idx] = engine.format_number(
+            number.item() if isinstance(number, np.generic) else number,
+            purpose=purpose,
+            ruleset_names=ruleset_names,
+            options=options,
+        ).text
+        is_done[number_idx] = True
+
+    if not is_done.all():
+        failed_number = unique_numbers[np.flatnonzero(~is_done)[0]]
+        raise NoRuleForNumberError(f"No rules were successful for {failed_number}")
+
+    return texts[inverse].reshape(number_array.shape)
+
+
+def _format_values(
+    engine: RbnfEngine, ruleset_name: str, values: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Format int64 values with a ruleset, rendering each unique value once.
+
+    Returns texts and a mask of values that were formatted successfully.
+    """
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    texts, is_ok = _format_unique(engine, ruleset_name, unique_values)
+
+    return texts[inverse], is_ok[inverse]
+
+
+def _format_unique(
+    engine: RbnfEngine, ruleset_name: str, values: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Format sorted, unique int64 values with a ruleset."""
+    texts = np.full(len(values), "", dtype=object)
+    is_ok = np.zeros(len(values), dtype=bool)
+
+    ruleset = engine.rulesets.get(ruleset_name)
+    if (ruleset is None) or (len(values) == 0):
+        return texts, is_ok
+
+    # Negative numbers
+    negative_mask = values < 0
+    if negative_mask.any():
+        negative_rule = ruleset.find_special_rule(
+            RbnfSpecialRule.NEGATIVE_NUMBER, engine.rulesets
+        )
+        if negative_rule is not None:
+            negative_values = values[negative_mask]
+            negative_texts, negative_ok = _render_rule(
+                engine,
+                ruleset_name,
+                negative_rule,
+                negative_values,
+                np.zeros_like(negative_values),
+                -negative_values,
+            )
+            texts[negative_mask] = negative_texts
+            is_ok[negative_mask] = negative_ok
+
+    # Numeric rules
+    sorted_numbers: List[int] = list(ruleset.get_sorted_numbers())
+    positive_idxs = np.flatnonzero(~negative_mask)
+    if (not sorted_numbers) or (len(positive_idxs) == 0):
+        return texts, is_ok
+
+    # Same as bisect in RbnfRuleSet.find_rule
+    rule_numbers = np.array(
+        [min(rule_number, _INT64_MAX) for rule_number in sorted_numbers],
+        dtype=np.int64,
+    )
+    positive_values = values[positive_idxs]
+    rule_idxs = np.maximum(
+        np.searchsorted(rule_numbers, positive_values, side="right") - 1, 0
+    )
+
+    # Values are sorted, so each rule bucket is a contiguous slice
+    bucket_starts = np.flatnonzero(np.diff(rule_idxs, prepend=-1))
+    bucket_ends = np.append(bucket_starts[1:], len(rule_idxs))
+    for bucket_start, bucket_end in zip(bucket_starts, bucket_ends):
+        rule = ruleset.numeric_rules[sorted_numbers[rule_idxs[bucket_start]]]
+        bucket_idxs = positive_idxs[bucket_start:bucket_end]
+        bucket_values = values[bucket_idxs]
+
+        assert isinstance(rule.value, int)
+        if rule.value > 0:
+            power_below, power_above = rule.get_divisors()
+            if power_above <= _INT64_MAX:
+                divisors = np.where(
+                    bucket_values >= power_above, power_above, power_below
+                )
+            else:
+                divisors = np.full_like(bucket_values, power_below)
+
+            quotients, remainders = np.divmod(bucket_values, divisors)
+        else:
+            quotients = np.zeros_like(bucket_values)
+            remainders = quotients
+
+        texts[bucket_idxs], is_ok[bucket_idxs] = _render_rule(
+            engine, ruleset_name, rule, bucket_values, quotients, remainders
+        )
+
+    return texts, is_ok
+
+
+def _render_rule(
+    engine: RbnfEngine,
+    ruleset_name: str,
+    rule: RbnfRule,
+    values: np.ndarray,
+    quotients: np.ndarray,
+    remainders: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Render rule parts for values that all use the same rule.
+
+    Like iter_format_number, a value stops being rendered once a part fails.
+    """
+    texts = np.full(len(values), "", dtype=object)
+    is_ok = np.ones(len(values), dtype=bool)
+
+    for part in rule.parts:
+        if isinstance(part, TextRulePart):
+            if part.text:
+                texts += part.text
+        elif isinstance(part, PluralFormatPart):
+            if part.function_name:
+                texts[is_ok] += np.array(
+                    [part.render(int(value)) for value in values[is_ok]], dtype=object
+                )
+        elif isinstance(part, SubRulePart):
+            if part.type == SubType.QUOTIENT:
+                sub_values = quotients
+            elif part.type == SubType.REMAINDER:
+                sub_values = remainders
+            else:
+                continue
+
+            sub_mask = is_ok.copy()
+            if part.is_optional or (part.ruleset_name is None):
+                # Rulesets can use quotients/remainders of zero
+                sub_mask &= sub_values != 0
+
+            if not sub_mask.any():
+                continue
+
+            sub_texts, sub_ok = _format_values(
+                engine, part.ruleset_name or ruleset_name, sub_values[sub_mask]
+            )
+            texts[sub_mask] += part.text_before + sub_texts + part.text_after
+            is_ok[sub_mask] = sub_ok
+        elif isinstance(part, ReplaceRulePart):
+            sub_mask = is_ok.copy()
+            if not sub_mask.any():
+                continue
+
+            sub_texts, sub_ok = _format_values(
+                engine, part.ruleset_name, values[sub_mask]
+            )
+            texts[sub_mask] += sub_texts
+            is_ok[sub_mask] = sub_ok
+
+    return texts, is_ok
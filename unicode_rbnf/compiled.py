@@ -0,0 +1,503 @@
+"""Compiled engines in a flat, read-only buffer.
+
+Loaded rulesets are written to a single buffer of fixed-size records plus a
+string table. A MappedEngine formats numbers by reading rules directly from
+that buffer, which is usually a file opened with mmap. Pre-fork workers that
+inherit (or open) the same file share a single physical copy of the rules,
+since nothing in the buffer is ever written to.
+
+Buffers use native byte order and are meant to be compiled on the machine that
+reads them.
+"""
+
+import gc
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from . import __version__
+from .engine import (
+    _LANG_DIR,
+    PluralFormatPart,
+    RbnfEngine,
+    RbnfRule,
+    RbnfRulePart,
+    RbnfRuleSet,
+    RbnfSpecialRule,
+    ReplaceRulePart,
+    SubRulePart,
+    SubType,
+    TextRulePart,
+)
+
+_MAGIC = b"RBNF"
+_VERSION = 2
+_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+_NO_STRING = 0xFFFFFFFF
+_MAX_VALUE = (2**63) - 1
+
+# magic, version, byte order, language, ruleset count, and section offsets
+# (rules, parts, string records, string bytes, values).
+# Ruleset records follow the header.
+_HEADER = struct.Struct("=4sHHIIIIIII")
+
+# name, is_private, first numeric rule, numeric count, first special, special count
+_RULESET = struct.Struct("=IIIIII")
+
+# value (number or special rule index), radix, first part, part count
+_RULE = struct.Struct("=qIII")
+
+# kind, sub type, flags, padding, 5 string ids (meaning depends on kind)
+_PART = struct.Struct("=BBBxIIIII")
+
+_FLAG_OPTIONAL = 1
+_FLAG_WITH_ZEROS = 2
+
+# string offset and length
+_STRING = struct.Struct("=II")
+
+_SPECIAL_RULES: List[RbnfSpecialRule] = list(RbnfSpecialRule)
+_SPECIAL_RULE_INDEX: Dict[RbnfSpecialRule, int] = {
+    special_rule: idx for idx, special_rule in enumerate(_SPECIAL_RULES)
+}
+
+_KIND_TEXT = 0
+_KIND_SUB = 1
+_KIND_REPLACE = 2
+_KIND_PLURAL = 3
+
+_SUB_TYPES: List[SubType] = list(SubType)
+
+BufferType = Union[bytes, bytearray, mmap.mmap, memoryview]
+
+
+class _StringTableBuilder:
+    """Deduplicated strings for compilation."""
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+
+    def add(self, text: Optional[str]) -> int:
+        if text is None:
+            return _NO_STRING
+
+        string_id = self.ids.get(text)
+        if string_id is None:
+            string_id = len(self.ids)
+            self.ids[text] = string_id
+
+        return string_id
+
+
+def compile_engine(engine: RbnfEngine) -> bytes:
+    """Compile the rulesets of an engine into a flat buffer."""
+    strings = _StringTableBuilder()
+    ruleset_records: List[bytes] = []
+    rule_records: List[bytes] = []
+    part_records: List[bytes] = []
+
+    # Parallel to rule records, so numeric rule values can be bisected
+    values: List[int] = []
+
+    def add_rule(rule: RbnfRule, rule_value: int) -> None:
+        rule_records.append(
+            _RULE.pack(rule_value, rule.radix, len(part_records), len(rule.parts))
+        )
+        values.append(rule_value)
+        for part in rule.parts:
+            part_records.append(_pack_part(part, strings))
+
+    for ruleset_name, ruleset in engine.rulesets.items():
+        first_numeric = len(rule_records)
+        for rule_number in sorted(ruleset.numeric_rules):
+            if abs(rule_number) > _MAX_VALUE:
+                raise ValueError(f"Rule value is too large: {rule_number}")
+
+            add_rule(ruleset.numeric_rules[rule_number], rule_number)
+
+        first_special = len(rule_records)
+        for special_rule, rule in ruleset.special_rules.items():
+            add_rule(rule, _SPECIAL_RULE_INDEX[special_rule])
+
+        ruleset_records.append(
+            _RULESET.pack(
+                strings.add(ruleset_name),
+                int(ruleset.is_private),
+                first_numeric,
+                first_special - first_numeric,
+                first_special,
+                len(rule_records) - first_special,
+            )
+        )
+
+    language_id = strings.add(engine.language)
+
+    # String table
+    string_records: List[bytes] = []
+    string_blob = bytearray()
+    for text in strings.ids:
+        text_bytes = text.encode("utf-8")
+        string_records.append(_STRING.pack(len(string_blob), len(text_bytes)))
+        string_blob.extend(text_bytes)
+
+    sections: List[bytes] = [
+        b"".join(ruleset_records),
+        b"".join(rule_records),
+        b"".join(part_records),
+        b"".join(string_records),
+        bytes(string_blob),
+    ]
+    offset = _HEADER.size
+    offsets: List[int] = []
+    for section in sections:
+        offsets.append(offset)
+        offset += len(section)
+
+    # Values are aligned to 8 bytes for memoryview.cast
+    padding = (-offset) % 8
+    values_offset = offset + padding
+
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        _BYTE_ORDER,
+        language_id,
+        len(ruleset_records),
+        offsets[1],
+        offsets[2],
+        offsets[3],
+        offsets[4],
+        values_offset,
+    )
+
+    return b"".join(
+        [header]
+        + sections
+        + [b"\0" * padding, struct.pack(f"={len(values)}q", *values)]
+    )
+
+
+def save_compiled(engine: RbnfEngine, path: Union[str, Path]) -> None:
+    """Compile an engine and write it to a file."""
+    Path(path).write_bytes(compile_engine(engine))
+
+
+def _pack_part(part: RbnfRulePart, strings: _StringTableBuilder) -> bytes:
+    if isinstance(part, TextRulePart):
+        return _PART.pack(
+            _KIND_TEXT, 0, 0, strings.add(part.text), _NO_STRING, _NO_STRING, 0, 0
+        )
+
+    if isinstance(part, SubRulePart):
+        return _PART.pack(
+            _KIND_SUB,
+            _SUB_TYPES.index(part.type),
+            (_FLAG_OPTIONAL if part.is_optional else 0)
+            | (_FLAG_WITH_ZEROS if part.with_zeros else 0),
+            strings.add(part.text_before),
+            strings.add(part.text_after),
+            strings.add(part.ruleset_name),
+            strings.add(part.format_pattern),
+            0,
+        )
+
+    if isinstance(part, ReplaceRulePart):
+        return _PART.pack(
+            _KIND_REPLACE,
+            0,
+            0,
+            strings.add(part.ruleset_name),
+            _NO_STRING,
+            _NO_STRING,
+            0,
+            0,
+        )
+
+    if isinstance(part, PluralFormatPart):
+        return _PART.pack(
+            _KIND_PLURAL,
+            0,
+            _FLAG_OPTIONAL if part.is_optional else 0,
+            strings.add(part.function_name),
+            strings.add(part.function_value),
+            strings.add(part.text_after),
+            0,
+            0,
+        )
+
+    raise ValueError(f"Unsupported rule part: {part}")
+
+
+class _CompiledData:
+    """Read-only access to a compiled buffer."""
+
+    def __init__(self, buffer: BufferType) -> None:
+        self.buffer = buffer
+        (
+            magic,
+            version,
+            byte_order,
+            self.language_id,
+            self.num_rulesets,
+            self.rules_offset,
+            self.parts_offset,
+            self.strings_offset,
+            self.blob_offset,
+            self.values_offset,
+        ) = _HEADER.unpack_from(buffer, 0)
+
+        if magic != _MAGIC:
+            raise ValueError("Not a compiled rbnf buffer")
+
+        if version != _VERSION:
+            raise ValueError(f"Unsupported compiled version: {version}")
+
+        if byte_order != _BYTE_ORDER:
+            raise ValueError("Compiled buffer has a different byte order")
+
+        self.values: Sequence[int] = memoryview(buffer)[self.values_offset :].cast("q")
+
+    def get_string(self, string_id: int) -> Optional[str]:
+        if string_id == _NO_STRING:
+            return None
+
+        offset, length = _STRING.unpack_from(
+            self.buffer, self.strings_offset + (string_id * _STRING.size)
+        )
+        start = self.blob_offset + offset
+        return str(self.buffer[start : start + length], "utf-8")
+
+    def get_rule(self, rule_idx: int, is_special: bool = False) -> RbnfRule:
+        rule_value, radix, first_part, num_parts = _RULE.unpack_from(
+            self.buffer, self.rules_offset + (rule_idx * _RULE.size)
+        )
+        return RbnfRule(
+            value=_SPECIAL_RULES[rule_value] if is_special else rule_value,
+            radix=radix,
+            parts=[self.get_part(first_part + i) for i in range(num_parts)],
+        )
+
+    def get_part(self, part_idx: int) -> RbnfRulePart:
+        kind, sub_type, flags, str_1, str_2, str_3, str_4, _str_5 = _PART.unpack_from(
+            self.buffer, self.parts_offset + (part_idx * _PART.size)
+        )
+        get_string = self.get_string
+        if kind == _KIND_TEXT:
+            return TextRulePart(get_string(str_1) or "")
+
+        if kind == _KIND_SUB:
+            return SubRulePart(
+                _SUB_TYPES[sub_type],
+                is_optional=bool(flags & _FLAG_OPTIONAL),
+                text_before=get_string(str_1) or "",
+                text_after=get_string(str_2) or "",
+                ruleset_name=get_string(str_3),
+                format_pattern=get_string(str_4),
+                with_zeros=bool(flags & _FLAG_WITH_ZEROS),
+            )
+
+        if kind == _KIND_REPLACE:
+            return ReplaceRulePart(get_string(str_1) or "")
+
+        return PluralFormatPart(
+            function_name=get_string(str_1) or "",
+            function_value=get_string(str_2) or "",
+            is_optional=bool(flags & _FLAG_OPTIONAL),
+            text_after=get_string(str_3) or "",
+        )
+
+
+class _NumericRulesView(Mapping[int, RbnfRule]):
+    """Numeric rules of a ruleset, decoded from the buffer on access."""
+
+    def __init__(self, data: _CompiledData, first_rule: int, num_rules: int) -> None:
+        self.data = data
+        self.first_rule = first_rule
+        self.rule_numbers = data.values[first_rule : first_rule + num_rules]
+
+    def __getitem__(self, rule_number: int) -> RbnfRule:
+        rule_offset = bisect_left(self.rule_numbers, rule_number)
+        if (rule_offset >= len(self.rule_numbers)) or (
+            self.rule_numbers[rule_offset] != rule_number
+        ):
+            raise KeyError(rule_number)
+
+        return self.data.get_rule(self.first_rule + rule_offset)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.rule_numbers)
+
+    def __len__(self) -> int:
+        return len(self.rule_numbers)
+
+
+class _SpecialRulesView(Mapping[RbnfSpecialRule, RbnfRule]):
+    """Special rules of a ruleset, decoded from the buffer on access."""
+
+    def __init__(self, data: _CompiledData, first_rule: int, num_rules: int) -> None:
+        self.data = data
+
+        # Only the rule indexes are kept in memory
+        self.rule_idxs: Dict[RbnfSpecialRule, int] = {}
+        for rule_idx in range(first_rule, first_rule + num_rules):
+            special_idx = _RULE.unpack_from(
+                data.buffer, data.rules_offset + (rule_idx * _RULE.size)
+            )[0]
+            self.rule_idxs[_SPECIAL_RULES[special_idx]] = rule_idx
+
+    def __getitem__(self, special_rule: RbnfSpecialRule) -> RbnfRule:
+        return self.data.get_rule(self.rule_idxs[special_rule], is_special=True)
+
+    def __iter__(self) -> Iterator[RbnfSpecialRule]:
+        return iter(self.rule_idxs)
+
+    def __len__(self) -> int:
+        return len(self.rule_idxs)
+
+
+class MappedRuleSet(RbnfRuleSet):
+    """Ruleset whose rules are read from a compiled buffer."""
+
+    def update(self) -> None:
+        """Sorted numbers are already in the buffer."""
+
+
+class MappedEngine(RbnfEngine):
+    """Frozen engine that reads its rules from a compiled buffer."""
+
+    def __init__(self, buffer: BufferType) -> None:
+        data = _CompiledData(buffer)
+        language = data.get_string(data.language_id)
+        assert language is not None
+        super().__init__(language)
+
+        self._data = data
+        self._mmap: Optional[mmap.mmap] = None
+
+        for ruleset_idx in range(data.num_rulesets):
+            (
+                name_id,
+                is_private,
+                first_numeric,
+                num_numeric,
+                first_special,
+                num_special,
+            ) = _RULESET.unpack_from(
+                data.buffer, _HEADER.size + (ruleset_idx * _RULESET.size)
+            )
+            ruleset_name = data.get_string(name_id)
+            assert ruleset_name is not None
+            numeric_rules = _NumericRulesView(data, first_numeric, num_numeric)
+            ruleset = MappedRuleSet(
+                name=ruleset_name,
+                numeric_rules=numeric_rules,  # type: ignore[arg-type]
+                special_rules=_SpecialRulesView(  # type: ignore[arg-type]
+                    data, first_special, num_special
+                ),
+                is_private=bool(is_private),
+                _sorted_numbers=numeric_rules.rule_numbers,  # type: ignore[arg-type]
+            )
+            self.rulesets[ruleset_name] = ruleset
+
+        self.freeze()
+
+    @staticmethod
+    def open(path: Union[str, Path]) -> "MappedEngine":
+        """Open a compiled file with mmap (read-only)."""
+        with open(path, "rb") as compiled_file:
+            mapped = mmap.mmap(compiled_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        engine = MappedEngine(mapped)
+        engine._mmap = mapped  # pylint: disable=protected-access
+        return engine
+
+    def to_engine(self) -> RbnfEngine:
+        """Decode all rules into a regular (unfrozen) engine."""
+        engine = RbnfEngine(self.language)
+        for ruleset_name, ruleset in self.rulesets.items():
+            engine.rulesets[ruleset_name] = RbnfRuleSet(
+                name=ruleset_name,
+                numeric_rules=dict(ruleset.numeric_rules.items()),
+                special_rules=dict(ruleset.special_rules.items()),
+                is_private=ruleset.is_private,
+            )
+
+        return engine
+
+
+def get_cache_key(language: str) -> str:
+    """Key of a language's compiled file (changes with the package or rules)."""
+    xml_path = _LANG_DIR / f"{language}.xml"
+    if not xml_path.is_file():
+        raise ValueError(f"{language} is not supported")
+
+    key_hash = hashlib.sha256(f"{__version__}\0{_VERSION}\0".encode("utf-8"))
+    key_hash.update(xml_path.read_bytes())
+    return key_hash.hexdigest()[:16]
+
+
+def _write_compiled(engine: RbnfEngine, compiled_path: Path) -> None:
+    """Compile to a temporary file of this process, then move it into place.
+
+    Processes that compile the same file at once each write their own temporary
+    file, and the last rename wins (the files are identical).
+    """
+    compiled_bytes = compile_engine(engine)
+    with tempfile.NamedTemporaryFile(
+        dir=compiled_path.parent,
+        prefix=f"{compiled_path.name}.",
+        suffix=".tmp",
+        delete=False,
+    ) as temp_file:
+        temp_path = Path(temp_file.name)
+
+    try:
+        temp_path.write_bytes(compiled_bytes)
+        os.replace(temp_path, compiled_path)
+    finally:
+        # Only left behind if writing or renaming failed
+        temp_path.unlink(missing_ok=True)
+
+
+def preload(
+    languages: Iterable[str],
+    cache_dir: Union[str, Path],
+    freeze_gc: bool = True,
+) -> Dict[str, MappedEngine]:
+    """Compile (if needed) and open mapped engines before forking workers.
+
+    Compiled files are kept in cache_dir, named by a key of the package
+    version, the compiled format version, and the language's XML rules (see
+    get_cache_key). A file is rebuilt when its key changes, and compiled files
+    with other keys for the language are removed. With freeze_gc, all objects
+    that exist now are moved to the permanent GC generation (gc.freeze) so
+    collections in workers don't touch their pages.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    engines: Dict[str, MappedEngine] = {}
+    for language in languages:
+        compiled_path = cache_dir / f"{language}.{get_cache_key(language)}.rbnf"
+        if not compiled_path.is_file():
+            _write_compiled(RbnfEngine.for_language(language), compiled_path)
+
+            # Other processes may be adding or removing files here too
+            for stale_path in list(cache_dir.glob(f"{language}.*.rbnf")):
+                if stale_path != compiled_path:
+                    # Workers that mapped it keep their copy
+                    stale_path.unlink(missing_ok=True)
+
+        engines[language] = MappedEngine.open(compiled_path)
+
+    if freeze_gc:
+        gc.collect()
+        gc.freeze()
+
+    return engines
@@ -5,16 +5,44 @@ Uses XML files from the CLDR: https://cldr.unicode.org
 
 import logging
 import re
+import sys
+import threading
+import time
 from abc import ABC
 from bisect import bisect_left
 from dataclasses import dataclass, field
-from decimal import Decimal
+from decimal import ROUND_HALF_EVEN, Decimal
 from enum import Enum, IntFlag, auto
-from math import ceil, floor, isinf, isnan, log
+from itertools import chain, islice
+from math import isinf, isnan
 from pathlib import Path
-from typing import Dict, Final, Iterable, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from xml.etree import ElementTree as et
 
+from .graph import (
+    RulesetGraph,
+    build_ruleset_graph,
+    find_text_references,
+    is_format_pattern,
+)
+from .number_input import _DIGITS, NumberParser, ParsedNumber
+from .tokens import FormatToken, Vocabulary, iter_tokens
+
+if TYPE_CHECKING:
+    from .warmup import UsageRecorder
+
 DEFAULT_TOLERANCE: Final = 1e-8
 SKIP_RULESETS: Final = {"lenient-parse"}
 
@@ -24,6 +52,24 @@ _LOGGER = logging.getLogger()
 # Don't load these XML files
 _EXCLUDED_XML_NAMES: Set[str] = {"root", "es_419", "en_001", "nb"}
 
+# Characters with a meaning in rule text (see RbnfRule.parse)
+_RULE_SYNTAX_CHARS: Final = frozenset(";'>→<←%$[]=")
+
+# Run of literal characters or a single syntax character
+_RULE_TOKEN: Final = re.compile(r"[^;'>→<←%$\[\]=]+|.", re.DOTALL)
+
+# Characters of a decimal format pattern in << or >> (e.g., #,##0.00)
+_FORMAT_PATTERN: Final = re.compile(r"[#0,.]*")
+
+# Maximum number of rules (and parts) shared between engines
+_SHARED_RULES_MAX_SIZE: Final = 100_000
+
+# Groups of digits below this are rendered once per ruleset (see format_digits)
+_DIGIT_TABLE_SIZE: Final = 100
+
+# Characters between runs of digits that format_digits reads separately
+_DIGIT_RUN_SEPARATOR: Final = re.compile(r"[\s\-./()]+")
+
 
 class FormatOptions(IntFlag):
     """Extra options for formatting."""
@@ -76,6 +122,24 @@ class FormatResult:
     """Formatted text for each ruleset."""
 
 
+@dataclass(frozen=True)
+class FormatLimits:
+    """Limits on the work done by a single formatting call.
+
+    Limits are checked while rendering, so malformed rules (e.g., a cycle of
+    =%ruleset= replacements) fail early with a FormatLimitError.
+    """
+
+    max_depth: Optional[int] = 100
+    """Maximum nesting of substitutions and replacements (None for no limit)."""
+
+    max_parts: Optional[int] = 100_000
+    """Maximum number of text parts rendered by a ruleset (None for no limit)."""
+
+    timeout: Optional[float] = None
+    """Seconds a call may take (None for no deadline)."""
+
+
 class RbnfError(Exception):
     """Base class for errors."""
 
@@ -88,6 +152,35 @@ class NoRuleForNumberError(RbnfError):
     """No matching rule could be found for a number."""
 
 
+class EngineFrozenError(RbnfError):
+    """Engine was modified after being frozen."""
+
+
+class FormatLimitError(RbnfError):
+    """A limit was exceeded while formatting (see FormatLimits)."""
+
+
+class RecursionLimitError(FormatLimitError):
+    """Substitutions were nested deeper than FormatLimits.max_depth."""
+
+
+class PartsLimitError(FormatLimitError):
+    """More text parts than FormatLimits.max_parts were rendered."""
+
+
+class DeadlineExceededError(FormatLimitError):
+    """Formatting took longer than FormatLimits.timeout."""
+
+
+class RbnfParseError(RbnfError, ValueError):
+    """Rule text could not be parsed."""
+
+    def __init__(self, message: str, text: str, position: int) -> None:
+        super().__init__(f"{message} at position {position} of rule: {text!r}")
+        self.text = text
+        self.position = position
+
+
 class RbnfRulePart(ABC):
     """Abstract base class for rule parts."""
 
@@ -145,6 +238,9 @@ class SubRulePart(RbnfRulePart):
     format_pattern: Optional[str] = None
     """DecimalFormat pattern (e.g., #,##0.00)."""
 
+    with_zeros: bool = False
+    """True if leading zeros of a fraction's numerator are read (<%ruleset<<)."""
+
 
 @dataclass
 class ReplaceRulePart(RbnfRulePart):
@@ -164,6 +260,12 @@ class PluralFormatPart(RbnfRulePart):
     function_value: str = ""
     """Value to use for fucntion substitution."""
 
+    is_optional: bool = False
+    """True if inside an optional section (skipped with its substitution)."""
+
+    text_after: str = ""
+    """Text to insert after plural in an optional section."""
+
     previous_state: Optional[ParseState] = None
     """Previous state of parser."""
 
@@ -173,9 +275,12 @@ class PluralFormatPart(RbnfRulePart):
     def render(self, number: Union[int, float, Decimal]) -> str:
         """Render function with value."""
         count_zero = self.function_value.count("0")
-        name_value = str(number)[:-count_zero]
-        value = Decimal(name_value[-1:])
-        value_many = Decimal(name_value[-2:])
+        return self.render_count(int(number) // (10**count_zero))
+
+    def render_count(self, count: int) -> str:
+        """Render function for the count it applies to (e.g., 3 for 3000)."""
+        value = count % 10
+        value_many = count % 100
 
         clean_fn = self.function_name.replace("cardinal,", "").replace("ordinal,", "")
 
@@ -231,6 +336,29 @@ class RbnfSpecialRule(str, Enum):
     IMPROPER_FRACTION = "improper_fraction"
     """The rule for improper fractions (x.x)"""
 
+    PROPER_FRACTION = "proper_fraction"
+    """The rule for proper fractions between 0 and 1 (0.x)"""
+
+    DEFAULT_RULE = "default_rule"
+    """The rule for fractions when no other fraction rule applies (x.0)"""
+
+
+def _get_rule_powers(value: int, radix: int) -> Tuple[int, int]:
+    """Get powers of radix below and above a rule value (exact)."""
+    value_str = str(value)
+    if (len(value_str) > 1) and (value_str[0] != "1"):
+        # Only the number of digits matters
+        value = int("1" + value_str[1:])
+
+    power_below = 1
+    while (power_below * radix) <= value:
+        power_below *= radix
+
+    if power_below == value:
+        return power_below, power_below
+
+    return power_below, power_below * radix
+
 
 @dataclass
 class RbnfRule:
@@ -245,59 +373,120 @@ class RbnfRule:
     radix: int = 10
     """Radix used when calculating divisor."""
 
+    _power_below: int = field(default=1, init=False, repr=False, compare=False)
+    """Divisor for numbers below _power_above."""
+
+    _power_above: int = field(default=1, init=False, repr=False, compare=False)
+    """Divisor for numbers at or above this power."""
+
+    def __post_init__(self) -> None:
+        if isinstance(self.value, int) and (self.value > 0):
+            self._power_below, self._power_above = _get_rule_powers(
+                self.value, self.radix
+            )
+
+    def has_format_pattern(self) -> bool:
+        """True if rule uses a decimal format pattern (e.g., =#,##0=)."""
+        return any(
+            isinstance(part, ReplaceRulePart) and is_format_pattern(part.ruleset_name)
+            for part in self.parts
+        )
+
+    def get_divisors(self) -> Tuple[int, int]:
+        """Get divisors for numbers below and at or above the upper power."""
+        return self._power_below, self._power_above
+
+    def get_divisor(self, number: Union[int, float, Decimal]) -> int:
+        """Get divisor used to split number into quotient and remainder."""
+        if number >= self._power_above:
+            return self._power_above
+
+        return self._power_below
+
     @staticmethod
     def parse(value_str: str, text: str, radix: int = 10) -> "Optional[RbnfRule]":
-        """Parse RBNF rule for a value."""
-        # Handle special rules
-        if value_str == "-x":
-            rule = RbnfRule(value=RbnfSpecialRule.NEGATIVE_NUMBER)
-        elif value_str in ("x.x", "x,x"):
-            rule = RbnfRule(value=RbnfSpecialRule.IMPROPER_FRACTION)
-        elif value_str == "NaN":
-            rule = RbnfRule(value=RbnfSpecialRule.NOT_A_NUMBER)
-        elif value_str == "Inf":
-            rule = RbnfRule(value=RbnfSpecialRule.INFINITY)
-        else:
-            try:
-                rule = RbnfRule(value=int(value_str), radix=radix)
-            except ValueError:
-                _LOGGER.debug(
-                    "Unrecognized special rule: value=%s, text=%s", value_str, text
-                )
-                return None
+        """Parse RBNF rule for a value.
+
+        Rule text is split into runs of literal characters and single syntax
+        characters in one pass. Raises RbnfParseError if text is invalid.
+        """
+        rule = RbnfRule._create(value_str, text, radix)
+        if rule is None:
+            return None
 
+        parts = rule.parts
         state = ParseState.TEXT
         part: Optional[RbnfRulePart] = None
         is_sub_optional = False
         sub_text_before = ""
-        skip_next_char = False
+        skip_position = -1
+
+        for match in _RULE_TOKEN.finditer(text):
+            token = match.group()
+            x = match.start()
+
+            if token not in _RULE_SYNTAX_CHARS:
+                # Run of literal characters
+                if state == ParseState.TEXT:
+                    if part is None:
+                        part = TextRulePart(token)
+                        parts.append(part)
+                    else:
+                        assert isinstance(part, TextRulePart)
+                        part.text += token
+                elif state == ParseState.SUB_OPTIONAL_BEFORE:
+                    # [before ...]
+                    sub_text_before += token
+                elif state == ParseState.SUB_OPTIONAL_AFTER:
+                    # [... after]
+                    assert isinstance(part, (SubRulePart, PluralFormatPart))
+                    part.text_after += token
+                elif state == ParseState.SUB_PLURAL_FORMAT:
+                    assert isinstance(part, PluralFormatPart)
+                    part.function_name += token.replace("(", "").replace(")", "")
+                elif state == ParseState.SUB_RULESET_NAME:
+                    # %ruleset_name in << or >>
+                    assert isinstance(part, SubRulePart)
+                    part.ruleset_name = (part.ruleset_name or "") + token
+                elif state == ParseState.REPLACE_RULESET_NAME:
+                    # =%ruleset_name=
+                    assert isinstance(part, ReplaceRulePart)
+                    part.ruleset_name += token
+                else:
+                    # decimal format pattern (e.g., #,##0.00)
+                    assert isinstance(part, SubRulePart)
+                    pattern_end = _FORMAT_PATTERN.match(token).end()  # type: ignore[union-attr]
+                    if pattern_end < len(token):
+                        raise RbnfParseError(
+                            f"Unexpected {token[pattern_end]!r} in {state.value}",
+                            text,
+                            x + pattern_end,
+                        )
+
+                    part.format_pattern = (part.format_pattern or "") + token
 
-        for x, c in enumerate(text):
-            if skip_next_char:
-                skip_next_char = False
                 continue
 
-            if c == ";":
+            if token == ";":
                 # End of rule text
                 break
 
-            if c == "'":
+            if token == "'":
                 # Placeholder
                 continue
 
-            next_c: Optional[str] = None
-            if (x + 1) < len(text):
-                next_c = text[x + 1]
-
-            if c in (">", "→"):
+            if token in (">", "→"):
                 # Divide the number by the rule's divisor and format the remainder
-                if state in {ParseState.TEXT, ParseState.SUB_OPTIONAL_BEFORE}:
+                if x == skip_position:
+                    continue
+
+                if state in (ParseState.TEXT, ParseState.SUB_OPTIONAL_BEFORE):
                     state = ParseState.SUB_REMAINDER
 
-                    if rule.parts and isinstance(rule.parts[-1], TextRulePart):
+                    if parts and isinstance(parts[-1], TextRulePart):
                         # Shift whitespace before arrow here.
                         # This is so it separates words in fractional mode.
-                        prev_text_part: TextRulePart = rule.parts[-1]
+                        prev_text_part: TextRulePart = parts[-1]
                         prev_text_stripped = prev_text_part.text.rstrip()
                         prev_whitespace = prev_text_part.text[len(prev_text_stripped) :]
                         prev_text_part.text = prev_text_stripped
@@ -308,15 +497,14 @@ class RbnfRule:
                         is_optional=is_sub_optional,
                         text_before=sub_text_before,
                     )
-                    rule.parts.append(part)
+                    parts.append(part)
                     sub_text_before = ""
-
-                elif state in {ParseState.SUB_REMAINDER, ParseState.SUB_RULESET_NAME}:
-                    if next_c in (">", "→"):
+                elif state in (ParseState.SUB_REMAINDER, ParseState.SUB_RULESET_NAME):
+                    if text[x + 1 : x + 2] in (">", "→"):
                         # Ignore final arrow in triple arrow.
                         # It means to render digit-by-digit, which we already do
                         # in "fractional" mode.
-                        skip_next_char = True
+                        skip_position = x + 1
 
                     if is_sub_optional:
                         state = ParseState.SUB_OPTIONAL_AFTER
@@ -324,123 +512,198 @@ class RbnfRule:
                         state = ParseState.TEXT
                         part = None
                 else:
-                    raise ValueError(f"Got {c} in {state}")
-            elif c in ("<", "←"):
+                    raise RbnfParseError(
+                        f"Unexpected {token!r} in {state.value}", text, x
+                    )
+            elif token in ("<", "←"):
                 # Divide the number by the rule's divisor and format the quotient
-                if state in {ParseState.TEXT, ParseState.SUB_OPTIONAL_BEFORE}:
+                if x == skip_position:
+                    continue
+
+                if state in (ParseState.TEXT, ParseState.SUB_OPTIONAL_BEFORE):
                     state = ParseState.SUB_QUOTIENT
                     part = SubRulePart(SubType.QUOTIENT, is_optional=is_sub_optional)
-                    rule.parts.append(part)
-                elif state in {ParseState.SUB_QUOTIENT, ParseState.SUB_RULESET_NAME}:
+                    parts.append(part)
+                elif state in (ParseState.SUB_QUOTIENT, ParseState.SUB_RULESET_NAME):
+                    if (state == ParseState.SUB_RULESET_NAME) and (
+                        text[x + 1 : x + 2] in ("<", "←")
+                    ):
+                        # Final arrow in <%ruleset<< reads leading zeros of a
+                        # fraction's numerator.
+                        assert isinstance(part, SubRulePart)
+                        # pylint: disable=attribute-defined-outside-init
+                        part.with_zeros = True
+                        skip_position = x + 1
+
                     if is_sub_optional:
                         state = ParseState.SUB_OPTIONAL_AFTER
                     else:
                         state = ParseState.TEXT
                         part = None
                 else:
-                    raise ValueError(f"Got {c} in {state}")
-            elif c == "%":
+                    raise RbnfParseError(
+                        f"Unexpected {token!r} in {state.value}", text, x
+                    )
+            elif token == "%":
                 # =%rule_name= replacement
-                if state in {ParseState.SUB_QUOTIENT, ParseState.SUB_REMAINDER}:
-                    assert isinstance(part, SubRulePart)
+                if isinstance(part, SubRulePart) and (
+                    state in (ParseState.SUB_QUOTIENT, ParseState.SUB_REMAINDER)
+                ):
+                    # pylint: disable=attribute-defined-outside-init
                     state = ParseState.SUB_RULESET_NAME
                     part.ruleset_name = ""
-                elif state in {
+                elif state not in (
                     ParseState.REPLACE_RULESET_NAME,
                     ParseState.SUB_RULESET_NAME,
-                }:
-                    pass
-                else:
-                    raise ValueError(f"Got {c} in {state}")
-            elif c == "$":
+                ):
+                    raise RbnfParseError(
+                        f"Unexpected {token!r} in {state.value}", text, x
+                    )
+            elif token == "$":
                 # $(cardinal,plural syntax)$, $(ordinal,plural syntax)$
-                if text[x + 1] == "(":
-                    _previous_state = state
-                    _previous_part = part
+                if text[x + 1 : x + 2] == "(":
+                    part = PluralFormatPart(
+                        function_value=value_str,
+                        is_optional=(state == ParseState.SUB_OPTIONAL_AFTER),
+                        previous_state=state,
+                        previous_part=part,
+                    )
                     state = ParseState.SUB_PLURAL_FORMAT
-                    part = PluralFormatPart()
-                    part.function_value = value_str
-                    part.previous_state = _previous_state
-                    part.previous_part = _previous_part
-                elif state == ParseState.SUB_PLURAL_FORMAT and text[x - 1] == ")":
-                    assert isinstance(part, PluralFormatPart)
+                elif isinstance(part, PluralFormatPart) and (
+                    (state == ParseState.SUB_PLURAL_FORMAT) and (text[x - 1] == ")")
+                ):
+                    # pylint: disable=no-member
                     assert part.previous_state is not None
-                    rule.parts.append(part)
+                    parts.append(part)
                     state = part.previous_state
-                    part = part.previous_part
+                    if not part.is_optional:
+                        # Text after plural in an optional section stays in it
+                        part = part.previous_part
                 else:
-                    raise ValueError(f"Got {c} in {state} fot text: {text} (x: {x})")
-            elif c == "[":
+                    raise RbnfParseError(
+                        f"Unexpected {token!r} in {state.value}", text, x
+                    )
+            elif token == "[":
                 # [optional] (start)
-                if state == ParseState.TEXT:
-                    is_sub_optional = True
-                    state = ParseState.SUB_OPTIONAL_BEFORE
-                    sub_text_before = ""
-                else:
-                    raise ValueError(f"Got {c} in {state}")
-            elif c == "]":
+                if state != ParseState.TEXT:
+                    raise RbnfParseError(
+                        f"Unexpected {token!r} in {state.value}", text, x
+                    )
+
+                is_sub_optional = True
+                state = ParseState.SUB_OPTIONAL_BEFORE
+                sub_text_before = ""
+            elif token == "]":
                 # [optional] (end)
-                if state == ParseState.SUB_OPTIONAL_AFTER:
-                    is_sub_optional = False
-                    state = ParseState.TEXT
-                    part = None
-                else:
-                    raise ValueError(f"Got {c} in {state}")
-            elif c == "=":
+                if state != ParseState.SUB_OPTIONAL_AFTER:
+                    raise RbnfParseError(
+                        f"Unexpected {token!r} in {state.value}", text, x
+                    )
+
+                is_sub_optional = False
+                state = ParseState.TEXT
+                part = None
+            else:
                 # =%rule_name= replacement
                 if state == ParseState.TEXT:
                     part = ReplaceRulePart("")
-                    rule.parts.append(part)
+                    parts.append(part)
                     state = ParseState.REPLACE_RULESET_NAME
                 elif state == ParseState.REPLACE_RULESET_NAME:
                     part = None
                     state = ParseState.TEXT
                 else:
-                    raise ValueError(f"Got {c} in {state}")
-            elif state == ParseState.SUB_OPTIONAL_BEFORE:
-                # [before ...]
-                sub_text_before += c
-            elif state == ParseState.SUB_OPTIONAL_AFTER:
-                # [... after]
-                assert isinstance(part, SubRulePart)
-                part.text_after += c
-            elif state == ParseState.SUB_PLURAL_FORMAT:
-                assert isinstance(part, PluralFormatPart)
-                if c not in ["(", ")"]:
-                    part.function_name += c
-            elif state == ParseState.SUB_RULESET_NAME:
-                # %ruleset_name in << or >>
-                assert isinstance(part, SubRulePart)
-                assert part.ruleset_name is not None
-                part.ruleset_name += c
-            elif state == ParseState.REPLACE_RULESET_NAME:
-                # =%ruleset_name=
-                assert isinstance(part, ReplaceRulePart)
-                part.ruleset_name += c
-            elif state == ParseState.TEXT:
-                # literal text
-                if part is None:
-                    part = TextRulePart("")
-                    rule.parts.append(part)
-
-                assert isinstance(part, TextRulePart)
-                part.text += c
-            elif c in ("#", "0", ",", "."):
-                # decimal format pattern (e.g., #,##0.00)
-                assert isinstance(part, SubRulePart)
-                assert state in (
-                    ParseState.SUB_REMAINDER,
-                    ParseState.SUB_QUOTIENT,
-                ), state
-                if part.format_pattern is None:
-                    part.format_pattern = ""
-
-                part.format_pattern += c
-            else:
-                raise ValueError(f"Got {c} in {state}")
+                    raise RbnfParseError(
+                        f"Unexpected {token!r} in {state.value}", text, x
+                    )
 
         return rule
 
+    @staticmethod
+    def _create(value_str: str, text: str, radix: int) -> "Optional[RbnfRule]":
+        """Create empty rule from its value (None if not recognized)."""
+        # Handle special rules
+        if value_str == "-x":
+            rule = RbnfRule(value=RbnfSpecialRule.NEGATIVE_NUMBER)
+        elif value_str in ("x.x", "x,x"):
+            rule = RbnfRule(value=RbnfSpecialRule.IMPROPER_FRACTION)
+        elif value_str in ("0.x", "0,x"):
+            rule = RbnfRule(value=RbnfSpecialRule.PROPER_FRACTION)
+        elif value_str in ("x.0", "x,0"):
+            rule = RbnfRule(value=RbnfSpecialRule.DEFAULT_RULE)
+        elif value_str == "NaN":
+            rule = RbnfRule(value=RbnfSpecialRule.NOT_A_NUMBER)
+        elif value_str == "Inf":
+            rule = RbnfRule(value=RbnfSpecialRule.INFINITY)
+        else:
+            try:
+                rule = RbnfRule(value=int(value_str), radix=radix)
+            except ValueError:
+                _LOGGER.debug(
+                    "Unrecognized special rule: value=%s, text=%s", value_str, text
+                )
+                return None
+
+        return rule
+
+
+class _SharedRules:
+    """Identical rules and rule parts shared by every engine (hash-consing).
+
+    Rules are keyed by their value, text, and radix, so a rule that repeats
+    across rulesets or languages is only parsed and stored once. Parts of
+    different rules are shared if all of their fields are equal.
+
+    Shared rules and parts must not be modified. Once a table holds max_size
+    entries, new rules and parts are no longer shared.
+    """
+
+    def __init__(self, max_size: int = _SHARED_RULES_MAX_SIZE) -> None:
+        self.max_size = max_size
+
+        # (value, text, radix) -> rule
+        self._rules: Dict[Tuple[str, str, int], RbnfRule] = {}
+
+        # (part type, field values) -> part
+        self._parts: Dict[Tuple[Any, ...], RbnfRulePart] = {}
+
+    def parse(self, value_str: str, text: str, radix: int = 10) -> Optional[RbnfRule]:
+        """Parse a rule like RbnfRule.parse, sharing the result."""
+        key = (value_str, text, radix)
+        rule = self._rules.get(key)
+        if rule is not None:
+            return rule
+
+        rule = RbnfRule.parse(value_str, text, radix=radix)
+        if rule is None:
+            return None
+
+        rule.parts = [self._share_part(part) for part in rule.parts]
+        if len(self._rules) < self.max_size:
+            # Threads that parse the same rule end up with the same object
+            rule = self._rules.setdefault(key, rule)
+
+        return rule
+
+    def _share_part(self, part: RbnfRulePart) -> RbnfRulePart:
+        """Get shared part equal to part."""
+        if isinstance(part, PluralFormatPart):
+            # Refers to the part before it
+            return part
+
+        key = (type(part), *vars(part).values())
+        shared_part = self._parts.get(key)
+        if shared_part is not None:
+            return shared_part
+
+        if len(self._parts) >= self.max_size:
+            return part
+
+        return self._parts.setdefault(key, part)
+
+
+_SHARED_RULES = _SharedRules()
+
 
 @dataclass
 class RbnfRuleSet:
@@ -465,9 +728,20 @@ class RbnfRuleSet:
         """Force update to sorted key list."""
         self._sorted_numbers = sorted(self.numeric_rules.keys())
 
+    def get_sorted_numbers(self) -> List[int]:
+        """Get sorted numbers of numeric rules (updated if needed)."""
+        # Read once, since another thread may update it
+        sorted_numbers = self._sorted_numbers
+        if (sorted_numbers is None) or (len(sorted_numbers) != len(self.numeric_rules)):
+            self.update()
+            sorted_numbers = self._sorted_numbers
+
+        assert sorted_numbers is not None
+        return sorted_numbers
+
     def find_rule(
         self,
-        number: float,
+        number: Union[int, float, Decimal],
         tolerance: float = DEFAULT_TOLERANCE,
         rulesets: Optional[Dict[str, "RbnfRuleSet"]] = None,
     ) -> Optional[RbnfRule]:
@@ -477,27 +751,35 @@ class RbnfRuleSet:
         if number < 0:
             return self.find_special_rule(RbnfSpecialRule.NEGATIVE_NUMBER, rulesets)
 
-        if isnan(number):
-            return self.find_special_rule(RbnfSpecialRule.NOT_A_NUMBER, rulesets)
+        # Integers may be too large to convert to float
+        if not isinstance(number, int):
+            if isnan(number):
+                return self.find_special_rule(RbnfSpecialRule.NOT_A_NUMBER, rulesets)
+
+            if isinf(number):
+                return self.find_special_rule(RbnfSpecialRule.INFINITY, rulesets)
+
+            if abs(number - round(number)) > DEFAULT_TOLERANCE:  # type: ignore[operator]
+                if number < 1:
+                    rule = self.special_rules.get(RbnfSpecialRule.PROPER_FRACTION)
+                    if rule is not None:
+                        return rule
 
-        if isinf(number):
-            return self.find_special_rule(RbnfSpecialRule.INFINITY, rulesets)
+                rule = self.special_rules.get(RbnfSpecialRule.IMPROPER_FRACTION)
+                if rule is not None:
+                    return rule
 
-        if abs(number - round(number)) > DEFAULT_TOLERANCE:
-            return self.special_rules.get(RbnfSpecialRule.IMPROPER_FRACTION)
+                return self.special_rules.get(RbnfSpecialRule.DEFAULT_RULE)
 
         # Numeric rules
         number_int = int(number)
-        if (self._sorted_numbers is None) or (
-            len(self._sorted_numbers) != len(self.numeric_rules)
-        ):
-            self.update()
-
-        assert self._sorted_numbers is not None
+        sorted_numbers = self.get_sorted_numbers()
+        if not sorted_numbers:
+            return None
 
         # Find index of place where number would be inserted
-        index = bisect_left(self._sorted_numbers, number_int)
-        num_rules = len(self._sorted_numbers)
+        index = bisect_left(sorted_numbers, number_int)
+        num_rules = len(sorted_numbers)
 
         if index >= num_rules:
             # Last rule
@@ -506,44 +788,276 @@ class RbnfRuleSet:
             # First rule
             index = 0
 
-        rule_number = self._sorted_numbers[index]
+        rule_number = sorted_numbers[index]
         if number_int < rule_number:
             # Not an exact match, use one rule down
             index = max(0, index - 1)
-            rule_number = self._sorted_numbers[index]
+            rule_number = sorted_numbers[index]
 
         return self.numeric_rules.get(rule_number)
 
+    def get_scale(self, number: int) -> "Optional[RbnfScale]":
+        """Get highest scale word below the rule for a number (see BigNumberMode)."""
+        overflow_rule = self.find_rule(number)
+        if (overflow_rule is None) or (not isinstance(overflow_rule.value, int)):
+            return None
+
+        for rule_number in sorted(self.numeric_rules, reverse=True):
+            if rule_number >= overflow_rule.value:
+                continue
+
+            rule = self.numeric_rules[rule_number]
+            quotient_idx = next(
+                (
+                    part_idx
+                    for part_idx, part in enumerate(rule.parts)
+                    if isinstance(part, SubRulePart) and (part.type == SubType.QUOTIENT)
+                ),
+                None,
+            )
+            if quotient_idx is None:
+                continue
+
+            divisor = rule.get_divisor(rule_number)
+            if (divisor <= 1) or (str(divisor).strip("0") != "1"):
+                # Only powers of 10 can be split by digits
+                return None
+
+            suffix = ""
+            separator = " "
+            for part in rule.parts[quotient_idx + 1 :]:
+                if isinstance(part, TextRulePart):
+                    suffix += part.text
+                elif isinstance(part, PluralFormatPart):
+                    suffix += part.render(divisor * 5)
+                elif isinstance(part, SubRulePart):
+                    separator = part.text_before or separator
+                    break
+
+            return RbnfScale(
+                divisor=divisor,
+                suffix=suffix,
+                separator=separator,
+                max_value=overflow_rule.value,
+            )
+
+        return None
+
     def find_special_rule(
         self,
         special_rule: RbnfSpecialRule,
         rulesets: Optional[Dict[str, "RbnfRuleSet"]] = None,
     ) -> Optional[RbnfRule]:
         """Find special rule in this ruleset or in its 0-rule."""
-        rule = self.special_rules.get(special_rule)
-        if rule is not None:
-            return rule
+        ruleset: Optional[RbnfRuleSet] = self
+        visited_names: Set[str] = set()
+        while (ruleset is not None) and (ruleset.name not in visited_names):
+            rule = ruleset.special_rules.get(special_rule)
+            if rule is not None:
+                return rule
+
+            if rulesets is None:
+                # Can't resolve replacement rule
+                return None
 
-        if rulesets is None:
-            # Can't resolve replacement rule
-            return None
+            # Find the default replacement rule (stopping at cycles)
+            visited_names.add(ruleset.name)
+            zero_rule = ruleset.numeric_rules.get(0)
+            if not (
+                (zero_rule is not None)
+                and zero_rule.parts
+                and isinstance(zero_rule.parts[0], ReplaceRulePart)
+            ):
+                return None
 
-        # Find the default replacement rule
-        zero_rule = self.numeric_rules.get(0)
-        if (
-            (zero_rule is not None)
-            and zero_rule.parts
-            and isinstance(zero_rule.parts[0], ReplaceRulePart)
-        ):
+            # Try to resolve the special rule in the replacement
             replace_part: ReplaceRulePart = zero_rule.parts[0]
-            replace_rule = rulesets.get(replace_part.ruleset_name)
-            if replace_rule is not None:
-                # Try to resolve the special rule in the replacement
-                return replace_rule.find_special_rule(special_rule, rulesets)
+            ruleset = rulesets.get(replace_part.ruleset_name)
 
         return None
 
 
+class BigNumberMode(str, Enum):
+    """How to format numbers past the highest rule of a ruleset.
+
+    The highest rule of most rulesets is a decimal format like =#,##0=.
+    """
+
+    ERROR = "error"
+    """Raise NoRuleForNumberError (the ruleset is skipped)."""
+
+    DIGITS = "digits"
+    """Read digit by digit (one two three ...)."""
+
+    SCALE_WORDS = "scale_words"
+    """Repeat the highest scale word (one thousand quadrillion quadrillion)."""
+
+
+@dataclass
+class RbnfScale:
+    """Highest scale word of a ruleset (e.g., quadrillion)."""
+
+    divisor: int
+    """Value of scale word (power of 10)."""
+
+    suffix: str
+    """Text after the quotient (e.g., " quadrillion")."""
+
+    separator: str
+    """Text between a scaled quotient and the remainder."""
+
+    max_value: int
+    """Value of the first rule that can't be rendered."""
+
+
+@dataclass(frozen=True)
+class RbnfDomain:
+    """Numbers that a ruleset may be able to format.
+
+    Computed without rendering, by following references to other rulesets.
+    The domain is conservative: numbers outside of it are certain to fail with
+    BigNumberMode.ERROR, but numbers inside of it may still fail.
+    """
+
+    min_value: Optional[int]
+    """Lowest integer (None if negative numbers have a rule)."""
+
+    max_value: Optional[int]
+    """Highest integer (None if no limit was found, below min_value if none)."""
+
+    has_negative: bool
+    """True if negative numbers have a rule."""
+
+    has_proper_fraction: bool
+    """True if fractions between 0 and 1 have their own rule (0.x)."""
+
+    has_improper_fraction: bool
+    """True if fractions above 1 have a rule (x.x or x.0)."""
+
+    has_nan: bool
+    """True if NaN has a rule."""
+
+    has_infinity: bool
+    """True if infinity has a rule."""
+
+    def contains(self, number: Union[int, float, Decimal]) -> bool:
+        """False if number is certain to fail (see RbnfRuleSet.find_rule)."""
+        if number < 0:
+            return self.has_negative
+
+        if not isinstance(number, int):
+            if isnan(number):
+                return self.has_nan
+
+            if isinf(number):
+                return self.has_infinity
+
+            if abs(number - round(number)) > DEFAULT_TOLERANCE:  # type: ignore[operator]
+                if number < 1:
+                    return self.has_proper_fraction or self.has_improper_fraction
+
+                return self.has_improper_fraction
+
+        return (self.max_value is None) or (int(number) <= self.max_value)
+
+
+# Text with the ruleset name and rule value it came from
+_FormatPiece = Tuple[str, str, Union[int, RbnfSpecialRule]]
+
+_FRACTION_RULES: Final = {
+    RbnfSpecialRule.IMPROPER_FRACTION,
+    RbnfSpecialRule.PROPER_FRACTION,
+    RbnfSpecialRule.DEFAULT_RULE,
+}
+
+# Renderings of numbers below this are kept for a whole iter_range
+_RANGE_MEMO_LIMIT: Final = 10_000
+
+# Renderings of larger numbers are kept until there are this many
+_RANGE_RECENT_SIZE: Final = 1024
+
+# Number of recently used numeric rules remembered per ruleset in iter_range
+_RANGE_RULES_PER_RULESET: Final = 4
+
+# Kinds of rule parts in iter_range
+_RANGE_TEXT: Final = 0
+_RANGE_PLURAL: Final = 1
+_RANGE_QUOTIENT: Final = 2
+_RANGE_REMAINDER: Final = 3
+_RANGE_REPLACE: Final = 4
+
+# (kind, text or ruleset name, plural part, skip zero, text before, text after)
+_RangePart = Tuple[int, str, Optional[PluralFormatPart], bool, str, str]
+
+
+def _get_range_parts(rule: RbnfRule) -> List[_RangePart]:
+    """Flatten rule parts for iter_range (avoids isinstance checks per number)."""
+    range_parts: List[_RangePart] = []
+    for part in rule.parts:
+        if isinstance(part, TextRulePart):
+            if part.text:
+                range_parts.append((_RANGE_TEXT, part.text, None, False, "", ""))
+        elif isinstance(part, PluralFormatPart):
+            if part.function_name:
+                range_parts.append((_RANGE_PLURAL, "", part, False, "", ""))
+        elif isinstance(part, SubRulePart):
+            range_parts.append(
+                (
+                    (
+                        _RANGE_QUOTIENT
+                        if part.type == SubType.QUOTIENT
+                        else _RANGE_REMAINDER
+                    ),
+                    part.ruleset_name or "",
+                    None,
+                    part.is_optional or (part.ruleset_name is None),
+                    part.text_before,
+                    part.text_after,
+                )
+            )
+        elif isinstance(part, ReplaceRulePart):
+            range_parts.append((_RANGE_REPLACE, part.ruleset_name, None, False, "", ""))
+
+    return range_parts
+
+
+@dataclass
+class _RulesetAliases:
+    """Rulesets that render the same text as another (canonical) ruleset."""
+
+    all_numbers: Dict[str, str] = field(default_factory=dict)
+    """Alias -> canonical name for rulesets with identical rules."""
+
+    integers: Dict[str, str] = field(default_factory=dict)
+    """Same as all_numbers plus redirects, only valid for integers."""
+
+
+_DIGIT_TABLES_LOCK = threading.Lock()
+
+
+# (start, stop, parts, divisor below, divisor above) of a numeric rule
+_RuleRange = Tuple[int, int, List[_RangePart], int, int]
+
+
+@dataclass
+class _RangeMemo:
+    """Reused sub-results of iter_range."""
+
+    texts: Dict[Tuple[str, int], Optional[str]] = field(default_factory=dict)
+    """(ruleset name, number) -> text for small numbers (None if failed)."""
+
+    recent_texts: Dict[Tuple[str, int], Optional[str]] = field(default_factory=dict)
+    """Same as texts for other numbers (cleared when full)."""
+
+    rule_ranges: Dict[str, List[_RuleRange]] = field(default_factory=dict)
+    """Ruleset name -> recently used numeric rules (most recent first)."""
+
+    rule_parts: Dict[int, Tuple[RbnfRule, List[_RangePart]]] = field(
+        default_factory=dict
+    )
+    """id(rule) -> (rule, flattened parts)."""
+
+
 class RbnfEngine:
     """Formatting engine using rbnf."""
 
@@ -553,6 +1067,38 @@ class RbnfEngine:
         # ruleset name -> ruleset
         self.rulesets: Dict[str, RbnfRuleSet] = {}
 
+        # ruleset name -> rendered digits 0-9 (filled on demand)
+        self._digit_cache: Dict[str, List[Optional[str]]] = {}
+
+        # ruleset name or purpose -> digits 0-99 -> text with soft hyphens
+        # (see format_digits). Filled on demand under _DIGIT_TABLES_LOCK, even
+        # when frozen.
+        self._digit_tables: Dict[Union[str, FormatPurpose], Dict[str, str]] = {}
+
+        # True if engine can no longer be modified
+        self._is_frozen = False
+
+        # Ids of token texts (see iter_format_tokens)
+        self.vocabulary = Vocabulary()
+
+        # (purpose, number key) -> pre-rendered result (see warmup.warm_up).
+        # Only used when format_number is called with default settings.
+        self.result_cache: Optional[
+            Dict[Tuple[FormatPurpose, Union[int, str]], FormatResult]
+        ] = None
+
+        # Counts formatted numbers when set (see warmup.UsageRecorder)
+        self.recorder: "Optional[UsageRecorder]" = None
+
+        # ruleset name -> domain (computed on demand, see get_domain)
+        self._domains: Optional[Dict[str, RbnfDomain]] = None
+
+        # Equivalent rulesets (computed on demand, see get_ruleset_aliases)
+        self._aliases: Optional[_RulesetAliases] = None
+
+        # Limits for formatting calls that don't pass their own
+        self.limits = FormatLimits()
+
     @staticmethod
     def get_supported_languages() -> List[str]:
         """Return a list of supported language codes."""
@@ -565,8 +1111,14 @@ class RbnfEngine:
         )
 
     @staticmethod
-    def for_language(language: str) -> "RbnfEngine":
-        """Load XML rules for a language and construct an engine."""
+    def for_language(
+        language: str, ruleset_names: Optional[Iterable[str]] = None
+    ) -> "RbnfEngine":
+        """Load XML rules for a language and construct an engine.
+
+        If ruleset_names is given, only those rulesets and the rulesets they
+        reference are loaded.
+        """
         xml_path = _LANG_DIR / f"{language}.xml"
         if not xml_path.is_file():
             raise ValueError(f"{language} is not supported")
@@ -574,10 +1126,23 @@ class RbnfEngine:
         engine = RbnfEngine(language=language)
         with open(xml_path, "r", encoding="utf-8") as xml_file:
             root = et.fromstring(xml_file.read())
-            engine.load_xml(root)
+            engine.load_xml(root, ruleset_names=ruleset_names)
 
         return engine
 
+    def parse_number(self, text: str) -> ParsedNumber:
+        """Parse a number string formatted for the engine's language.
+
+        Uses the language's decimal and grouping symbols (e.g., 1.234,5 in
+        German) and accepts digits of any script. The result can be passed to
+        format_number. Raises ValueError if text isn't a number.
+        """
+        return NumberParser.for_language(self.language).parse(text)
+
+    def parse_numbers(self, texts: Iterable[str]) -> List[Optional[ParsedNumber]]:
+        """Parse many number strings (None for strings that aren't numbers)."""
+        return NumberParser.for_language(self.language).parse_many(texts)
+
     def add_rule(
         self,
         value_str: str,
@@ -588,15 +1153,19 @@ class RbnfEngine:
     ) -> Optional[RbnfRule]:
         """Manually add a rule to the engine."""
         assert ruleset_name is not None
+        self._check_not_frozen()
+
         ruleset = self.rulesets.get(ruleset_name)
         if ruleset is None:
             ruleset = RbnfRuleSet(name=ruleset_name, is_private=is_private)
             self.rulesets[ruleset_name] = ruleset
 
-        rule = RbnfRule.parse(value_str, rule_text, radix=radix)
+        rule = _SHARED_RULES.parse(value_str, rule_text, radix=radix)
         if rule is None:
             return rule
 
+        self._clear_caches()
+
         if isinstance(rule.value, RbnfSpecialRule):
             # Special rule
             ruleset.special_rules[rule.value] = rule
@@ -606,8 +1175,14 @@ class RbnfEngine:
 
         return rule
 
-    def load_xml(self, root: et.Element) -> None:
-        """Load an XML file with rbnf rules."""
+    def load_xml(
+        self, root: et.Element, ruleset_names: Optional[Iterable[str]] = None
+    ) -> None:
+        """Load an XML file with rbnf rules.
+
+        If ruleset_names is given, only those rulesets and the rulesets they
+        reference are loaded. References are found before rules are parsed.
+        """
         lang_elem = root.find("identity/language")
         if lang_elem is None:
             raise ValueError("Missing identity/language element")
@@ -616,12 +1191,35 @@ class RbnfEngine:
         if (language != self.language) and (not self.language.startswith(language)):
             raise ValueError(f"Expected language {self.language}, got {language}")
 
-        for group_elem in root.findall("rbnf//ruleset"):
-            ruleset_name = group_elem.attrib["type"]
-            if ruleset_name in SKIP_RULESETS:
-                _LOGGER.debug("Skipping ruleset: %s", ruleset_name)
-                continue
+        self._check_not_frozen()
+
+        group_elems = [
+            group_elem
+            for group_elem in root.findall("rbnf//ruleset")
+            if group_elem.attrib["type"] not in SKIP_RULESETS
+        ]
+
+        if ruleset_names is not None:
+            # Prune unreachable rulesets before parsing their rules
+            text_graph = RulesetGraph(
+                references={
+                    group_elem.attrib["type"]: {
+                        name
+                        for rule_elem in group_elem.findall("rbnfrule")
+                        for name in find_text_references(rule_elem.text or "")
+                    }
+                    for group_elem in group_elems
+                }
+            )
+            keep_names = text_graph.reachable(ruleset_names)
+            group_elems = [
+                group_elem
+                for group_elem in group_elems
+                if group_elem.attrib["type"] in keep_names
+            ]
 
+        for group_elem in group_elems:
+            ruleset_name = group_elem.attrib["type"]
             is_private = group_elem.attrib.get("access") == "private"
 
             for rule_elem in group_elem.findall("rbnfrule"):
@@ -639,28 +1237,489 @@ class RbnfEngine:
                     is_private=is_private,
                 )
 
+        # Report problems now instead of at format time
+        graph = self.get_ruleset_graph()
+        for ruleset_name, missing_names in graph.dangling.items():
+            _LOGGER.warning(
+                "Ruleset %s references missing ruleset(s): %s",
+                ruleset_name,
+                sorted(missing_names),
+            )
+
+        for cycle in graph.cycles:
+            _LOGGER.warning("Replacement cycle between rulesets: %s", cycle)
+
+    @property
+    def is_frozen(self) -> bool:
+        """True if engine has been frozen."""
+        return self._is_frozen
+
+    def freeze(self) -> "RbnfEngine":
+        """Make engine immutable so it can be safely shared between threads.
+
+        All lazily computed state is computed now, so formatting has no side
+        effects afterwards (except for the digit tables of format_digits, which
+        are filled once under a lock). Rules can no longer be added.
+        """
+        if self._is_frozen:
+            return self
+
+        for ruleset in self.rulesets.values():
+            # Only updated if stale (rulesets may be shared with other engines)
+            ruleset.get_sorted_numbers()
+
+        self._get_domains()
+        self._get_aliases()
+
+        for ruleset_name in self.rulesets:
+            digit_texts = self._get_digit_texts(ruleset_name)
+            for digit in range(10):
+                if digit_texts[digit] is not None:
+                    continue  # already cached
+
+                try:
+                    digit_texts[digit] = "".join(
+                        self.iter_format_number(digit, ruleset_name)
+                    )
+                except (RbnfError, ArithmeticError, ValueError):
+                    pass  # digit can't be rendered
+
+        self._is_frozen = True
+        return self
+
+    def _check_not_frozen(self) -> None:
+        if self._is_frozen:
+            raise EngineFrozenError(f"Engine for {self.language} is frozen")
+
+    def _clear_caches(self) -> None:
+        """Drop everything derived from the rulesets after they change."""
+        self._digit_cache.clear()
+        self._digit_tables = {}
+        self.result_cache = None
+        self._domains = None
+        self._aliases = None
+
+    def _get_digit_texts(self, ruleset_name: str) -> List[Optional[str]]:
+        """Get cached renderings of digits 0-9 for a ruleset."""
+        digit_texts = self._digit_cache.get(ruleset_name)
+        if digit_texts is None:
+            digit_texts = [None] * 10
+            if not self._is_frozen:
+                self._digit_cache[ruleset_name] = digit_texts
+
+        return digit_texts
+
+    def _get_digit_text(self, ruleset_name: str, digit: int) -> str:
+        """Get rendering of a single digit (cached)."""
+        digit_texts = self._get_digit_texts(ruleset_name)
+        digit_text = digit_texts[digit]
+        if digit_text is None:
+            digit_text = "".join(self.iter_format_number(digit, ruleset_name))
+            if not self._is_frozen:
+                digit_texts[digit] = digit_text
+
+        return digit_text
+
+    def _iter_format_big_number(
+        self,
+        number: int,
+        ruleset: RbnfRuleSet,
+        big_number_mode: BigNumberMode,
+        depth_left: int = sys.maxsize,
+        deadline: Optional[float] = None,
+    ) -> Iterable[_FormatPiece]:
+        """Format a number past the highest rule without recursion."""
+        if number < 0:
+            raise NoRuleForNumberError(f"No rule for {number} in {ruleset.name}")
+
+        digits = str(number)
+        scale: Optional[RbnfScale] = None
+        if big_number_mode == BigNumberMode.SCALE_WORDS:
+            scale = ruleset.get_scale(number)
+
+        if scale is None:
+            # Digit by digit
+            for digit_idx, digit_str in enumerate(digits):
+                digit = int(digit_str)
+                if digit_idx > 0:
+                    yield (" ", ruleset.name, digit)
+                yield (self._get_digit_text(ruleset.name, digit), ruleset.name, digit)
+            return
+
+        # Split into groups of the highest scale word (e.g., quadrillion).
+        # Each group is below the scale, so it can be rendered by the rules.
+        group_size = len(str(scale.divisor)) - 1
+        first_group_size = len(digits) % group_size or group_size
+        groups = [int(digits[:first_group_size])] + [
+            int(digits[i : i + group_size])
+            for i in range(first_group_size, len(digits), group_size)
+        ]
+        max_scaled_group = scale.max_value // scale.divisor
+
+        is_first_group = True
+        for group_idx, group in enumerate(groups):
+            if group == 0:
+                continue
+
+            if not is_first_group:
+                yield (scale.separator, ruleset.name, scale.divisor)
+            is_first_group = False
+
+            power = len(groups) - group_idx - 1
+            if power == 0:
+                yield from self._iter_format_pieces(
+                    group, ruleset.name, depth_left=depth_left, deadline=deadline
+                )
+            elif group < max_scaled_group:
+                # Rules can render group × scale (e.g., "two quadrillion")
+                yield from self._iter_format_pieces(
+                    group * scale.divisor,
+                    ruleset.name,
+                    depth_left=depth_left,
+                    deadline=deadline,
+                )
+                power -= 1
+            else:
+                yield from self._iter_format_pieces(
+                    group, ruleset.name, depth_left=depth_left, deadline=deadline
+                )
+
+            for _ in range(power):
+                yield (scale.suffix, ruleset.name, scale.divisor)
+
+    def get_domain(self, ruleset_name: str) -> RbnfDomain:
+        """Get numbers that a ruleset may be able to format (see RbnfDomain)."""
+        domain = self._get_domains().get(ruleset_name)
+        if domain is None:
+            raise RulesetNotFoundError(f"No ruleset: {ruleset_name}")
+
+        return domain
+
+    def _get_domains(self) -> Dict[str, RbnfDomain]:
+        """Get domains of all rulesets (cached)."""
+        domains = self._domains
+        if domains is not None:
+            return domains
+
+        limits: Dict[str, Optional[int]] = {}
+        domains = {}
+        for ruleset_name, ruleset in self.rulesets.items():
+            limit = self._get_failure_limit(ruleset_name, limits, set())
+            has_negative = (
+                ruleset.find_special_rule(
+                    RbnfSpecialRule.NEGATIVE_NUMBER, self.rulesets
+                )
+                is not None
+            )
+            domains[ruleset_name] = RbnfDomain(
+                min_value=None if has_negative else 0,
+                max_value=None if limit is None else limit - 1,
+                has_negative=has_negative,
+                has_proper_fraction=(
+                    RbnfSpecialRule.PROPER_FRACTION in ruleset.special_rules
+                ),
+                has_improper_fraction=any(
+                    special_rule in ruleset.special_rules
+                    for special_rule in (
+                        RbnfSpecialRule.IMPROPER_FRACTION,
+                        RbnfSpecialRule.DEFAULT_RULE,
+                    )
+                ),
+                has_nan=(
+                    ruleset.find_special_rule(
+                        RbnfSpecialRule.NOT_A_NUMBER, self.rulesets
+                    )
+                    is not None
+                ),
+                has_infinity=(
+                    ruleset.find_special_rule(RbnfSpecialRule.INFINITY, self.rulesets)
+                    is not None
+                ),
+            )
+
+        if not self._is_frozen:
+            self._domains = domains
+
+        return domains
+
+    def _get_failure_limit(
+        self,
+        ruleset_name: str,
+        limits: Dict[str, Optional[int]],
+        visiting: Set[str],
+    ) -> Optional[int]:
+        """Get lowest integer L where all integers >= L fail (None if unknown).
+
+        Rules are checked from the highest down, since the highest rule is used
+        for all numbers above it.
+        """
+        if ruleset_name in limits:
+            return limits[ruleset_name]
+
+        ruleset = self.rulesets.get(ruleset_name)
+        if (ruleset is None) or (ruleset_name in visiting):
+            # Missing rulesets are handled by the caller, and cycles are unknown
+            return None
+
+        visiting.add(ruleset_name)
+
+        limit: Optional[int] = None
+        sorted_numbers = ruleset.get_sorted_numbers()
+        if not sorted_numbers:
+            # No rule for any integer
+            limit = 0
+
+        for rule_idx in range(len(sorted_numbers) - 1, -1, -1):
+            rule_number = sorted_numbers[rule_idx]
+            rule_limit = self._get_rule_failure_limit(
+                ruleset.numeric_rules[rule_number], rule_number, limits, visiting
+            )
+            if (rule_limit is None) or ((limit is not None) and (rule_limit >= limit)):
+                # Rule doesn't fail up to the next rule
+                break
+
+            if rule_idx == 0:
+                # First rule is also used for numbers below it
+                rule_limit = 0 if rule_limit == rule_number else rule_limit
+
+            limit = rule_limit
+            if rule_limit > rule_number:
+                # Rule only fails for part of its range
+                break
+
+        visiting.discard(ruleset_name)
+        limits[ruleset_name] = limit
+
+        return limit
+
+    def _get_rule_failure_limit(
+        self,
+        rule: RbnfRule,
+        rule_number: int,
+        limits: Dict[str, Optional[int]],
+        visiting: Set[str],
+    ) -> Optional[int]:
+        """Get lowest integer >= rule_number where rule always fails.
+
+        A rule fails if it unconditionally refers to a missing ruleset (e.g.,
+        =#,##0=), or replaces the number with a ruleset that fails for it.
+        """
+        rule_limit: Optional[int] = None
+        for part in rule.parts:
+            part_limit: Optional[int] = None
+            if isinstance(part, ReplaceRulePart):
+                # Number is passed through unchanged
+                if part.ruleset_name not in self.rulesets:
+                    part_limit = rule_number
+                else:
+                    target_limit = self._get_failure_limit(
+                        part.ruleset_name, limits, visiting
+                    )
+                    if target_limit is not None:
+                        part_limit = max(rule_number, target_limit)
+            elif (
+                isinstance(part, SubRulePart)
+                and (part.ruleset_name is not None)
+                and (not part.is_optional)
+                and (part.ruleset_name not in self.rulesets)
+            ):
+                # Substitution is always rendered
+                part_limit = rule_number
+
+            if (part_limit is not None) and (
+                (rule_limit is None) or (part_limit < rule_limit)
+            ):
+                rule_limit = part_limit
+
+        return rule_limit
+
+    def get_ruleset_aliases(self, integers: bool = False) -> Dict[str, str]:
+        """Get names of rulesets that render the same text as another ruleset.
+
+        Maps each alias to the name of its canonical ruleset. Rulesets with
+        identical rules are aliases for every number. If integers is True,
+        rulesets that only redirect to another ruleset (0: =%other=;) are
+        included too, since they may not handle fractions the same way.
+        """
+        aliases = self._get_aliases()
+        return dict(aliases.integers if integers else aliases.all_numbers)
+
+    def _get_aliases(self) -> "_RulesetAliases":
+        """Find equivalent rulesets (cached)."""
+        aliases = self._aliases
+        if aliases is not None:
+            return aliases
+
+        # Identical rule tables (grouped by rule values first)
+        all_numbers: Dict[str, str] = {}
+        canonical_names: Dict[Tuple, List[str]] = {}
+        for ruleset_name, ruleset in self.rulesets.items():
+            table_key = (
+                tuple(ruleset.get_sorted_numbers()),
+                frozenset(ruleset.special_rules),
+            )
+            same_keys = canonical_names.setdefault(table_key, [])
+            for canonical_name in same_keys:
+                canonical = self.rulesets[canonical_name]
+                if (ruleset.numeric_rules == canonical.numeric_rules) and (
+                    ruleset.special_rules == canonical.special_rules
+                ):
+                    all_numbers[ruleset_name] = canonical_name
+                    break
+            else:
+                same_keys.append(ruleset_name)
+
+        # Redirects (0: =%other=;) render integers like their target, as long
+        # as a negative number rule is the same as the target's.
+        redirects: Dict[str, str] = {}
+        for ruleset_name, ruleset in self.rulesets.items():
+            zero_rule = ruleset.numeric_rules.get(0)
+            if (
+                (len(ruleset.numeric_rules) != 1)
+                or (zero_rule is None)
+                or (len(zero_rule.parts) != 1)
+                or (not isinstance(zero_rule.parts[0], ReplaceRulePart))
+            ):
+                continue
+
+            target_name = zero_rule.parts[0].ruleset_name
+            target = self.rulesets.get(target_name)
+            if (target is None) or (target_name == ruleset_name):
+                continue
+
+            negative_rule = ruleset.special_rules.get(RbnfSpecialRule.NEGATIVE_NUMBER)
+            if (negative_rule is None) or (
+                negative_rule
+                == target.find_special_rule(
+                    RbnfSpecialRule.NEGATIVE_NUMBER, self.rulesets
+                )
+            ):
+                redirects[ruleset_name] = target_name
+
+        integers: Dict[str, str] = {}
+        for ruleset_name in self.rulesets:
+            # Follow redirects to the end (stopping at cycles)
+            canonical_name = ruleset_name
+            visited_names = {ruleset_name}
+            while canonical_name in redirects:
+                canonical_name = redirects[canonical_name]
+                if canonical_name in visited_names:
+                    break
+
+                visited_names.add(canonical_name)
+
+            canonical_name = all_numbers.get(canonical_name, canonical_name)
+            if canonical_name != ruleset_name:
+                integers[ruleset_name] = canonical_name
+
+        aliases = _RulesetAliases(all_numbers=all_numbers, integers=integers)
+        if not self._is_frozen:
+            self._aliases = aliases
+
+        return aliases
+
+    def get_ruleset_graph(self) -> RulesetGraph:
+        """Build graph of references between loaded rulesets."""
+        return build_ruleset_graph(self.rulesets)
+
+    def prune_rulesets(self, ruleset_names: Iterable[str]) -> Set[str]:
+        """Remove rulesets not reachable from ruleset_names.
+
+        Returns the names of removed rulesets.
+        """
+        self._check_not_frozen()
+        keep_names = self.get_ruleset_graph().reachable(ruleset_names)
+        removed_names = set(self.rulesets.keys()) - keep_names
+        for ruleset_name in removed_names:
+            del self.rulesets[ruleset_name]
+
+        self._clear_caches()
+
+        return removed_names
+
     def format_number(
         self,
-        number: Union[int, float, str, Decimal],
+        number: Union[int, float, str, Decimal, ParsedNumber],
         purpose: Optional[FormatPurpose] = None,
         ruleset_names: Optional[List[str]] = None,
         radix: Optional[int] = None,
         tolerance: float = DEFAULT_TOLERANCE,
         options: Optional[FormatOptions] = None,
+        max_fraction_digits: Optional[int] = None,
+        rounding: str = ROUND_HALF_EVEN,
+        big_number_mode: BigNumberMode = BigNumberMode.ERROR,
+        limits: Optional[FormatLimits] = None,
     ) -> FormatResult:
-        """Format a number using loaded rulesets."""
+        """Format a number using loaded rulesets.
+
+        Fractions are rendered exactly from their decimal digits. If
+        max_fraction_digits is given, the number is first rounded to that many
+        digits after the decimal point (see decimal module for rounding modes).
+
+        Numbers past the highest rule of a ruleset are handled according to
+        big_number_mode.
+
+        Rulesets whose domain doesn't contain the number are skipped without
+        rendering (see get_domain).
+
+        Rendering fails with a FormatLimitError if it exceeds limits (default:
+        engine.limits). The timeout applies to the whole call.
+
+        Pre-rendered results from result_cache are returned for calls with
+        default settings, and the number is counted by recorder (if set).
+        """
         if purpose is None:
             purpose = FormatPurpose.CARDINAL
 
+        # Convert once for all rulesets
+        number_value = normalize_number(number, max_fraction_digits, rounding)
+
+        result_cache = self.result_cache
+        recorder = self.recorder
+        if (result_cache is not None) or (recorder is not None):
+            number_key = get_number_key(number_value)
+            if recorder is not None:
+                recorder.record(purpose, number_key)
+
+            if (
+                (result_cache is not None)
+                and (ruleset_names is None)
+                and (tolerance == DEFAULT_TOLERANCE)
+                and (not options)
+                and (big_number_mode == BigNumberMode.ERROR)
+            ):
+                cached_result = result_cache.get((purpose, number_key))
+                if cached_result is not None:
+                    # Copy so callers can't modify the cache
+                    return FormatResult(
+                        text=cached_result.text,
+                        text_ruleset=cached_result.text_ruleset,
+                        text_by_ruleset=dict(cached_result.text_by_ruleset),
+                    )
+
+        return self._format_number_value(
+            number_value,
+            purpose,
+            ruleset_names=ruleset_names,
+            tolerance=tolerance,
+            options=options,
+            big_number_mode=big_number_mode,
+            limits=limits,
+        )
+
+    def _format_number_value(
+        self,
+        number_value: Union[int, float, Decimal],
+        purpose: FormatPurpose,
+        ruleset_names: Optional[List[str]] = None,
+        tolerance: float = DEFAULT_TOLERANCE,
+        options: Optional[FormatOptions] = None,
+        big_number_mode: BigNumberMode = BigNumberMode.ERROR,
+        limits: Optional[FormatLimits] = None,
+    ) -> FormatResult:
+        """Format a normalized number without the result cache or recorder."""
         if ruleset_names is None:
-            # Gather all rulesets that fit the formatting purpose
-            ruleset_names = [
-                r_name
-                for r_name, r in self.rulesets.items()
-                if (not r.is_private)
-                and (FormatPurpose.from_ruleset_name(r_name) == purpose)
-                and ("verbose" not in r_name)
-            ]
+            ruleset_names = self.get_ruleset_names(purpose)
 
         if not ruleset_names:
             raise ValueError("No rulesets")
@@ -668,15 +1727,50 @@ class RbnfEngine:
         if options is None:
             options = FormatOptions(0)
 
+        if limits is None:
+            limits = self.limits
+
+        deadline = _get_deadline(limits)
+        domains: Dict[str, RbnfDomain] = {}
+        if big_number_mode == BigNumberMode.ERROR:
+            domains = self._get_domains()
+
+        aliases = self._get_aliases()
+        canonical_names = (
+            aliases.integers if isinstance(number_value, int) else aliases.all_numbers
+        )
+
         # ruleset -> number string
         number_strs: Dict[str, str] = {}
+
+        # canonical ruleset -> number string (None if failed)
+        canonical_strs: Dict[str, Optional[str]] = {}
+
         for ruleset_name in ruleset_names:
+            domain = domains.get(ruleset_name)
+            if (domain is not None) and (not domain.contains(number_value)):
+                continue  # certain to fail
+
+            # Equivalent rulesets are only rendered once
+            canonical_name = canonical_names.get(ruleset_name, ruleset_name)
+            if canonical_name in canonical_strs:
+                canonical_str = canonical_strs[canonical_name]
+                if canonical_str is not None:
+                    number_strs[ruleset_name] = canonical_str
+
+                continue
+
+            canonical_strs[canonical_name] = None
             try:
                 number_str = "".join(
-                    self.iter_format_number(
-                        number,
-                        ruleset_name=ruleset_name,
-                        tolerance=tolerance,
+                    text
+                    for text, _ruleset_name, _rule_value in self._iter_limited_pieces(
+                        number_value,
+                        ruleset_name,
+                        tolerance,
+                        big_number_mode,
+                        limits,
+                        deadline,
                     )
                 )
 
@@ -685,21 +1779,14 @@ class RbnfEngine:
                     number_str = number_str.replace("\xad", "")
 
                 number_strs[ruleset_name] = number_str
+                canonical_strs[canonical_name] = number_str
             except (NoRuleForNumberError, RulesetNotFoundError):
                 pass  # skip ruleset
 
         if not number_strs:
-            raise NoRuleForNumberError(f"No rules were successful for {number}")
-
-        # Put spellout-numbering at the end
-        default_ruleset = _DEFAULT_RULESETS.get((self.language, purpose))
-        if (not default_ruleset) or (default_ruleset not in number_strs):
-            default_ruleset = "spellout-numbering"
+            raise NoRuleForNumberError(f"No rules were successful for {number_value}")
 
-        if default_ruleset not in number_strs:
-            # Use ruleset with shortest length.
-            # Silly, but works most of the time.
-            default_ruleset = sorted(number_strs, key=len)[0]
+        default_ruleset = self.get_text_ruleset_order(number_strs, purpose)[0]
 
         return FormatResult(
             text=number_strs[default_ruleset],
@@ -707,38 +1794,528 @@ class RbnfEngine:
             text_by_ruleset=number_strs,
         )
 
+    def format_digits(
+        self,
+        digits: str,
+        purpose: Optional[FormatPurpose] = None,
+        ruleset_name: Optional[str] = None,
+        group_size: int = 1,
+        separator: str = " ",
+        run_separator: Optional[str] = None,
+        options: Optional[FormatOptions] = None,
+    ) -> str:
+        """Read a string of digits (phone number, ID, PIN) in groups.
+
+        Digits are read in groups of group_size from the left (e.g., 12 34 5
+        for 2), and each group like format_number(group).text, except that its
+        leading zeros are read as single digits (05 is "zero five"). Groups and
+        leading zeros are joined with separator.
+
+        Runs of digits separated by whitespace, hyphens, dots, slashes, or
+        parentheses (e.g., 555-0123) are grouped separately and joined with
+        run_separator (default: separator). Digits of any script are accepted.
+
+        Groups below 100 come from tables that are rendered once per ruleset
+        (or purpose), so reading them costs little more than a string join.
+        Raises ValueError for other characters, or NoRuleForNumberError if a
+        group can't be formatted.
+        """
+        if group_size < 1:
+            raise ValueError(f"Group size must be at least 1: {group_size}")
+
+        if purpose is None:
+            purpose = FormatPurpose.CARDINAL
+
+        if options is None:
+            options = FormatOptions(0)
+
+        if run_separator is None:
+            run_separator = separator
+
+        if not digits.isascii():
+            digits = digits.translate(_DIGITS)
+
+        runs = [run for run in _DIGIT_RUN_SEPARATOR.split(digits) if run]
+        if not runs:
+            raise ValueError(f"No digits: {digits!r}")
+
+        for run in runs:
+            if not (run.isascii() and run.isdigit()):
+                raise ValueError(f"Not a digit string: {digits!r}")
+
+        texts = self._get_digit_table(purpose, ruleset_name)
+        run_texts: List[str] = []
+        for run in runs:
+            if group_size == 1:
+                try:
+                    run_texts.append(separator.join(map(texts.__getitem__, run)))
+                    continue
+                except KeyError:
+                    pass  # digit can't be formatted (raised below)
+
+            group_texts: List[str] = []
+            for group_idx in range(0, len(run), group_size):
+                group = run[group_idx : group_idx + group_size]
+                text = texts.get(group)
+                if text is None:
+                    # Leading zeros or not in table
+                    no_zeros = group.lstrip("0")
+                    if len(no_zeros) < len(group):
+                        zero_text = texts.get("0")
+                        if zero_text is None:
+                            raise NoRuleForNumberError("No rule for 0")
+
+                        group_texts.extend([zero_text] * (len(group) - len(no_zeros)))
+
+                    if not no_zeros:
+                        continue
+
+                    text = texts.get(no_zeros)
+                    if text is None:
+                        text = self._format_number_value(
+                            int(no_zeros),
+                            purpose,
+                            ruleset_names=(
+                                None if (ruleset_name is None) else [ruleset_name]
+                            ),
+                            options=FormatOptions.PRESERVE_SOFT_HYPENS,
+                        ).text
+
+                group_texts.append(text)
+
+            run_texts.append(separator.join(group_texts))
+
+        text = run_separator.join(run_texts)
+        if not (options & FormatOptions.PRESERVE_SOFT_HYPENS):
+            text = text.replace("\xad", "")
+
+        return text
+
+    def _get_digit_table(
+        self, purpose: FormatPurpose, ruleset_name: Optional[str]
+    ) -> Dict[str, str]:
+        """Get renderings of 0-99 for a ruleset or purpose (rendered once)."""
+        key: Union[str, FormatPurpose] = (
+            purpose if (ruleset_name is None) else ruleset_name
+        )
+        texts = self._digit_tables.get(key)
+        if texts is not None:
+            return texts
+
+        if (ruleset_name is not None) and (ruleset_name not in self.rulesets):
+            raise RulesetNotFoundError(f"No ruleset: {ruleset_name}")
+
+        with _DIGIT_TABLES_LOCK:
+            texts = self._digit_tables.get(key)
+            if texts is not None:
+                return texts
+
+            texts = {}
+            for number in range(_DIGIT_TABLE_SIZE):
+                try:
+                    texts[str(number)] = self._format_number_value(
+                        number,
+                        purpose,
+                        ruleset_names=(
+                            None if (ruleset_name is None) else [ruleset_name]
+                        ),
+                        options=FormatOptions.PRESERVE_SOFT_HYPENS,
+                    ).text
+                except NoRuleForNumberError:
+                    pass  # raised again when used
+
+            self._digit_tables[key] = texts
+
+        return texts
+
+    def format_tokens(
+        self,
+        number: Union[int, float, str, Decimal, ParsedNumber],
+        purpose: Optional[FormatPurpose] = None,
+        ruleset_names: Optional[List[str]] = None,
+        tolerance: float = DEFAULT_TOLERANCE,
+        options: Optional[FormatOptions] = None,
+        max_fraction_digits: Optional[int] = None,
+        rounding: str = ROUND_HALF_EVEN,
+        big_number_mode: BigNumberMode = BigNumberMode.ERROR,
+        limits: Optional[FormatLimits] = None,
+    ) -> List[FormatToken]:
+        """Format a number into tokens for the ruleset of FormatResult.text.
+
+        Only rulesets up to the first successful one are rendered. Limits
+        apply to each ruleset (see format_number).
+        """
+        if purpose is None:
+            purpose = FormatPurpose.CARDINAL
+
+        if ruleset_names is None:
+            ruleset_names = self.get_ruleset_names(purpose)
+
+        if not ruleset_names:
+            raise ValueError("No rulesets")
+
+        number_value = normalize_number(number, max_fraction_digits, rounding)
+        domains: Dict[str, RbnfDomain] = {}
+        if big_number_mode == BigNumberMode.ERROR:
+            domains = self._get_domains()
+
+        for ruleset_name in self.get_text_ruleset_order(ruleset_names, purpose):
+            domain = domains.get(ruleset_name)
+            if (domain is not None) and (not domain.contains(number_value)):
+                continue  # certain to fail
+
+            try:
+                return list(
+                    self.iter_format_tokens(
+                        number_value,
+                        ruleset_name,
+                        tolerance=tolerance,
+                        options=options,
+                        big_number_mode=big_number_mode,
+                        limits=limits,
+                    )
+                )
+            except (NoRuleForNumberError, RulesetNotFoundError):
+                pass  # try next ruleset
+
+        raise NoRuleForNumberError(f"No rules were successful for {number}")
+
+    def iter_format_tokens(
+        self,
+        number: Union[int, float, str, Decimal, ParsedNumber],
+        ruleset_name: str,
+        tolerance: float = DEFAULT_TOLERANCE,
+        options: Optional[FormatOptions] = None,
+        max_fraction_digits: Optional[int] = None,
+        rounding: str = ROUND_HALF_EVEN,
+        big_number_mode: BigNumberMode = BigNumberMode.ERROR,
+        limits: Optional[FormatLimits] = None,
+    ) -> Iterable[FormatToken]:
+        """Format a number into word and separator tokens (generator).
+
+        Token ids come from the engine's vocabulary. Soft hyphens are removed
+        like in format_number unless FormatOptions.PRESERVE_SOFT_HYPENS is set.
+        """
+        if not isinstance(number, int):
+            number = normalize_number(number, max_fraction_digits, rounding)
+
+        if options is None:
+            options = FormatOptions(0)
+
+        if limits is None:
+            limits = self.limits
+
+        yield from iter_tokens(
+            self._iter_limited_pieces(
+                number,
+                ruleset_name,
+                tolerance,
+                big_number_mode,
+                limits,
+                _get_deadline(limits),
+            ),
+            self.vocabulary,
+            preserve_soft_hyphens=bool(options & FormatOptions.PRESERVE_SOFT_HYPENS),
+        )
+
+    def get_ruleset_names(self, purpose: FormatPurpose) -> List[str]:
+        """Get names of public rulesets that fit a formatting purpose."""
+        return [
+            r_name
+            for r_name, r in self.rulesets.items()
+            if (not r.is_private)
+            and (FormatPurpose.from_ruleset_name(r_name) == purpose)
+            and ("verbose" not in r_name)
+        ]
+
+    def get_text_ruleset_order(
+        self, ruleset_names: Iterable[str], purpose: FormatPurpose
+    ) -> List[str]:
+        """Order rulesets by preference for FormatResult.text."""
+        ruleset_names = list(ruleset_names)
+        preferred_names = ["spellout-numbering"]
+        default_ruleset = _DEFAULT_RULESETS.get((self.language, purpose))
+        if default_ruleset:
+            preferred_names.insert(0, default_ruleset)
+
+        # Otherwise use ruleset with shortest length.
+        # Silly, but works most of the time.
+        ordered_names = [name for name in preferred_names if name in ruleset_names]
+        ordered_names.extend(
+            name
+            for name in sorted(ruleset_names, key=len)
+            if name not in preferred_names
+        )
+
+        return ordered_names
+
     def iter_format_number(
         self,
-        number: Union[int, float, str, Decimal],
+        number: Union[int, float, str, Decimal, ParsedNumber],
         ruleset_name: str,
         radix: Optional[int] = None,
         tolerance: float = DEFAULT_TOLERANCE,
+        max_fraction_digits: Optional[int] = None,
+        rounding: str = ROUND_HALF_EVEN,
+        big_number_mode: BigNumberMode = BigNumberMode.ERROR,
+        limits: Optional[FormatLimits] = None,
     ) -> Iterable[str]:
-        """Format a number using loaded rulesets (generator)."""
-        if isinstance(number, str):
-            number = Decimal(number)
+        """Format a number using loaded rulesets (generator).
+
+        Raises a FormatLimitError if rendering exceeds limits (default:
+        engine.limits). The timeout starts when the first text is requested.
+        """
+        if not isinstance(number, int):
+            number = normalize_number(number, max_fraction_digits, rounding)
+
+        if limits is None:
+            limits = self.limits
+
+        for text, _ruleset_name, _rule_value in self._iter_limited_pieces(
+            number,
+            ruleset_name,
+            tolerance,
+            big_number_mode,
+            limits,
+            _get_deadline(limits),
+        ):
+            yield text
+
+    def iter_range(
+        self,
+        start: int,
+        stop: int,
+        step: int = 1,
+        purpose: Optional[FormatPurpose] = None,
+        ruleset_names: Optional[List[str]] = None,
+        options: Optional[FormatOptions] = None,
+    ) -> Iterable[Tuple[int, str]]:
+        """Format every integer in range(start, stop, step) (generator).
+
+        Yields (number, text) with the same text as format_number. Rules are
+        walked in order, and sub-results (quotients, remainders, and
+        replacements) are reused across numbers, so this is much faster than
+        calling format_number for each number. Memory doesn't grow with the
+        size of the range.
+
+        Numbers that can't be formatted raise NoRuleForNumberError. The result
+        cache and recorder are not used.
+        """
+        if purpose is None:
+            purpose = FormatPurpose.CARDINAL
+
+        if ruleset_names is None:
+            ruleset_names = self.get_ruleset_names(purpose)
+
+        if not ruleset_names:
+            raise ValueError("No rulesets")
+
+        if options is None:
+            options = FormatOptions(0)
+
+        preserve_soft_hyphens = bool(options & FormatOptions.PRESERVE_SOFT_HYPENS)
+        ordered_names = self.get_text_ruleset_order(ruleset_names, purpose)
+        domains = self._get_domains()
+        memo = _RangeMemo()
+
+        for number in range(start, stop, step):
+            text: Optional[str] = None
+            for ruleset_name in ordered_names:
+                domain = domains.get(ruleset_name)
+                if (domain is not None) and (not domain.contains(number)):
+                    continue  # certain to fail
+
+                text = self._render_range_number(number, ruleset_name, memo)
+                if text is not None:
+                    break
+
+            if text is None:
+                raise NoRuleForNumberError(f"No rules were successful for {number}")
+
+            if not preserve_soft_hyphens:
+                text = text.replace("\xad", "")
+
+            yield (number, text)
+
+    def _render_range_number(
+        self, number: int, ruleset_name: str, memo: "_RangeMemo"
+    ) -> Optional[str]:
+        """Render an integer like _iter_format_pieces, reusing sub-results.
+
+        Returns None if the number can't be rendered by the ruleset.
+        """
+        key = (ruleset_name, number)
+        texts = memo.texts if (0 <= number < _RANGE_MEMO_LIMIT) else memo.recent_texts
+        if key in texts:
+            return texts[key]
+
+        text = self._render_range_rule(number, ruleset_name, memo)
+        if (texts is memo.recent_texts) and (len(texts) >= _RANGE_RECENT_SIZE):
+            texts.clear()
+
+        texts[key] = text
+        return text
+
+    def _render_range_rule(
+        self, number: int, ruleset_name: str, memo: "_RangeMemo"
+    ) -> Optional[str]:
+        """Render an integer with a single rule (see _render_range_number)."""
+        rule_ranges = memo.rule_ranges.setdefault(ruleset_name, [])
+        for start, stop, rule_parts, power_below, power_above in rule_ranges:
+            if start <= number < stop:
+                # Same rule as a previous number
+                q, r = divmod(
+                    number, power_above if (number >= power_above) else power_below
+                )
+                break
+        else:
+            ruleset = self.rulesets.get(ruleset_name)
+            if ruleset is None:
+                return None
+
+            rule = ruleset.find_rule(number, rulesets=self.rulesets)
+            if rule is None:
+                return None
+
+            # Rule is kept with its parts so its id can't be reused
+            rule_and_parts = memo.rule_parts.get(id(rule))
+            if rule_and_parts is None:
+                rule_and_parts = (rule, _get_range_parts(rule))
+                memo.rule_parts[id(rule)] = rule_and_parts
+
+            rule_parts = rule_and_parts[1]
+            q = 0
+            r = 0
+            if isinstance(rule.value, RbnfSpecialRule):
+                if rule.value == RbnfSpecialRule.NEGATIVE_NUMBER:
+                    r = -number
+            elif rule.value > 0:
+                q, r = divmod(number, rule.get_divisor(number))
+
+                # Remember the numbers that use this rule (up to the next one)
+                sorted_numbers = ruleset.get_sorted_numbers()
+                index = bisect_left(sorted_numbers, rule.value) + 1
+                if index < len(sorted_numbers):
+                    rule_ranges.insert(
+                        0,
+                        (
+                            rule.value,
+                            sorted_numbers[index],
+                            rule_parts,
+                            *rule.get_divisors(),
+                        ),
+                    )
+                    del rule_ranges[_RANGE_RULES_PER_RULESET:]
+
+        texts: List[str] = []
+        for kind, text, plural_part, skip_zero, text_before, text_after in rule_parts:
+            if kind == _RANGE_TEXT:
+                texts.append(text)
+            elif kind == _RANGE_PLURAL:
+                assert plural_part is not None
+                texts.append(plural_part.render(number))
+            elif kind == _RANGE_REPLACE:
+                sub_text = self._render_range_number(number, text, memo)
+                if sub_text is None:
+                    return None
+
+                texts.append(sub_text)
+            else:
+                sub_number = q if (kind == _RANGE_QUOTIENT) else r
+                if (sub_number == 0) and skip_zero:
+                    # Rulesets can use quotients/remainders of zero
+                    continue
+
+                sub_text = self._render_range_number(
+                    sub_number, text or ruleset_name, memo
+                )
+                if sub_text is None:
+                    return None
+
+                texts.extend((text_before, sub_text, text_after))
+
+        return "".join(texts)
+
+    def _iter_limited_pieces(
+        self,
+        number: Union[int, float, Decimal],
+        ruleset_name: str,
+        tolerance: float,
+        big_number_mode: BigNumberMode,
+        limits: FormatLimits,
+        deadline: Optional[float],
+    ) -> Iterator[_FormatPiece]:
+        """Format a normalized number into text pieces, enforcing limits."""
+        max_depth = sys.maxsize if (limits.max_depth is None) else limits.max_depth
+        pieces = iter(
+            self._iter_format_pieces(
+                number, ruleset_name, tolerance, big_number_mode, max_depth, deadline
+            )
+        )
+        if limits.max_parts is None:
+            return pieces
+
+        # Parts are counted by islice without another generator in between
+        return chain(
+            islice(pieces, limits.max_parts),
+            _iter_no_more_pieces(pieces, limits.max_parts, ruleset_name),
+        )
 
+    def _iter_format_pieces(
+        self,
+        number: Union[int, float, Decimal],
+        ruleset_name: str,
+        tolerance: float = DEFAULT_TOLERANCE,
+        big_number_mode: BigNumberMode = BigNumberMode.ERROR,
+        depth_left: int = sys.maxsize,
+        deadline: Optional[float] = None,
+    ) -> Iterable[_FormatPiece]:
+        """Format a normalized number into text pieces with their origins.
+
+        This is the rendering core shared by iter_format_number and
+        iter_format_tokens. Substitutions are rendered with one less
+        depth_left, and deadline is a time.monotonic() value.
+        """
         assert ruleset_name is not None
+        if depth_left < 0:
+            raise RecursionLimitError(
+                f"Substitutions nested too deeply for {number} in {ruleset_name}"
+            )
+
+        if (deadline is not None) and (time.monotonic() >= deadline):
+            raise DeadlineExceededError(f"Timeout while rendering {ruleset_name}")
+
         ruleset = self.rulesets.get(ruleset_name)
         if ruleset is None:
             raise RulesetNotFoundError(f"No ruleset: {ruleset_name}")
 
-        rule = ruleset.find_rule(
-            float(number), tolerance=tolerance, rulesets=self.rulesets
-        )
+        rule = ruleset.find_rule(number, tolerance=tolerance, rulesets=self.rulesets)
         if rule is None:
             raise NoRuleForNumberError(f"No rule for {number} in {ruleset_name}")
 
+        if (
+            (big_number_mode != BigNumberMode.ERROR)
+            and isinstance(number, int)
+            and (rule.value == ruleset.get_sorted_numbers()[-1])
+            and rule.has_format_pattern()
+        ):
+            # Integer is past the highest rule (fractions and special rules
+            # with decimal patterns still fail)
+            yield from self._iter_format_big_number(
+                int(number), ruleset, big_number_mode, depth_left - 1, deadline
+            )
+            return
+
         q: int = 0
         r: int = 0
         r_digits: Optional[str] = None
 
         if isinstance(rule.value, RbnfSpecialRule):
             if rule.value == RbnfSpecialRule.NEGATIVE_NUMBER:
-                r = int(-number)
-            elif rule.value == RbnfSpecialRule.IMPROPER_FRACTION:
-                dec_num = Decimal(str(number))
-                q_str, r_digits = str(dec_num).split(".", maxsplit=1)
+                r = -number  # type: ignore[assignment]
+            elif rule.value in _FRACTION_RULES:
+                # Exact digits (no exponent)
+                q_str, r_digits = f"{number:f}".split(".", maxsplit=1)
                 q = int(q_str)
             elif rule.value in {RbnfSpecialRule.NOT_A_NUMBER, RbnfSpecialRule.INFINITY}:
                 # Should just be text substitutions
@@ -746,41 +2323,49 @@ class RbnfEngine:
             else:
                 _LOGGER.warning("Unhandled special rule: %s", rule.value)
         elif rule.value > 0:
-            if len(str(rule.value)) > 1 and str(rule.value)[0] != "1":
-                rule.value = int("1" + str(rule.value)[1:])
-            power_below = rule.radix ** int(floor(log(rule.value, rule.radix)))
-            power_above = rule.radix ** int(ceil(log(rule.value, rule.radix)))
-            divisor = power_above if (number >= power_above) else power_below
-            q, r = divmod(int(number), divisor)
+            q, r = divmod(int(number), rule.get_divisor(number))
 
         for part in rule.parts:
             if isinstance(part, TextRulePart):
                 if part.text:
-                    yield part.text
+                    yield (part.text, ruleset_name, rule.value)
             elif isinstance(part, PluralFormatPart):
+                if r_digits is None:
+                    plural_text = part.render(number)
+                elif (q == 0) and part.is_optional:
+                    # Skipped with the integral part
+                    continue
+                else:
+                    # Plural form of the integral part
+                    plural_text = part.render_count(q)
+
                 if part.function_name:
-                    yield part.render(number)
+                    yield (plural_text, ruleset_name, rule.value)
+                if part.text_after:
+                    yield (part.text_after, ruleset_name, rule.value)
             elif isinstance(part, SubRulePart):
                 sub_part: SubRulePart = part
 
                 if part.type == SubType.QUOTIENT:
-                    if (
-                        (q == 0)
-                        and (sub_part.is_optional or (part.ruleset_name is None))
-                        and (not r_digits)
+                    if (q == 0) and (
+                        sub_part.is_optional
+                        or ((part.ruleset_name is None) and (not r_digits))
                     ):
                         # Rulesets can use quotients of zero
                         continue
 
                     if part.text_before:
-                        yield part.text_before
-                    yield from self.iter_format_number(
+                        yield (part.text_before, ruleset_name, rule.value)
+                    yield from self._iter_format_pieces(
                         q,
-                        ruleset_name=part.ruleset_name or ruleset_name,
-                        tolerance=tolerance,
+                        part.ruleset_name or ruleset_name,
+                        tolerance,
+                        big_number_mode,
+                        depth_left - 1,
+                        deadline,
                     )
                     if part.text_after:
-                        yield part.text_after
+                        yield (part.text_after, ruleset_name, rule.value)
                 elif part.type == SubType.REMAINDER:
                     if (
                         (r == 0)
@@ -790,40 +2375,204 @@ class RbnfEngine:
                         # Rulesets can use remainders of zero
                         continue
 
+                    if r_digits and (part.ruleset_name not in (None, ruleset_name)):
+                        # Numerator over a power of the radix (e.g., 75 hundredths)
+                        if part.text_before:
+                            yield (part.text_before, ruleset_name, rule.value)
+                        yield from self._iter_fraction_pieces(
+                            r_digits,
+                            part.ruleset_name,  # type: ignore[arg-type]
+                            tolerance,
+                            big_number_mode,
+                            depth_left - 1,
+                            deadline,
+                        )
+                        if part.text_after:
+                            yield (part.text_after, ruleset_name, rule.value)
+                        continue
+
                     if r_digits:
                         # Render digit-by-digit
                         for digit_str in r_digits:
-                            digit = int(digit_str)
-
                             if part.text_before:
-                                yield part.text_before
-                            yield from self.iter_format_number(
+                                yield (part.text_before, ruleset_name, rule.value)
+                            digit_ruleset_name = part.ruleset_name or ruleset_name
+                            digit = int(digit_str)
+                            yield (
+                                self._get_digit_text(digit_ruleset_name, digit),
+                                digit_ruleset_name,
                                 digit,
-                                ruleset_name=part.ruleset_name or ruleset_name,
-                                tolerance=tolerance,
                             )
                             if part.text_after:
-                                yield part.text_after
+                                yield (part.text_after, ruleset_name, rule.value)
                         continue
 
                     if part.text_before:
-                        yield part.text_before
+                        yield (part.text_before, ruleset_name, rule.value)
 
-                    yield from self.iter_format_number(
+                    yield from self._iter_format_pieces(
                         r,
-                        ruleset_name=part.ruleset_name or ruleset_name,
-                        tolerance=tolerance,
+                        part.ruleset_name or ruleset_name,
+                        tolerance,
+                        big_number_mode,
+                        depth_left - 1,
+                        deadline,
                     )
 
                     if part.text_after:
-                        yield part.text_after
+                        yield (part.text_after, ruleset_name, rule.value)
             elif isinstance(part, ReplaceRulePart):
-                yield from self.iter_format_number(
+                yield from self._iter_format_pieces(
                     number,
-                    ruleset_name=part.ruleset_name,
-                    tolerance=tolerance,
+                    part.ruleset_name,
+                    tolerance,
+                    big_number_mode,
+                    depth_left - 1,
+                    deadline,
                 )
 
+    def _iter_fraction_pieces(
+        self,
+        digits: str,
+        ruleset_name: str,
+        tolerance: float,
+        big_number_mode: BigNumberMode,
+        depth_left: int,
+        deadline: Optional[float],
+    ) -> Iterable[_FormatPiece]:
+        """Format fractional digits with a fraction ruleset (>%ruleset>).
+
+        Like ICU, the rule for the denominator (10 for 1 digit, 100 for 2,
+        etc.) is used with quotients and plurals of the numerator.
+        """
+        if depth_left < 0:
+            raise RecursionLimitError(
+                f"Substitutions nested too deeply for 0.{digits} in {ruleset_name}"
+            )
+
+        ruleset = self.rulesets.get(ruleset_name)
+        if ruleset is None:
+            raise RulesetNotFoundError(f"No ruleset: {ruleset_name}")
+
+        numerator = int(digits)
+        denominator = 10 ** len(digits)
+        rule = ruleset.numeric_rules.get(denominator)
+        if rule is None:
+            raise NoRuleForNumberError(
+                f"No rule for {numerator}/{denominator} in {ruleset_name}"
+            )
+
+        for part in rule.parts:
+            if isinstance(part, TextRulePart):
+                if part.text:
+                    yield (part.text, ruleset_name, rule.value)
+            elif isinstance(part, PluralFormatPart):
+                if part.function_name:
+                    yield (part.render_count(numerator), ruleset_name, rule.value)
+            elif (
+                isinstance(part, SubRulePart)
+                and (part.type == SubType.QUOTIENT)
+                and (part.format_pattern is None)
+            ):
+                sub_ruleset_name = part.ruleset_name or ruleset_name
+                if part.text_before:
+                    yield (part.text_before, ruleset_name, rule.value)
+                if part.with_zeros:
+                    # 0.05 is "zero five"
+                    zero_text = self._get_digit_text(sub_ruleset_name, 0)
+                    for _ in range(len(digits) - len(digits.lstrip("0"))):
+                        yield (zero_text, sub_ruleset_name, 0)
+                        yield (" ", ruleset_name, rule.value)
+
+                yield from self._iter_format_pieces(
+                    numerator,
+                    sub_ruleset_name,
+                    tolerance,
+                    big_number_mode,
+                    depth_left - 1,
+                    deadline,
+                )
+                if part.text_after:
+                    yield (part.text_after, ruleset_name, rule.value)
+            else:
+                raise NoRuleForNumberError(
+                    f"Unsupported part for {numerator}/{denominator} "
+                    f"in {ruleset_name}: {part}"
+                )
+
+
+def _iter_no_more_pieces(
+    pieces: Iterator[_FormatPiece], max_parts: int, ruleset_name: str
+) -> Iterator[_FormatPiece]:
+    """Raise PartsLimitError if pieces isn't exhausted (generator)."""
+    if next(pieces, None) is not None:
+        raise PartsLimitError(f"More than {max_parts} parts in {ruleset_name}")
+
+    yield from ()
+
+
+def _get_deadline(limits: FormatLimits) -> Optional[float]:
+    """Get time.monotonic() value when a call times out (None for no deadline)."""
+    if limits.timeout is None:
+        return None
+
+    return time.monotonic() + limits.timeout
+
+
+def normalize_number(
+    number: Union[int, float, str, Decimal, ParsedNumber],
+    max_fraction_digits: Optional[int] = None,
+    rounding: str = ROUND_HALF_EVEN,
+) -> Union[int, float, Decimal]:
+    """Convert a number to int (integral), Decimal (fractional), or float (NaN/Inf).
+
+    Floats are converted using their shortest repr, so 0.1 stays 0.1. Strings
+    must be Python number strings; use RbnfEngine.parse_number for strings
+    formatted for a language.
+    """
+    if isinstance(number, int):
+        return number
+
+    if isinstance(number, float):
+        if isnan(number) or isinf(number):
+            return number
+
+        if number.is_integer():
+            return int(number)
+
+        number = Decimal(repr(number))
+    elif isinstance(number, str):
+        number = Decimal(number)
+    elif isinstance(number, ParsedNumber):
+        number = number.to_value()
+        if isinstance(number, int):
+            return number
+
+    if not number.is_finite():
+        return float(number)
+
+    if (max_fraction_digits is not None) and (
+        number.as_tuple().exponent < -max_fraction_digits  # type: ignore[operator]
+    ):
+        number = number.quantize(Decimal(1).scaleb(-max_fraction_digits), rounding)
+
+    if number == number.to_integral_value():
+        return int(number)
+
+    return number
+
+
+def get_number_key(number_value: Union[int, float, Decimal]) -> Union[int, str]:
+    """Get hashable key of a normalized number (see normalize_number).
+
+    Decimals are keyed by their text, since 4.5 and 4.50 are formatted
+    differently.
+    """
+    if isinstance(number_value, int):
+        return number_value
+
+    return str(number_value)
+
 
 def fractional_to_int(frac_part: float, tolerance: float = DEFAULT_TOLERANCE) -> int:
     """Convert fractional part to int like 0.14000000000000012 -> 14"""
@@ -0,0 +1,777 @@
+"""Export the texts of a range of numbers as speech grammars.
+
+Rules are walked symbolically instead of formatting every number. The numbers
+that use a rule are split into ranges with a single quotient or a full range of
+remainders, whose texts come from the referenced rulesets. Grammars are shared
+by (ruleset, range), so the work grows with the number of rules and digits
+instead of the size of the range.
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .engine import (
+    FormatPurpose,
+    NoRuleForNumberError,
+    PluralFormatPart,
+    RbnfEngine,
+    RbnfRule,
+    RbnfRulePart,
+    RbnfSpecialRule,
+    ReplaceRulePart,
+    SubRulePart,
+    SubType,
+    TextRulePart,
+)
+from .tokens import _SEPARATOR
+
+# Characters that must be quoted in JSGF tokens
+_JSGF_SPECIAL = re.compile(r"[\s;=|*+<>()\[\]{}/\"\\]")
+
+# Plural forms repeat every 100 values of the counted digits (see render)
+_PLURAL_PERIOD = 100
+
+# Most numbers or quotients that a rule is split into (see _build_quotients)
+_MAX_SPLIT_NUMBERS = 10_000
+
+
+@dataclass(frozen=True)
+class GrammarText:
+    """Literal text."""
+
+    text: str
+    """Text as rendered (without soft hyphens)."""
+
+
+@dataclass(frozen=True)
+class GrammarRuleRef:
+    """Reference to a named rule of the grammar."""
+
+    name: str
+    """Name of rule in NumberGrammar.rules."""
+
+
+@dataclass(frozen=True)
+class GrammarSequence:
+    """Expressions rendered one after another (empty for no text)."""
+
+    items: "Tuple[GrammarExpression, ...]" = ()
+    """Expressions in order."""
+
+
+@dataclass(frozen=True)
+class GrammarChoice:
+    """Alternative expressions."""
+
+    options: "Tuple[GrammarExpression, ...]" = ()
+    """Expressions, one of which is rendered."""
+
+
+GrammarExpression = Union[GrammarText, GrammarRuleRef, GrammarSequence, GrammarChoice]
+
+EMPTY = GrammarSequence()
+
+
+@dataclass
+class NumberGrammar:
+    """Grammar of the texts that rulesets render for a range of numbers.
+
+    Texts are exact, except that rules which use the number more than once
+    (e.g., a replacement next to a substitution) may add a few texts that no
+    number in the range renders.
+    """
+
+    root: GrammarExpression
+    """Expression for all texts."""
+
+    rules: Dict[str, GrammarExpression] = field(default_factory=dict)
+    """Named expressions that are referenced more than once."""
+
+    def get_vocabulary(self) -> Set[str]:
+        """Get the words of all texts.
+
+        Words are separated by whitespace and hyphens like tokens of
+        format_tokens. Parts that a language joins into one word (e.g.,
+        einundzwanzig in German) are separate words.
+        """
+        vocabulary: Set[str] = set()
+        for expression in [self.root, *self.rules.values()]:
+            for text in _iter_texts(expression):
+                vocabulary.update(_split_words(text))
+
+        return vocabulary
+
+    def to_regex(self) -> str:
+        """Get a regular expression (re module syntax) that fully matches texts.
+
+        Named rules are expanded, since regular expressions can't refer to
+        them.
+        """
+        patterns: Dict[str, str] = {}
+
+        def to_pattern(expression: GrammarExpression) -> str:
+            if isinstance(expression, GrammarText):
+                return re.escape(expression.text)
+
+            if isinstance(expression, GrammarRuleRef):
+                pattern = patterns.get(expression.name)
+                if pattern is None:
+                    pattern = to_pattern(self.rules[expression.name])
+                    patterns[expression.name] = pattern
+
+                return pattern
+
+            if isinstance(expression, GrammarSequence):
+                return "".join(to_pattern(item) for item in expression.items)
+
+            options = [to_pattern(option) for option in expression.options]
+            other_options = [option for option in options if option]
+            if len(other_options) < len(options):
+                return f"(?:{'|'.join(other_options)})?"
+
+            return f"(?:{'|'.join(options)})"
+
+        return to_pattern(self.root)
+
+    def to_jsgf(self, grammar_name: str = "numbers") -> str:
+        """Get a JSGF grammar whose public rule has the same name as the grammar.
+
+        Tokens are the words of get_vocabulary.
+        """
+        groups: Set[str] = set()
+
+        def to_jsgf(expression: GrammarExpression) -> str:
+            if isinstance(expression, GrammarText):
+                return " ".join(
+                    _jsgf_token(word) for word in _split_words(expression.text)
+                )
+
+            if isinstance(expression, GrammarRuleRef):
+                return f"<{expression.name}>"
+
+            if isinstance(expression, GrammarSequence):
+                return " ".join(filter(None, map(to_jsgf, expression.items)))
+
+            options = [to_jsgf(option) for option in expression.options]
+            other_options = [option for option in options if option]
+            if not other_options:
+                return ""
+
+            if len(other_options) < len(options):
+                if (len(other_options) == 1) and (other_options[0] in groups):
+                    # [(a | b)] -> [a | b]
+                    return f"[{other_options[0][1:-1]}]"
+
+                return f"[{' | '.join(other_options)}]"
+
+            group = f"({' | '.join(options)})"
+            groups.add(group)
+            return group
+
+        lines = [
+            "#JSGF V1.0;",
+            f"grammar {grammar_name};",
+            f"public <{grammar_name}> = {to_jsgf(self.root) or '<NULL>'};",
+        ]
+        lines.extend(
+            f"<{name}> = {to_jsgf(expression) or '<NULL>'};"
+            for name, expression in self.rules.items()
+        )
+
+        return "\n".join(lines) + "\n"
+
+
+def build_number_grammar(
+    engine: RbnfEngine,
+    start: int,
+    stop: int,
+    purpose: Optional[FormatPurpose] = None,
+    ruleset_names: Optional[List[str]] = None,
+) -> NumberGrammar:
+    """Build a grammar for the texts of every integer in range(start, stop).
+
+    Texts are those of every ruleset in FormatResult.text_by_ruleset (rulesets
+    of purpose by default). Numbers that can't be formatted are left out.
+
+    Raises NoRuleForNumberError if no number in the range can be formatted.
+    """
+    if stop <= start:
+        raise ValueError(f"Empty range: {start} to {stop}")
+
+    if purpose is None:
+        purpose = FormatPurpose.CARDINAL
+
+    if ruleset_names is None:
+        ruleset_names = engine.get_ruleset_names(purpose)
+
+    if not ruleset_names:
+        raise ValueError("No rulesets")
+
+    # Equivalent rulesets are only walked once
+    aliases = engine.get_ruleset_aliases(integers=True)
+    canonical_names = dict.fromkeys(aliases.get(name, name) for name in ruleset_names)
+
+    builder = _GrammarBuilder(engine)
+    root = _make_choice(
+        builder.build(ruleset_name, start, stop - 1) for ruleset_name in canonical_names
+    )
+    if root is None:
+        raise NoRuleForNumberError(f"No rules were successful from {start} to {stop}")
+
+    return builder.finish(root)
+
+
+# (ruleset name, lowest number, highest number)
+_RangeKey = Tuple[str, int, int]
+
+
+class _GrammarBuilder:
+    """Walks rules over ranges of numbers (see build_number_grammar)."""
+
+    def __init__(self, engine: RbnfEngine) -> None:
+        self.rulesets = engine.rulesets
+
+        # Range -> expression (None if no number can be formatted)
+        self._results: Dict[_RangeKey, Optional[GrammarExpression]] = {}
+
+        # Ranges being walked, which fail if they're reached again
+        self._visiting: Set[_RangeKey] = set()
+
+        self._rules: Dict[str, GrammarExpression] = {}
+        self._rule_names: Dict[GrammarExpression, str] = {}
+
+    def build(
+        self, ruleset_name: str, low: int, high: int
+    ) -> Optional[GrammarExpression]:
+        """Get expression for numbers from low to high (inclusive) in a ruleset."""
+        key = (ruleset_name, low, high)
+        if key in self._results:
+            return self._results[key]
+
+        if key in self._visiting:
+            # Rendering would never finish
+            return None
+
+        self._visiting.add(key)
+        expression = self._build_ruleset(ruleset_name, low, high)
+        self._visiting.discard(key)
+
+        if isinstance(expression, (GrammarChoice, GrammarSequence)) and (
+            expression != EMPTY
+        ):
+            # Identical expressions share a named rule
+            rule_name = self._rule_names.get(expression)
+            if rule_name is None:
+                rule_name = _get_rule_name(ruleset_name, low, high, self._rules)
+                self._rules[rule_name] = expression
+                self._rule_names[expression] = rule_name
+
+            expression = GrammarRuleRef(rule_name)
+
+        self._results[key] = expression
+        return expression
+
+    def finish(self, root: GrammarExpression) -> NumberGrammar:
+        """Create grammar, keeping only rules that are referenced more than once."""
+        num_references: Dict[str, int] = {}
+        for expression in [root, *self._rules.values()]:
+            for name in _iter_rule_names(expression):
+                num_references[name] = num_references.get(name, 0) + 1
+
+        inlined: Dict[str, GrammarExpression] = {}
+
+        def inline(expression: GrammarExpression) -> GrammarExpression:
+            if isinstance(expression, GrammarRuleRef):
+                if num_references.get(expression.name, 0) > 1:
+                    return expression
+
+                rule_expression = inlined.get(expression.name)
+                if rule_expression is None:
+                    rule_expression = inline(self._rules[expression.name])
+                    inlined[expression.name] = rule_expression
+
+                return rule_expression
+
+            if isinstance(expression, GrammarSequence):
+                sequence = _make_sequence(inline(item) for item in expression.items)
+                assert sequence is not None
+                return sequence
+
+            if isinstance(expression, GrammarChoice):
+                choice = _make_choice(inline(option) for option in expression.options)
+                assert choice is not None
+                return choice
+
+            return expression
+
+        root = inline(root)
+        rules = {
+            name: inline(expression)
+            for name, expression in self._rules.items()
+            if num_references.get(name, 0) > 1
+        }
+
+        return NumberGrammar(root=root, rules=rules)
+
+    def _build_ruleset(
+        self, ruleset_name: str, low: int, high: int
+    ) -> Optional[GrammarExpression]:
+        """Get expression for a range using the rules of a ruleset."""
+        ruleset = self.rulesets.get(ruleset_name)
+        if ruleset is None:
+            # Missing or decimal format pattern (e.g., #,##0)
+            return None
+
+        options: List[Optional[GrammarExpression]] = []
+        if low < 0:
+            negative_high = min(high, -1)
+            rule = ruleset.find_special_rule(
+                RbnfSpecialRule.NEGATIVE_NUMBER, self.rulesets
+            )
+            if rule is not None:
+                # Remainder is the absolute value
+                options.append(
+                    self._build_parts(
+                        rule,
+                        ruleset_name,
+                        (low, negative_high),
+                        (0, 0),
+                        (-negative_high, -low),
+                    )
+                )
+
+            low = 0
+
+        sorted_numbers = ruleset.get_sorted_numbers()
+        if sorted_numbers and (low <= high):
+            # First rule is also used for numbers below it, and last rule for
+            # numbers above it.
+            rule_idx = max(0, bisect_right(sorted_numbers, low) - 1)
+            while low <= high:
+                rule = ruleset.numeric_rules[sorted_numbers[rule_idx]]
+                rule_high = high
+                if (rule_idx + 1) < len(sorted_numbers):
+                    rule_high = min(high, sorted_numbers[rule_idx + 1] - 1)
+
+                options.extend(
+                    self._build_numeric_rule(rule, ruleset_name, low, rule_high)
+                )
+                low = rule_high + 1
+                rule_idx += 1
+
+        return _make_choice(options)
+
+    def _build_numeric_rule(
+        self, rule: RbnfRule, ruleset_name: str, low: int, high: int
+    ) -> Iterable[Optional[GrammarExpression]]:
+        """Get expressions for numbers that use a numeric rule.
+
+        Numbers are split so that each part has a single quotient or a full
+        range of remainders.
+        """
+        assert isinstance(rule.value, int)
+        if rule.value <= 0:
+            yield self._build_parts(rule, ruleset_name, (low, high), (0, 0), (0, 0))
+            return
+
+        power_below, power_above = rule.get_divisors()
+        divisor_ranges = [(low, high, power_below)]
+        if power_above != power_below:
+            # Numbers at or above the upper power use it as the divisor
+            divisor_ranges = [
+                (low, min(high, power_above - 1), power_below),
+                (max(low, power_above), high, power_above),
+            ]
+
+        for divisor_low, divisor_high, divisor in divisor_ranges:
+            if divisor_low > divisor_high:
+                continue
+
+            q_low, r_low = divmod(divisor_low, divisor)
+            q_high, r_high = divmod(divisor_high, divisor)
+            if q_low == q_high:
+                yield self._build_quotients(
+                    rule, ruleset_name, divisor, (q_low, q_low), (r_low, r_high)
+                )
+                continue
+
+            full_q_low = q_low if (r_low == 0) else q_low + 1
+            full_q_high = q_high if (r_high == divisor - 1) else q_high - 1
+            if full_q_low > q_low:
+                yield self._build_quotients(
+                    rule, ruleset_name, divisor, (q_low, q_low), (r_low, divisor - 1)
+                )
+
+            if full_q_low <= full_q_high:
+                yield self._build_quotients(
+                    rule,
+                    ruleset_name,
+                    divisor,
+                    (full_q_low, full_q_high),
+                    (0, divisor - 1),
+                )
+
+            if full_q_high < q_high:
+                yield self._build_quotients(
+                    rule, ruleset_name, divisor, (q_high, q_high), (0, r_high)
+                )
+
+    def _build_quotients(
+        self,
+        rule: RbnfRule,
+        ruleset_name: str,
+        divisor: int,
+        quotients: Tuple[int, int],
+        remainders: Tuple[int, int],
+    ) -> Optional[GrammarExpression]:
+        """Get expression for numbers with a range of quotients.
+
+        Rules that use the number more than once are split into runs of numbers
+        that render the same way, unless there are too many numbers: rules with
+        a replacement are split by remainder (e.g., the "e" of Portuguese
+        hundreds), and rules with plural forms by quotient (e.g., тысяча or
+        тысячи in Russian).
+        """
+        q_low, q_high = quotients
+        r_low, r_high = remainders
+        num_numbers = (q_high - q_low + 1) * (r_high - r_low + 1)
+        if (1 < num_numbers <= _MAX_SPLIT_NUMBERS) and any(
+            isinstance(part, ReplaceRulePart) for part in rule.parts
+        ):
+            return _make_choice(
+                self._build_remainders(
+                    rule, ruleset_name, divisor, quotient, remainders
+                )
+                for quotient in range(q_low, q_high + 1)
+            )
+
+        plural_parts = [
+            part
+            for part in rule.parts
+            if isinstance(part, PluralFormatPart) and part.function_name
+        ]
+        if (not plural_parts) or (q_high - q_low) >= _MAX_SPLIT_NUMBERS:
+            return self._build_parts(
+                rule,
+                ruleset_name,
+                (q_low * divisor + r_low, q_high * divisor + r_high),
+                quotients,
+                remainders,
+            )
+
+        # Runs of quotients with the same plural forms
+        runs: Dict[Tuple[Tuple[str, ...], ...], List[Tuple[int, int]]] = {}
+        run_low = q_low
+        run_texts: Optional[Tuple[Tuple[str, ...], ...]] = None
+        for quotient in range(q_low, q_high + 2):
+            texts: Optional[Tuple[Tuple[str, ...], ...]] = None
+            if quotient <= q_high:
+                texts = tuple(
+                    tuple(
+                        _get_plural_texts(
+                            part,
+                            quotient * divisor + r_low,
+                            quotient * divisor + r_high,
+                        )
+                    )
+                    for part in plural_parts
+                )
+
+            if (quotient > q_low) and (texts != run_texts):
+                assert run_texts is not None
+                runs.setdefault(run_texts, []).append((run_low, quotient - 1))
+                run_low = quotient
+
+            run_texts = texts
+
+        # Runs with the same plural forms share the other parts
+        options: List[Optional[GrammarExpression]] = []
+        numbers = (q_low * divisor + r_low, q_high * divisor + r_high)
+        for plural_texts, quotient_runs in runs.items():
+            plural_texts_iter = iter(plural_texts)
+            items: List[Optional[GrammarExpression]] = []
+            for part in rule.parts:
+                if isinstance(part, SubRulePart) and (part.type == SubType.QUOTIENT):
+                    items.append(
+                        _make_choice(
+                            self._build_part(
+                                part, ruleset_name, numbers, quotient_run, remainders
+                            )
+                            for quotient_run in quotient_runs
+                        )
+                    )
+                elif isinstance(part, PluralFormatPart) and part.function_name:
+                    items.append(_make_choice(map(_make_text, next(plural_texts_iter))))
+                else:
+                    items.append(
+                        self._build_part(
+                            part, ruleset_name, numbers, quotients, remainders
+                        )
+                    )
+
+            options.append(_make_sequence(items))
+
+        return _make_choice(options)
+
+    def _build_remainders(
+        self,
+        rule: RbnfRule,
+        ruleset_name: str,
+        divisor: int,
+        quotient: int,
+        remainders: Tuple[int, int],
+    ) -> Optional[GrammarExpression]:
+        """Get expression for numbers with one quotient and a rule with a
+        replacement.
+
+        Remainders are split into runs where every part besides replacements
+        renders the same.
+        """
+        options: List[Optional[GrammarExpression]] = []
+        run_low = remainders[0]
+        run_items: Optional[List[Optional[GrammarExpression]]] = None
+        for remainder in range(remainders[0], remainders[1] + 2):
+            items: Optional[List[Optional[GrammarExpression]]] = None
+            if remainder <= remainders[1]:
+                number = quotient * divisor + remainder
+                items = [
+                    self._build_part(
+                        part,
+                        ruleset_name,
+                        (number, number),
+                        (quotient, quotient),
+                        (remainder, remainder),
+                    )
+                    for part in rule.parts
+                    if not isinstance(part, ReplaceRulePart)
+                ]
+
+            if (remainder > remainders[0]) and (items != run_items):
+                assert run_items is not None
+                numbers = (
+                    quotient * divisor + run_low,
+                    quotient * divisor + remainder - 1,
+                )
+                other_items = iter(run_items)
+                options.append(
+                    _make_sequence(
+                        (
+                            self.build(part.ruleset_name, *numbers)
+                            if isinstance(part, ReplaceRulePart)
+                            else next(other_items)
+                        )
+                        for part in rule.parts
+                    )
+                )
+                run_low = remainder
+
+            run_items = items
+
+        return _make_choice(options)
+
+    def _build_parts(
+        self,
+        rule: RbnfRule,
+        ruleset_name: str,
+        numbers: Tuple[int, int],
+        quotients: Tuple[int, int],
+        remainders: Tuple[int, int],
+    ) -> Optional[GrammarExpression]:
+        """Get expression for the parts of a rule (like _iter_format_pieces).
+
+        Every combination of quotient and remainder is a number in the range
+        of numbers.
+        """
+        return _make_sequence(
+            self._build_part(part, ruleset_name, numbers, quotients, remainders)
+            for part in rule.parts
+        )
+
+    def _build_part(
+        self,
+        part: RbnfRulePart,
+        ruleset_name: str,
+        numbers: Tuple[int, int],
+        quotients: Tuple[int, int],
+        remainders: Tuple[int, int],
+    ) -> Optional[GrammarExpression]:
+        """Get expression for one part of a rule (see _build_parts)."""
+        if isinstance(part, TextRulePart):
+            return _make_text(part.text)
+
+        if isinstance(part, PluralFormatPart):
+            if not part.function_name:
+                return EMPTY
+
+            return _make_choice(
+                _make_text(text) for text in _get_plural_texts(part, *numbers)
+            )
+
+        if isinstance(part, SubRulePart):
+            sub_low, sub_high = (
+                quotients if (part.type == SubType.QUOTIENT) else remainders
+            )
+            skip_zero = part.is_optional or (part.ruleset_name is None)
+            if skip_zero and (sub_low == 0):
+                # Rulesets can use quotients/remainders of zero
+                if sub_high == 0:
+                    return EMPTY
+
+                return _make_choice(
+                    [EMPTY, self._build_sub(part, ruleset_name, 1, sub_high)]
+                )
+
+            return self._build_sub(part, ruleset_name, sub_low, sub_high)
+
+        if isinstance(part, ReplaceRulePart):
+            return self.build(part.ruleset_name, *numbers)
+
+        return EMPTY
+
+    def _build_sub(
+        self, part: SubRulePart, ruleset_name: str, low: int, high: int
+    ) -> Optional[GrammarExpression]:
+        """Get expression for a substitution with its surrounding text."""
+        return _make_sequence(
+            [
+                _make_text(part.text_before),
+                self.build(part.ruleset_name or ruleset_name, low, high),
+                _make_text(part.text_after),
+            ]
+        )
+
+
+def _get_plural_texts(part: PluralFormatPart, low: int, high: int) -> List[str]:
+    """Get the plural forms of numbers from low to high."""
+    scale = 10 ** part.function_value.count("0")
+    texts: Dict[str, None] = {}
+    for scaled in range(
+        low // scale, min(high // scale, (low // scale) + _PLURAL_PERIOD - 1) + 1
+    ):
+        try:
+            texts[part.render(max(low, scaled * scale))] = None
+        except (ArithmeticError, ValueError):
+            # Number is too small for plural
+            pass
+
+    return list(texts)
+
+
+def _make_text(text: str) -> GrammarExpression:
+    """Create text without soft hyphens (like format_number)."""
+    text = text.replace("\xad", "")
+    if not text:
+        return EMPTY
+
+    return GrammarText(text)
+
+
+def _make_sequence(
+    items: Iterable[Optional[GrammarExpression]],
+) -> Optional[GrammarExpression]:
+    """Create a flattened sequence with adjacent texts joined.
+
+    Returns None if any item is None.
+    """
+    flat_items: List[GrammarExpression] = []
+    for item in items:
+        if item is None:
+            return None
+
+        sub_items = item.items if isinstance(item, GrammarSequence) else (item,)
+        for sub_item in sub_items:
+            if (
+                flat_items
+                and isinstance(sub_item, GrammarText)
+                and isinstance(flat_items[-1], GrammarText)
+            ):
+                flat_items[-1] = GrammarText(flat_items[-1].text + sub_item.text)
+            else:
+                flat_items.append(sub_item)
+
+    if len(flat_items) == 1:
+        return flat_items[0]
+
+    return GrammarSequence(tuple(flat_items))
+
+
+def _make_choice(
+    options: Iterable[Optional[GrammarExpression]],
+) -> Optional[GrammarExpression]:
+    """Create a flattened choice without duplicates.
+
+    Options that are None are dropped, and None is returned if none are left.
+    """
+    flat_options: Dict[GrammarExpression, None] = {}
+    for option in options:
+        if option is None:
+            continue
+
+        if isinstance(option, GrammarChoice):
+            flat_options.update(dict.fromkeys(option.options))
+        else:
+            flat_options[option] = None
+
+    if not flat_options:
+        return None
+
+    if len(flat_options) == 1:
+        return next(iter(flat_options))
+
+    return GrammarChoice(tuple(flat_options))
+
+
+def _get_rule_name(
+    ruleset_name: str, low: int, high: int, rules: Dict[str, GrammarExpression]
+) -> str:
+    """Get a unique rule name for a range that is valid in JSGF."""
+    base_name = re.sub(r"\W", "_", f"{ruleset_name}_{low}_{high}".replace("-", "_"))
+    name = base_name
+    suffix = 1
+    while name in rules:
+        suffix += 1
+        name = f"{base_name}_{suffix}"
+
+    return name
+
+
+def _iter_texts(expression: GrammarExpression) -> Iterable[str]:
+    """Yield texts of an expression (not following references)."""
+    if isinstance(expression, GrammarText):
+        yield expression.text
+    elif isinstance(expression, GrammarSequence):
+        for item in expression.items:
+            yield from _iter_texts(item)
+    elif isinstance(expression, GrammarChoice):
+        for option in expression.options:
+            yield from _iter_texts(option)
+
+
+def _iter_rule_names(expression: GrammarExpression) -> Iterable[str]:
+    """Yield names of referenced rules (not following references)."""
+    if isinstance(expression, GrammarRuleRef):
+        yield expression.name
+    elif isinstance(expression, GrammarSequence):
+        for item in expression.items:
+            yield from _iter_rule_names(item)
+    elif isinstance(expression, GrammarChoice):
+        for option in expression.options:
+            yield from _iter_rule_names(option)
+
+
+def _split_words(text: str) -> List[str]:
+    """Split text into words (dropping separators)."""
+    return [
+        word for word in _SEPARATOR.split(text) if word and not _SEPARATOR.match(word)
+    ]
+
+
+def _jsgf_token(word: str) -> str:
+    """Quote a JSGF token if needed."""
+    if _JSGF_SPECIAL.search(word):
+        escaped = word.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+
+    return word
@@ -0,0 +1,163 @@
+"""Dependency graph between rulesets.
+
+Rulesets reference each other through substitutions (``←%name←``, ``→%name→``)
+and replacements (``=%name=``). Replacements pass the number through unchanged,
+so a cycle made only of replacements recurses forever.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Set
+
+if TYPE_CHECKING:
+    from .engine import RbnfRuleSet
+
+# Replacements like =#,##0= are decimal format patterns, not ruleset names
+_FORMAT_PATTERN = re.compile(r"^[#0,.]+$")
+
+# Ruleset references in raw (unparsed) rule text
+_RULESET_REFERENCE = re.compile(r"(?<=[←→<>=])%%?([^←→<>=%]+)(?=[←→<>=])")
+
+
+def is_format_pattern(name: str) -> bool:
+    """True if a referenced name is a decimal format pattern (e.g., #,##0)."""
+    return _FORMAT_PATTERN.match(name) is not None
+
+
+def find_text_references(rule_text: str) -> Set[str]:
+    """Find names of rulesets referenced in unparsed rule text."""
+    return {
+        name
+        for name in _RULESET_REFERENCE.findall(rule_text)
+        if not is_format_pattern(name)
+    }
+
+
+@dataclass
+class RulesetGraph:
+    """References between rulesets."""
+
+    references: Dict[str, Set[str]] = field(default_factory=dict)
+    """Ruleset name -> names of all rulesets it references."""
+
+    replacements: Dict[str, Set[str]] = field(default_factory=dict)
+    """Ruleset name -> names of rulesets it references with =%name=."""
+
+    dangling: Dict[str, Set[str]] = field(default_factory=dict)
+    """Ruleset name -> referenced names that are not loaded."""
+
+    cycles: List[List[str]] = field(default_factory=list)
+    """Cycles of replacements that would never terminate."""
+
+    def reachable(self, ruleset_names: Iterable[str]) -> Set[str]:
+        """Names of rulesets reachable from (and including) ruleset_names.
+
+        Referenced rulesets that are missing (dangling) are included.
+        """
+        visited: Set[str] = set()
+        stack = [name for name in ruleset_names if name in self.references]
+        while stack:
+            name = stack.pop()
+            if name in visited:
+                continue
+
+            visited.add(name)
+            stack.extend(self.references.get(name, set()) - visited)
+
+        return visited
+
+
+def build_ruleset_graph(rulesets: "Mapping[str, RbnfRuleSet]") -> RulesetGraph:
+    """Build reference graph for a collection of rulesets."""
+    # pylint: disable=import-outside-toplevel
+    from .engine import ReplaceRulePart, SubRulePart
+
+    graph = RulesetGraph()
+    for ruleset_name, ruleset in rulesets.items():
+        references: Set[str] = set()
+        replacements: Set[str] = set()
+        rules = list(ruleset.numeric_rules.values()) + list(
+            ruleset.special_rules.values()
+        )
+        for rule in rules:
+            for part in rule.parts:
+                if isinstance(part, SubRulePart):
+                    # None means the current ruleset
+                    references.add(part.ruleset_name or ruleset_name)
+                elif isinstance(part, ReplaceRulePart):
+                    if is_format_pattern(part.ruleset_name):
+                        continue
+
+                    references.add(part.ruleset_name)
+                    replacements.add(part.ruleset_name)
+
+        graph.references[ruleset_name] = references
+        graph.replacements[ruleset_name] = replacements
+
+        missing = {name for name in references if name not in rulesets}
+        if missing:
+            graph.dangling[ruleset_name] = missing
+
+    graph.cycles = _find_cycles(graph.replacements)
+
+    return graph
+
+
+def _find_cycles(edges: Dict[str, Set[str]]) -> List[List[str]]:
+    """Find cycles using Tarjan's strongly connected components (iterative)."""
+    index_by_name: Dict[str, int] = {}
+    low_by_name: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    cycles: List[List[str]] = []
+
+    for start_name in sorted(edges):
+        if start_name in index_by_name:
+            continue
+
+        # (name, remaining neighbors)
+        work = [(start_name, iter(sorted(edges.get(start_name, ()))))]
+        index_by_name[start_name] = low_by_name[start_name] = len(index_by_name)
+        stack.append(start_name)
+        on_stack.add(start_name)
+
+        while work:
+            name, neighbors = work[-1]
+            for next_name in neighbors:
+                if next_name not in edges:
+                    # Dangling
+                    continue
+
+                if next_name not in index_by_name:
+                    index_by_name[next_name] = low_by_name[next_name] = len(
+                        index_by_name
+                    )
+                    stack.append(next_name)
+                    on_stack.add(next_name)
+                    work.append((next_name, iter(sorted(edges[next_name]))))
+                    break
+
+                if next_name in on_stack:
+                    low_by_name[name] = min(low_by_name[name], index_by_name[next_name])
+            else:
+                # All neighbors visited
+                work.pop()
+                if work:
+                    parent_name = work[-1][0]
+                    low_by_name[parent_name] = min(
+                        low_by_name[parent_name], low_by_name[name]
+                    )
+
+                if low_by_name[name] == index_by_name[name]:
+                    component: List[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == name:
+                            break
+
+                    if (len(component) > 1) or (name in edges[name]):
+                        cycles.append(sorted(component))
+
+    return cycles
@@ -0,0 +1,140 @@
+"""Load many languages concurrently (e.g., every language at startup).
+
+Worker processes parse (and optionally freeze) engines and send them back
+pickled, which is about twice as fast to load as parsing the XML files. Threads
+are used instead when worker processes can't be started.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .engine import RbnfEngine
+from .multi import ExecutorType
+
+_LOGGER = logging.getLogger(__name__)
+
+# engine, seconds to load
+_LoadedEngine = Tuple[RbnfEngine, float]
+
+
+@dataclass
+class LanguageLoaded:
+    """Progress report for a loaded language."""
+
+    language: str
+    """Language that was loaded."""
+
+    seconds: float
+    """Seconds spent loading the language in a worker."""
+
+    num_loaded: int
+    """Number of languages loaded so far (including this one)."""
+
+    num_languages: int
+    """Total number of languages being loaded."""
+
+
+ProgressCallback = Callable[[LanguageLoaded], None]
+
+
+def load_languages(
+    languages: Optional[Iterable[str]] = None,
+    executor_type: ExecutorType = ExecutorType.PROCESS,
+    max_workers: Optional[int] = None,
+    freeze: bool = False,
+    progress: Optional[ProgressCallback] = None,
+) -> Dict[str, RbnfEngine]:
+    """Load engines for many languages concurrently.
+
+    Returns engines keyed by language in the order of languages (default:
+    all supported languages), like RbnfEngine.for_language. Engines are frozen
+    if freeze is True.
+
+    progress is called in this thread as each language finishes loading.
+    Without more than one CPU or language, languages are loaded one by one.
+    """
+    if languages is None:
+        languages = RbnfEngine.get_supported_languages()
+
+    languages = list(dict.fromkeys(languages))
+    supported_languages = set(RbnfEngine.get_supported_languages())
+    for language in languages:
+        if language not in supported_languages:
+            raise ValueError(f"{language} is not supported")
+
+    if max_workers is None:
+        max_workers = min(len(languages), os.cpu_count() or 1)
+
+    loaded: Dict[str, RbnfEngine] = {}
+
+    def report(language: str, loaded_engine: _LoadedEngine) -> None:
+        loaded[language] = loaded_engine[0]
+        if progress is not None:
+            progress(
+                LanguageLoaded(
+                    language=language,
+                    seconds=loaded_engine[1],
+                    num_loaded=len(loaded),
+                    num_languages=len(languages),
+                )
+            )
+
+    if max_workers <= 1:
+        for language in languages:
+            report(language, _load_engine(language, freeze))
+    else:
+        executor_type = ExecutorType(executor_type)
+        if executor_type == ExecutorType.PROCESS:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers) as process_pool:
+                    _load_all(process_pool, languages, freeze, report)
+            except (BrokenProcessPool, NotImplementedError, OSError) as err:
+                _LOGGER.warning("Loading with threads instead of processes: %s", err)
+                executor_type = ExecutorType.THREAD
+
+        if executor_type == ExecutorType.THREAD:
+            with ThreadPoolExecutor(max_workers=max_workers) as thread_pool:
+                _load_all(
+                    thread_pool,
+                    [language for language in languages if language not in loaded],
+                    freeze,
+                    report,
+                )
+
+    return {language: loaded[language] for language in languages}
+
+
+def _load_all(
+    executor: Executor,
+    languages: List[str],
+    freeze: bool,
+    report: Callable[[str, _LoadedEngine], None],
+) -> None:
+    """Load languages with an executor, reporting each as it finishes."""
+    futures: Dict["Future[_LoadedEngine]", str] = {
+        executor.submit(_load_engine, language, freeze): language
+        for language in languages
+    }
+    for future in as_completed(futures):
+        report(futures[future], future.result())
+
+
+def _load_engine(language: str, freeze: bool) -> _LoadedEngine:
+    """Load the engine of a language (runs in a worker)."""
+    start_time = time.perf_counter()
+    engine = RbnfEngine.for_language(language)
+    if freeze:
+        engine.freeze()
+
+    return engine, time.perf_counter() - start_time
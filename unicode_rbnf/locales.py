@@ -0,0 +1,267 @@
+"""Resolve BCP 47 locales to engines with CLDR-style fallback.
+
+A locale like de-CH falls back to de and then to root. Each XML file only
+replaces the ruleset groupings (SpelloutRules, OrdinalRules, ...) it defines,
+so a regional engine is an overlay of its parent's engine that shares every
+ruleset it doesn't replace (see overlay.OverlayEngine).
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Final, List, Optional, Set
+from xml.etree import ElementTree as et
+
+from .engine import _LANG_DIR, SKIP_RULESETS, RbnfEngine, RbnfParseError, RbnfRule
+from .overlay import OverlayEngine
+
+ROOT_LOCALE: Final = "root"
+
+_LOGGER = logging.getLogger(__name__)
+
+# Deprecated language codes
+_LANGUAGE_ALIASES: Final = {"in": "id", "iw": "he", "tl": "fil"}
+
+# Script implied by a region when no script is given
+_LIKELY_SCRIPTS: Final = {
+    ("sr", "ME"): "Latn",
+    ("yue", "CN"): "Hans",
+    ("zh", "HK"): "Hant",
+    ("zh", "MO"): "Hant",
+    ("zh", "TW"): "Hant",
+}
+
+# Parents that aren't found by removing the last subtag (CLDR parentLocales)
+_PARENT_LOCALES: Final[Dict[str, str]] = {
+    "en_150": "en_001",
+    "en_001": "en",
+    "es_419": "es",
+    "nb": "no",
+    "nn": "no",
+    "sr_Latn": ROOT_LOCALE,
+    "yue_Hans": ROOT_LOCALE,
+    "zh_Hant": ROOT_LOCALE,
+    "zh_Hant_MO": "zh_Hant_HK",
+}
+
+_PARENT_LOCALES.update(
+    {
+        f"en_{region}": "en_001"
+        for region in (
+            "AG AI AU BB BM BS BW BZ CA CC CK CM CX CY DG DM ER FJ FK FM GB GD "
+            "GG GH GI GM GY HK IE IL IM IN IO JE JM KE KI KN KY LC LR LS MG MO "
+            "MS MT MU MV MW MY NA NF NG NR NU NZ PG PK PN PW RW SB SC SD SG SH "
+            "SL SS SX SZ TC TK TO TT TV TZ UG VC VG VU WS ZA ZM ZW"
+        ).split()
+    }
+)
+_PARENT_LOCALES.update(
+    {f"en_{region}": "en_150" for region in "AT BE CH DE DK FI NL SE SI".split()}
+)
+_PARENT_LOCALES.update(
+    {
+        f"es_{region}": "es_419"
+        for region in (
+            "AR BO BR BZ CL CO CR CU DO EC GT HN MX NI PA PE PR PY SV US UY VE"
+        ).split()
+    }
+)
+_PARENT_LOCALES.update(
+    {f"pt_{region}": "pt_PT" for region in "AO CH CV FR GQ GW LU MO MZ ST TL".split()}
+)
+
+# language[-script][-region], followed by variants/extensions which are ignored
+_LOCALE_PATTERN: Final = re.compile(
+    r"^(?P<language>[a-z]{2,3}|root)"
+    r"(?:-(?P<script>[a-z]{4}))?"
+    r"(?:-(?P<region>[a-z]{2}|[0-9]{3}))?"
+    r"(?:-[a-z0-9]{1,8})*$",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class _LocaleLayer:
+    """Engine loaded for one XML file in a fallback chain."""
+
+    engine: RbnfEngine
+    """Frozen engine with the rulesets of this layer and its parents."""
+
+    groupings: Dict[str, Set[str]] = field(default_factory=dict)
+    """Grouping type -> names of rulesets from the XML file that defines it."""
+
+
+_LAYERS: Dict[str, _LocaleLayer] = {}
+_LAYERS_LOCK = threading.Lock()
+
+
+def normalize_locale(locale: str) -> str:
+    """Normalize a BCP 47 (or POSIX) locale to the form of XML file names.
+
+    For example, zh-tw becomes zh_Hant_TW and de_CH.UTF-8 becomes de_CH.
+    Variants and extensions are dropped.
+    """
+    # POSIX locales may have an encoding or modifier
+    tag = re.split(r"[.@]", locale.strip(), maxsplit=1)[0].replace("_", "-")
+    match = _LOCALE_PATTERN.match(tag)
+    if match is None:
+        raise ValueError(f"Invalid locale: {locale}")
+
+    language = match.group("language").lower()
+    language = _LANGUAGE_ALIASES.get(language, language)
+    script: Optional[str] = match.group("script")
+    region: Optional[str] = match.group("region")
+
+    if script:
+        script = script.title()
+
+    if region:
+        region = region.upper()
+        if not script:
+            script = _LIKELY_SCRIPTS.get((language, region))
+
+    return "_".join(part for part in (language, script, region) if part)
+
+
+def get_fallback_chain(locale: str) -> List[str]:
+    """Get the locales to try for a locale, from most specific to root.
+
+    Locales don't have to be supported, e.g. en-GB gives en_GB, en_001, en,
+    root.
+    """
+    name = normalize_locale(locale)
+    chain = [name]
+    while name != ROOT_LOCALE:
+        parent_name = _PARENT_LOCALES.get(name)
+        if parent_name is None:
+            # Remove last subtag
+            parent_name = name.rsplit("_", maxsplit=1)[0] if "_" in name else ""
+
+        name = parent_name or ROOT_LOCALE
+        chain.append(name)
+
+    return chain
+
+
+def resolve_locale(locale: str) -> List[str]:
+    """Get the XML file names that are loaded for a locale, ending at root.
+
+    Raises ValueError if no file besides root applies.
+    """
+    chain = [
+        name for name in get_fallback_chain(locale) if _get_xml_path(name).is_file()
+    ]
+    if chain[:1] == [ROOT_LOCALE]:
+        raise ValueError(f"{locale} is not supported")
+
+    return chain
+
+
+def get_supported_locales() -> List[str]:
+    """Return a list of BCP 47 tags that have their own XML file."""
+    return sorted(
+        xml_path.stem.replace("_", "-")
+        for xml_path in _LANG_DIR.glob("*.xml")
+        if xml_path.stem != ROOT_LOCALE
+    )
+
+
+def for_locale(locale: str) -> RbnfEngine:
+    """Get a shared, frozen engine for a BCP 47 locale.
+
+    Engines are cached, and a regional engine shares every ruleset it doesn't
+    replace with the engine of its parent locale.
+    """
+    chain = resolve_locale(locale)
+    with _LAYERS_LOCK:
+        return _get_layer(chain).engine
+
+
+def clear_locale_cache() -> None:
+    """Drop cached locale engines."""
+    with _LAYERS_LOCK:
+        _LAYERS.clear()
+
+
+def _get_xml_path(name: str) -> Path:
+    return _LANG_DIR / f"{name}.xml"
+
+
+def _get_layer(chain: List[str]) -> _LocaleLayer:
+    """Get or load the layer for chain[0] (caller holds _LAYERS_LOCK)."""
+    name = chain[0]
+    layer = _LAYERS.get(name)
+    if layer is not None:
+        return layer
+
+    with open(_get_xml_path(name), "r", encoding="utf-8") as xml_file:
+        root = et.fromstring(xml_file.read())
+
+    groupings = {
+        grouping_elem.attrib["type"]: {
+            ruleset_elem.attrib["type"]
+            for ruleset_elem in grouping_elem.findall("ruleset")
+            if ruleset_elem.attrib["type"] not in SKIP_RULESETS
+        }
+        for grouping_elem in root.findall("rbnf/rulesetGrouping")
+    }
+
+    if len(chain) == 1:
+        # Root of the chain
+        _remove_unsupported_rules(root)
+        engine = RbnfEngine(language=name)
+        engine.load_xml(root)
+        layer = _LocaleLayer(engine=engine.freeze(), groupings=groupings)
+    else:
+        parent_layer = _get_layer(chain[1:])
+        if groupings:
+            layer = _LocaleLayer(
+                engine=_load_overlay(name, root, parent_layer, groupings),
+                groupings={**parent_layer.groupings, **groupings},
+            )
+        else:
+            # Nothing to change (e.g., en_001)
+            layer = parent_layer
+
+    _LAYERS[name] = layer
+    return layer
+
+
+def _remove_unsupported_rules(root: et.Element) -> None:
+    """Remove rules that can't be parsed.
+
+    root's hebrew-thousands has optional text without a substitution.
+    """
+    for ruleset_elem in root.findall("rbnf//ruleset"):
+        for rule_elem in ruleset_elem.findall("rbnfrule"):
+            try:
+                RbnfRule.parse(rule_elem.attrib["value"], rule_elem.text or "")
+            except RbnfParseError as err:
+                _LOGGER.debug(
+                    "Skipping rule in %s: %s", ruleset_elem.attrib["type"], err
+                )
+                ruleset_elem.remove(rule_elem)
+
+
+def _load_overlay(
+    name: str,
+    root: et.Element,
+    parent_layer: _LocaleLayer,
+    groupings: Dict[str, Set[str]],
+) -> RbnfEngine:
+    """Load the rulesets of an XML file on top of its parent's engine."""
+    child_engine = RbnfEngine(language=name)
+    child_engine.load_xml(root)
+
+    overlay = OverlayEngine(parent_layer.engine, language=name)
+    for grouping_type in groupings:
+        # A grouping is replaced as a whole
+        for ruleset_name in parent_layer.groupings.get(grouping_type, set()):
+            overlay.remove_ruleset(ruleset_name)
+
+    for ruleset in child_engine.rulesets.values():
+        overlay.set_ruleset(ruleset)
+
+    return overlay.freeze()
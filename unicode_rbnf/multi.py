@@ -0,0 +1,235 @@
+"""Format numbers into many languages at once."""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from decimal import ROUND_HALF_EVEN, Decimal
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .engine import (
+    DEFAULT_TOLERANCE,
+    FormatOptions,
+    FormatPurpose,
+    FormatResult,
+    RbnfEngine,
+    RbnfError,
+    normalize_number,
+)
+from .number_input import ParsedNumber
+
+NumberType = Union[int, float, str, Decimal, ParsedNumber]
+
+# Engines loaded in a worker process (language -> engine)
+_WORKER_ENGINES: Dict[str, RbnfEngine] = {}
+
+
+class ExecutorType(str, Enum):
+    """Type of pool used to run languages concurrently."""
+
+    THREAD = "thread"
+    """Threads in the current process (engines are shared)."""
+
+    PROCESS = "process"
+    """Worker processes (each worker loads its own engines)."""
+
+
+@dataclass
+class MultiFormatResult:
+    """Result of formatting a number into multiple languages."""
+
+    number: NumberType
+    """Number that was formatted."""
+
+    results: Dict[str, FormatResult] = field(default_factory=dict)
+    """Successful results keyed by language."""
+
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    """Errors keyed by language."""
+
+
+@dataclass
+class _FormatSettings:
+    """Arguments passed through to RbnfEngine.format_number."""
+
+    purpose: Optional[FormatPurpose] = None
+    ruleset_names: Optional[List[str]] = None
+    tolerance: float = DEFAULT_TOLERANCE
+    options: Optional[FormatOptions] = None
+
+
+class MultiLanguageEngine:
+    """Formats numbers into a set of languages concurrently."""
+
+    def __init__(
+        self,
+        languages: Iterable[str],
+        executor_type: ExecutorType = ExecutorType.THREAD,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.languages = list(languages)
+        self.executor_type = ExecutorType(executor_type)
+        self.max_workers = max_workers
+
+        # language -> engine (only in this process for threads)
+        self.engines: Dict[str, RbnfEngine] = {}
+        self._executor: Optional[Executor] = None
+
+        if self.executor_type == ExecutorType.THREAD:
+            self.engines = {
+                language: RbnfEngine.for_language(language)
+                for language in self.languages
+            }
+        else:
+            # Fail early for unsupported languages
+            supported_languages = set(RbnfEngine.get_supported_languages())
+            for language in self.languages:
+                if language not in supported_languages:
+                    raise ValueError(f"{language} is not supported")
+
+    def __enter__(self) -> "MultiLanguageEngine":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def format_number(
+        self,
+        number: NumberType,
+        purpose: Optional[FormatPurpose] = None,
+        ruleset_names: Optional[List[str]] = None,
+        tolerance: float = DEFAULT_TOLERANCE,
+        options: Optional[FormatOptions] = None,
+        max_fraction_digits: Optional[int] = None,
+        rounding: str = ROUND_HALF_EVEN,
+    ) -> MultiFormatResult:
+        """Format a number in every language."""
+        return self.format_numbers(
+            [number],
+            purpose=purpose,
+            ruleset_names=ruleset_names,
+            tolerance=tolerance,
+            options=options,
+            max_fraction_digits=max_fraction_digits,
+            rounding=rounding,
+        )[0]
+
+    def format_numbers(
+        self,
+        numbers: Iterable[NumberType],
+        purpose: Optional[FormatPurpose] = None,
+        ruleset_names: Optional[List[str]] = None,
+        tolerance: float = DEFAULT_TOLERANCE,
+        options: Optional[FormatOptions] = None,
+        max_fraction_digits: Optional[int] = None,
+        rounding: str = ROUND_HALF_EVEN,
+    ) -> List[MultiFormatResult]:
+        """Format numbers in every language.
+
+        Each number is converted once, and each language formats the whole
+        batch as a single task. Errors are captured per language and number.
+        """
+        numbers = list(numbers)
+        settings = _FormatSettings(
+            purpose=purpose,
+            ruleset_names=ruleset_names,
+            tolerance=tolerance,
+            options=options,
+        )
+
+        multi_results = [MultiFormatResult(number=number) for number in numbers]
+        number_values: List[Union[int, float, Decimal]] = []
+        normalized_idxs: List[int] = []
+        for number_idx, number in enumerate(numbers):
+            try:
+                number_values.append(
+                    normalize_number(number, max_fraction_digits, rounding)
+                )
+                normalized_idxs.append(number_idx)
+            except ArithmeticError as err:
+                # Invalid input fails in every language
+                for language in self.languages:
+                    multi_results[number_idx].errors[language] = err
+
+        executor = self._get_executor()
+        futures = {
+            language: executor.submit(
+                _format_language,
+                language,
+                number_values,
+                settings,
+                self.engines.get(language),
+            )
+            for language in self.languages
+        }
+
+        for language, future in futures.items():
+            try:
+                language_results = future.result()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                # Whole language failed (e.g., worker crashed)
+                for number_idx in normalized_idxs:
+                    multi_results[number_idx].errors[language] = err
+                continue
+
+            for number_idx, (result, error) in zip(normalized_idxs, language_results):
+                if error is not None:
+                    multi_results[number_idx].errors[language] = error
+                else:
+                    assert result is not None
+                    multi_results[number_idx].results[language] = result
+
+        return multi_results
+
+    def _get_executor(self) -> Executor:
+        """Create worker pool on first use."""
+        if self._executor is None:
+            if self.executor_type == ExecutorType.PROCESS:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_load_worker_engines,
+                    initargs=(self.languages,),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        return self._executor
+
+
+def _load_worker_engines(languages: Sequence[str]) -> None:
+    """Load engines once per worker process."""
+    for language in languages:
+        _WORKER_ENGINES[language] = RbnfEngine.for_language(language)
+
+
+def _format_language(
+    language: str,
+    number_values: Sequence[Union[int, float, Decimal]],
+    settings: _FormatSettings,
+    engine: Optional[RbnfEngine] = None,
+) -> List[Tuple[Optional[FormatResult], Optional[Exception]]]:
+    """Format a batch of numbers in one language."""
+    if engine is None:
+        engine = _WORKER_ENGINES[language]
+
+    language_results: List[Tuple[Optional[FormatResult], Optional[Exception]]] = []
+    for number_value in number_values:
+        try:
+            result = engine.format_number(
+                number_value,
+                purpose=settings.purpose,
+                ruleset_names=settings.ruleset_names,
+                tolerance=settings.tolerance,
+                options=settings.options,
+            )
+            language_results.append((result, None))
+        except (RbnfError, ValueError, ArithmeticError) as err:
+            # Only this number fails (e.g., decimal.InvalidOperation)
+            language_results.append((None, err))
+
+    return language_results
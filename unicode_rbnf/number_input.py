@@ -0,0 +1,195 @@
+"""Parse locale-formatted number strings (e.g., 1.234,5 or ١٢٣) exactly."""
+
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Final, Iterable, List, Optional, Pattern, Union
+
+# Signs before the digits
+_MINUS_SIGNS: Final = "-\u2212\u2012\u2013\ufe63\uff0d"
+_PLUS_SIGNS: Final = "+\ufe62\uff0b"
+
+# Bidi marks around numbers in right-to-left text
+_BIDI_MARKS: Final = "\u200e\u200f\u061c"
+
+# Spaces used to group digits in any language
+_SPACE_GROUPS: Final = " \u00a0\u202f\u2009"
+
+
+@dataclass(frozen=True)
+class NumberSymbols:
+    """Decimal and grouping symbols of a language (from CLDR)."""
+
+    decimal: str
+    """Characters that separate integer and fraction digits."""
+
+    group: str
+    """Characters that separate groups of integer digits (besides spaces)."""
+
+
+_DOT_DECIMAL: Final = NumberSymbols(decimal=".", group=",")
+_COMMA_DECIMAL: Final = NumberSymbols(decimal=",", group=".")
+_COMMA_DECIMAL_SPACE_GROUP: Final = NumberSymbols(decimal=",", group="")
+
+# Languages that don't use _DOT_DECIMAL (latn and default numbering systems)
+_NUMBER_SYMBOLS: Final[Dict[str, NumberSymbols]] = {
+    **{
+        language: _COMMA_DECIMAL
+        for language in (
+            "az bs ca da de el es fo hr id is it kl km lb lo mk nl pt ro sl sr su "
+            "tr vec vi"
+        ).split()
+    },
+    **{
+        language: _COMMA_DECIMAL_SPACE_GROUP
+        for language in (
+            "af be bg cs eo et ff fi fr hu hy ka kk ky lt lv nb nn no pl pt_PT ru se "
+            "sk sq sv uk"
+        ).split()
+    },
+    "de_CH": NumberSymbols(decimal=".", group="’'"),
+    "es_419": _DOT_DECIMAL,
+    # Arabic separators with Arabic-Indic digits, Latin ones with ASCII digits
+    "ar": NumberSymbols(decimal="٫.", group="٬,"),
+    "fa": NumberSymbols(decimal="٫.", group="٬,"),
+}
+
+
+class _DigitTable(Dict[int, Optional[str]]):
+    """Translation table from any decimal digit to ASCII (filled on demand).
+
+    Bidi marks are removed.
+    """
+
+    def __missing__(self, code: int) -> Optional[str]:
+        char = chr(code)
+        value: Optional[str] = char
+        if char in _BIDI_MARKS:
+            value = None
+        else:
+            digit = unicodedata.decimal(char, None)
+            if digit is not None:
+                value = str(digit)
+
+        self[code] = value
+        return value
+
+
+_DIGITS = _DigitTable()
+
+
+@dataclass(frozen=True)
+class ParsedNumber:
+    """Exact number parsed from text."""
+
+    is_negative: bool = False
+    """True if number had a minus sign."""
+
+    integer_digits: str = "0"
+    """ASCII digits before the decimal symbol (no leading zeros)."""
+
+    fraction_digits: str = ""
+    """ASCII digits after the decimal symbol (trailing zeros are kept)."""
+
+    def to_value(self) -> Union[int, Decimal]:
+        """Convert to int (no fraction digits) or exact Decimal."""
+        if not self.fraction_digits:
+            value = int(self.integer_digits)
+            return -value if self.is_negative else value
+
+        return Decimal(str(self))
+
+    def __str__(self) -> str:
+        sign = "-" if self.is_negative else ""
+        if self.fraction_digits:
+            return f"{sign}{self.integer_digits}.{self.fraction_digits}"
+
+        return f"{sign}{self.integer_digits}"
+
+
+class NumberParser:
+    """Parses number strings with the symbols of a language.
+
+    Digits of any script (e.g., Arabic-Indic or Devanagari) are accepted.
+    Groups of digits must have 3 digits, except for the first and for 2-digit
+    groups before the last (e.g., 1,23,456 in Indian English).
+    """
+
+    def __init__(self, symbols: NumberSymbols) -> None:
+        self.symbols = symbols
+
+        decimal_chars = re.escape(symbols.decimal)
+        group_chars = re.escape(
+            symbols.group
+            + "".join(c for c in _SPACE_GROUPS if c not in symbols.decimal)
+        )
+        self._pattern: Pattern[str] = re.compile(
+            rf"(?P<sign>[{re.escape(_MINUS_SIGNS + _PLUS_SIGNS)}])?"
+            rf"(?P<integer>[0-9]{{1,3}}(?:[{group_chars}][0-9]{{2,3}})*"
+            rf"[{group_chars}][0-9]{{3}}|[0-9]*)"
+            rf"(?:[{decimal_chars}](?P<fraction>[0-9]+))?"
+        )
+        self._group_chars = re.compile(rf"[{group_chars}]")
+
+    @staticmethod
+    def for_language(language: str) -> "NumberParser":
+        """Get a (shared) parser for a language like de or de_CH."""
+        with _PARSERS_LOCK:
+            parser = _PARSERS.get(language)
+            if parser is None:
+                parser = NumberParser(get_number_symbols(language))
+                _PARSERS[language] = parser
+
+        return parser
+
+    def parse(self, text: str) -> ParsedNumber:
+        """Parse a number string or raise ValueError."""
+        parsed = self.try_parse(text)
+        if parsed is None:
+            raise ValueError(f"Not a number: {text!r}")
+
+        return parsed
+
+    def try_parse(self, text: str) -> Optional[ParsedNumber]:
+        """Parse a number string, or return None if it isn't a number."""
+        text = text.strip()
+        if not text.isascii():
+            text = text.translate(_DIGITS).strip()
+
+        match = self._pattern.fullmatch(text)
+        if match is None:
+            return None
+
+        integer_digits = match.group("integer")
+        fraction_digits = match.group("fraction") or ""
+        if (not integer_digits) and (not fraction_digits):
+            return None
+
+        if not integer_digits.isdigit():
+            integer_digits = self._group_chars.sub("", integer_digits)
+
+        return ParsedNumber(
+            is_negative=(match.group("sign") or "+") in _MINUS_SIGNS,
+            integer_digits=integer_digits.lstrip("0") or "0",
+            fraction_digits=fraction_digits,
+        )
+
+    def parse_many(self, texts: Iterable[str]) -> List[Optional[ParsedNumber]]:
+        """Parse many number strings (None for strings that aren't numbers)."""
+        try_parse = self.try_parse
+        return [try_parse(text) for text in texts]
+
+
+_PARSERS: Dict[str, NumberParser] = {}
+_PARSERS_LOCK = threading.Lock()
+
+
+def get_number_symbols(language: str) -> NumberSymbols:
+    """Get symbols for a language like de or de_CH (falls back to de)."""
+    symbols = _NUMBER_SYMBOLS.get(language)
+    if symbols is None:
+        symbols = _NUMBER_SYMBOLS.get(language.split("_", maxsplit=1)[0], _DOT_DECIMAL)
+
+    return symbols
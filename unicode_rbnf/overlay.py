@@ -0,0 +1,139 @@
+"""Lightweight engines that change a few rules of a shared base engine."""
+
+from typing import Iterable, Optional, Set
+
+from .engine import RbnfEngine, RbnfRule, RbnfRuleSet
+
+
+class OverlayEngine(RbnfEngine):
+    """Engine that shares the rulesets of a frozen base engine.
+
+    Rulesets are copied on write: the first add_rule to a ruleset copies its
+    rule dicts (the rules themselves are shared), and every other ruleset is
+    the base engine's object. The rulesets dict is a flat copy of the base's,
+    so lookups don't chain through layers.
+    """
+
+    def __init__(self, base: RbnfEngine, language: Optional[str] = None) -> None:
+        if not base.is_frozen:
+            raise ValueError("Base engine must be frozen")
+
+        super().__init__(language or base.language)
+        self.base = base
+        self.rulesets = dict(base.rulesets)
+
+        # Token ids are shared with the base and its other overlays
+        self.vocabulary = base.vocabulary
+
+        # Names of rulesets that were added or copied from the base
+        self._own_ruleset_names: Set[str] = set()
+
+        # Names of base rulesets that were removed
+        self._removed_ruleset_names: Set[str] = set()
+
+    @property
+    def own_ruleset_names(self) -> Set[str]:
+        """Names of rulesets that are not shared with the base engine."""
+        return set(self._own_ruleset_names)
+
+    def add_rule(
+        self,
+        value_str: str,
+        rule_text: str,
+        ruleset_name: str,
+        radix: int = 10,
+        is_private: bool = False,
+    ) -> Optional[RbnfRule]:
+        """Add or replace a rule without modifying the base engine."""
+        self._check_not_frozen()
+
+        if ruleset_name not in self._own_ruleset_names:
+            base_ruleset = self.rulesets.get(ruleset_name)
+            if base_ruleset is not None:
+                # Copy on write
+                self.rulesets[ruleset_name] = RbnfRuleSet(
+                    name=ruleset_name,
+                    numeric_rules=dict(base_ruleset.numeric_rules.items()),
+                    special_rules=dict(base_ruleset.special_rules.items()),
+                    is_private=base_ruleset.is_private,
+                )
+
+            self._own_ruleset_names.add(ruleset_name)
+
+        return super().add_rule(
+            value_str, rule_text, ruleset_name, radix=radix, is_private=is_private
+        )
+
+    def set_ruleset(self, ruleset: RbnfRuleSet) -> None:
+        """Add or replace a whole ruleset.
+
+        Unlike add_rule, no rules of a base ruleset with the same name are kept.
+        """
+        self._check_not_frozen()
+        self.rulesets[ruleset.name] = ruleset
+        self._own_ruleset_names.add(ruleset.name)
+        self._removed_ruleset_names.discard(ruleset.name)
+        self._clear_caches()
+
+    def remove_ruleset(self, ruleset_name: str) -> None:
+        """Remove a ruleset (base is unchanged)."""
+        self._check_not_frozen()
+        if self.rulesets.pop(ruleset_name, None) is None:
+            return
+
+        self._own_ruleset_names.discard(ruleset_name)
+        if ruleset_name in self.base.rulesets:
+            self._removed_ruleset_names.add(ruleset_name)
+
+        self._clear_caches()
+
+    def freeze(self) -> "OverlayEngine":
+        """Make overlay immutable (see RbnfEngine.freeze).
+
+        Rulesets that don't reference changed rulesets share digit renderings
+        and domains with the base engine.
+        """
+        if self.is_frozen:
+            return self
+
+        graph = self.get_ruleset_graph()
+        changed_names = self._own_ruleset_names | self._removed_ruleset_names
+        base_digit_cache = self.base._digit_cache  # pylint: disable=protected-access
+        unchanged_names = [
+            ruleset_name
+            for ruleset_name in self.rulesets
+            if changed_names.isdisjoint(graph.reachable([ruleset_name]))
+        ]
+        for ruleset_name in unchanged_names:
+            # Base is frozen, so its digit texts are never modified
+            base_digit_texts = base_digit_cache.get(ruleset_name)
+            if base_digit_texts is not None:
+                self._digit_cache[ruleset_name] = base_digit_texts
+
+        super().freeze()
+
+        # Share domain objects too
+        domains = self._get_domains()
+        base_domains = self.base._get_domains()  # pylint: disable=protected-access
+        for ruleset_name in unchanged_names:
+            base_domain = base_domains.get(ruleset_name)
+            if base_domain is not None:
+                domains[ruleset_name] = base_domain
+
+        return self
+
+    def prune_rulesets(self, ruleset_names: Iterable[str]) -> Set[str]:
+        """Remove rulesets not reachable from ruleset_names (base is unchanged)."""
+        removed_names = super().prune_rulesets(ruleset_names)
+        self._own_ruleset_names -= removed_names
+        self._removed_ruleset_names |= removed_names & set(self.base.rulesets)
+
+        return removed_names
+
+    def reset(self) -> None:
+        """Drop all changes and share every ruleset with the base again."""
+        self._check_not_frozen()
+        self.rulesets = dict(self.base.rulesets)
+        self._own_ruleset_names.clear()
+        self._removed_ruleset_names.clear()
+        self._clear_caches()
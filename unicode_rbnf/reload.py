@@ -0,0 +1,209 @@
+"""Engine that reloads rule files when they change."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+from xml.etree import ElementTree as et
+
+from .engine import FormatResult, RbnfEngine, RbnfError
+
+_LOGGER = logging.getLogger(__name__)
+
+PathType = Union[str, Path]
+
+
+@dataclass
+class ReloadMetrics:
+    """Statistics about reloads."""
+
+    num_reloads: int = 0
+    """Number of times a new engine was swapped in."""
+
+    num_failures: int = 0
+    """Number of reloads that failed (the previous engine was kept)."""
+
+    last_load_seconds: Optional[float] = None
+    """Time taken to build the last engine."""
+
+    last_change_latency_seconds: Optional[float] = None
+    """Time from the newest file modification to the last swap."""
+
+    last_swap_time: Optional[float] = None
+    """Time of last swap (seconds since epoch)."""
+
+    last_error: Optional[str] = None
+    """Error from the last failed reload."""
+
+
+class ReloadingEngine:
+    """Handle to an engine that is rebuilt when its XML files change.
+
+    The built-in rules for the language are loaded first, followed by each
+    override file in order. Files are polled by modification time from a
+    background thread. A new engine is fully loaded (and frozen) before it
+    replaces the current one, so callers always see a complete engine.
+    """
+
+    def __init__(
+        self,
+        language: str,
+        override_paths: Iterable[PathType] = (),
+        ruleset_names: Optional[Iterable[str]] = None,
+        poll_seconds: float = 1.0,
+        freeze: bool = True,
+        start: bool = True,
+    ) -> None:
+        self.language = language
+        self.override_paths: List[Path] = [Path(p) for p in override_paths]
+        self.ruleset_names = list(ruleset_names) if ruleset_names is not None else None
+        self.poll_seconds = poll_seconds
+        self.freeze = freeze
+
+        self._metrics = ReloadMetrics()
+        self._reload_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Initial load must succeed
+        self._mtimes = self._get_mtimes()
+        self._engine = self._load()
+
+        if start:
+            self.start()
+
+    def __enter__(self) -> "ReloadingEngine":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    @property
+    def engine(self) -> RbnfEngine:
+        """Current engine.
+
+        Hold on to the returned engine for a sequence of calls that must see the
+        same rules.
+        """
+        return self._engine
+
+    @property
+    def metrics(self) -> ReloadMetrics:
+        """Copy of reload statistics."""
+        with self._reload_lock:
+            return replace(self._metrics)
+
+    def format_number(self, *args, **kwargs) -> FormatResult:
+        """Format a number with the current engine (see RbnfEngine.format_number)."""
+        return self._engine.format_number(*args, **kwargs)
+
+    def start(self) -> None:
+        """Start polling files in a background thread."""
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling files."""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def check(self) -> bool:
+        """Reload if any file has changed since the last check.
+
+        Returns True if a new engine was swapped in.
+        """
+        mtimes = self._get_mtimes()
+        if mtimes == self._mtimes:
+            return False
+
+        return self.reload(mtimes)
+
+    def reload(self, mtimes: Optional[Dict[Path, Optional[float]]] = None) -> bool:
+        """Build a new engine and swap it in.
+
+        Returns True on success. On failure, the current engine is kept and the
+        files are not retried until they change again.
+        """
+        with self._reload_lock:
+            if mtimes is None:
+                mtimes = self._get_mtimes()
+
+            self._mtimes = mtimes
+            start_time = time.perf_counter()
+            try:
+                engine = self._load()
+            except (et.ParseError, OSError, ValueError, RbnfError) as err:
+                self._metrics.num_failures += 1
+                self._metrics.last_error = str(err)
+                _LOGGER.warning("Failed to reload rules for %s: %s", self.language, err)
+                return False
+
+            # Attribute assignment is atomic
+            self._engine = engine
+
+            swap_time = time.time()
+            load_seconds = time.perf_counter() - start_time
+            self._metrics.num_reloads += 1
+            self._metrics.last_load_seconds = load_seconds
+            self._metrics.last_swap_time = swap_time
+            self._metrics.last_error = None
+
+            changed_mtimes = [mtime for mtime in mtimes.values() if mtime is not None]
+            if changed_mtimes:
+                self._metrics.last_change_latency_seconds = max(
+                    0.0, swap_time - max(changed_mtimes)
+                )
+
+        _LOGGER.debug(
+            "Reloaded rules for %s in %0.3f second(s)", self.language, load_seconds
+        )
+        return True
+
+    def _load(self) -> RbnfEngine:
+        """Load built-in rules and overrides into a new engine."""
+        engine = RbnfEngine.for_language(
+            self.language, ruleset_names=self.ruleset_names
+        )
+        for override_path in self.override_paths:
+            if not override_path.is_file():
+                _LOGGER.debug("Skipping missing override file: %s", override_path)
+                continue
+
+            with open(override_path, "r", encoding="utf-8") as override_file:
+                root = et.fromstring(override_file.read())
+
+            engine.load_xml(root)
+
+        if self.freeze:
+            engine.freeze()
+
+        return engine
+
+    def _get_mtimes(self) -> Dict[Path, Optional[float]]:
+        """Get modification times of override files (None if missing)."""
+        mtimes: Dict[Path, Optional[float]] = {}
+        for override_path in self.override_paths:
+            try:
+                mtimes[override_path] = override_path.stat().st_mtime
+            except OSError:
+                mtimes[override_path] = None
+
+        return mtimes
+
+    def _poll(self) -> None:
+        """Check files until stopped."""
+        while not self._stop_event.wait(self.poll_seconds):
+            try:
+                self.check()
+            except Exception:  # pylint: disable=broad-exception-caught
+                _LOGGER.exception("Unexpected error while checking rule files")
@@ -0,0 +1,166 @@
+"""Structured token output with interned word ids."""
+
+import re
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .engine import RbnfSpecialRule
+
+# Whitespace runs, hyphens, and soft hyphens separate words
+_SEPARATOR = re.compile(r"(\s+|[-‐‑]|\xad)")
+
+
+class TokenKind(str, Enum):
+    """Kind of token."""
+
+    WORD = "word"
+    """Word text."""
+
+    SPACE = "space"
+    """Whitespace between words."""
+
+    HYPHEN = "hyphen"
+    """Hyphen between words (e.g., twenty-one)."""
+
+    SOFT_HYPHEN = "soft_hyphen"
+    """Soft hyphen between words (only with FormatOptions.PRESERVE_SOFT_HYPENS)."""
+
+    @property
+    def is_separator(self) -> bool:
+        """True if token separates words."""
+        return self != TokenKind.WORD
+
+
+@dataclass(frozen=True)
+class FormatToken:
+    """Word or separator produced while formatting a number."""
+
+    text: str
+    """Text of token."""
+
+    token_id: int
+    """Id of text in the engine's vocabulary."""
+
+    kind: TokenKind
+    """Kind of token."""
+
+    ruleset_name: str
+    """Name of ruleset whose rule produced the (start of the) token."""
+
+    rule_value: "Union[int, RbnfSpecialRule]"
+    """Value of rule that produced the (start of the) token."""
+
+    @property
+    def is_separator(self) -> bool:
+        """True if token separates words."""
+        return self.kind.is_separator
+
+
+class Vocabulary:
+    """Maps token texts to integer ids (append-only, thread-safe)."""
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._texts: List[str] = []
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> List[str]:
+        return list(self._texts)
+
+    def __setstate__(self, texts: List[str]) -> None:
+        self.__init__()  # type: ignore[misc]
+        for text in texts:
+            self.get_id(text)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, text: object) -> bool:
+        return text in self._ids
+
+    def get_id(self, text: str) -> int:
+        """Get id of text, adding it to the vocabulary if needed."""
+        token_id = self._ids.get(text)
+        if token_id is not None:
+            return token_id
+
+        with self._lock:
+            token_id = self._ids.get(text)
+            if token_id is None:
+                token_id = len(self._texts)
+                self._texts.append(text)
+                self._ids[text] = token_id
+
+        return token_id
+
+    def get_text(self, token_id: int) -> str:
+        """Get text of an id."""
+        return self._texts[token_id]
+
+    def to_dict(self) -> Dict[str, int]:
+        """Copy of text -> id mapping."""
+        with self._lock:
+            return dict(self._ids)
+
+
+def _get_separator_kind(text: str) -> TokenKind:
+    if text == "\xad":
+        return TokenKind.SOFT_HYPHEN
+
+    if text.isspace():
+        return TokenKind.SPACE
+
+    return TokenKind.HYPHEN
+
+
+def iter_tokens(
+    pieces: "Iterable[Tuple[str, str, Union[int, RbnfSpecialRule]]]",
+    vocabulary: Vocabulary,
+    preserve_soft_hyphens: bool = False,
+) -> Iterable[FormatToken]:
+    """Split rendered text pieces into word and separator tokens.
+
+    A word may be built from several pieces (e.g., "drei" + "zehn"), and gets
+    the origin of its first piece. Joining the token texts gives the same text
+    as format_number.
+    """
+    word_parts: List[str] = []
+    word_origin: Optional[Tuple[str, "Union[int, RbnfSpecialRule]"]] = None
+
+    for text, ruleset_name, rule_value in pieces:
+        if not preserve_soft_hyphens:
+            text = text.replace("\xad", "")
+
+        # Even indexes are words, odd indexes are separators
+        for split_idx, split_text in enumerate(_SEPARATOR.split(text)):
+            if (split_idx % 2) == 0:
+                if split_text:
+                    if not word_parts:
+                        word_origin = (ruleset_name, rule_value)
+                    word_parts.append(split_text)
+
+                continue
+
+            if word_parts:
+                assert word_origin is not None
+                word = "".join(word_parts)
+                yield FormatToken(
+                    word, vocabulary.get_id(word), TokenKind.WORD, *word_origin
+                )
+                word_parts.clear()
+
+            yield FormatToken(
+                split_text,
+                vocabulary.get_id(split_text),
+                _get_separator_kind(split_text),
+                ruleset_name,
+                rule_value,
+            )
+
+    if word_parts:
+        assert word_origin is not None
+        word = "".join(word_parts)
+        yield FormatToken(word, vocabulary.get_id(word), TokenKind.WORD, *word_origin)
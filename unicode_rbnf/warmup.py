@@ -0,0 +1,209 @@
+"""Warm up engines from a histogram of formatted numbers.
+
+A UsageRecorder set on an engine counts the (purpose, number) pairs passed to
+format_number. Its histogram is saved to a compact text file, and at startup
+warm_up pre-renders the most common entries into the engine's result cache.
+"""
+
+import gzip
+import heapq
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Dict, Iterable, List, Optional, Tuple, Union
+
+from .engine import (
+    FormatPurpose,
+    FormatResult,
+    RbnfEngine,
+    RbnfError,
+    get_number_key,
+    normalize_number,
+)
+
+PathType = Union[str, Path]
+UsageKey = Tuple[FormatPurpose, Union[int, str]]
+
+_FILE_HEADER = "# unicode-rbnf usage 1"
+
+
+class UsageRecorder:
+    """Histogram of numbers passed to RbnfEngine.format_number.
+
+    Set engine.recorder to start recording. Recording takes no lock, so a few
+    counts may be lost when many threads format numbers at once. At most
+    max_entries distinct numbers are kept; numbers seen after that are only
+    counted in num_dropped.
+    """
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries = max_entries
+        self.counts: Dict[UsageKey, int] = {}
+        self.num_dropped = 0
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    @property
+    def total(self) -> int:
+        """Total number of recorded calls (excluding dropped ones)."""
+        return sum(list(self.counts.values()))
+
+    def record(self, purpose: FormatPurpose, number_key: Union[int, str]) -> None:
+        """Count a number (see engine.get_number_key)."""
+        key = (purpose, number_key)
+        counts = self.counts
+        count = counts.get(key)
+        if count is not None:
+            counts[key] = count + 1
+        elif len(counts) < self.max_entries:
+            counts[key] = 1
+        else:
+            self.num_dropped += 1
+
+    def update(self, other: "UsageRecorder") -> None:
+        """Add counts from another recorder (e.g., from another process)."""
+        for key, count in list(other.counts.items()):
+            if (key in self.counts) or (len(self.counts) < self.max_entries):
+                self.counts[key] = self.counts.get(key, 0) + count
+            else:
+                self.num_dropped += count
+
+        self.num_dropped += other.num_dropped
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[UsageKey, int]]:
+        """Get entries and their counts, most common first."""
+        # Copy first, since other threads may be recording
+        items = list(self.counts.items())
+        if n is None:
+            return sorted(items, key=lambda item: item[1], reverse=True)
+
+        return heapq.nlargest(n, items, key=lambda item: item[1])
+
+    def save(self, path: PathType) -> None:
+        """Save histogram to a text file (gzipped if path ends with .gz).
+
+        Each line has a count, purpose, and number separated by tabs.
+        """
+        with _open_text(path, "w") as usage_file:
+            print(_FILE_HEADER, file=usage_file)
+            for (purpose, number_key), count in self.most_common():
+                print(
+                    count, purpose.name.lower(), number_key, sep="\t", file=usage_file
+                )
+
+    @staticmethod
+    def load(
+        paths: Union[PathType, Iterable[PathType]], max_entries: int = 100_000
+    ) -> "UsageRecorder":
+        """Load and merge histograms saved with UsageRecorder.save."""
+        if isinstance(paths, (str, Path)):
+            paths = [paths]
+
+        recorder = UsageRecorder(max_entries=max_entries)
+        for path in paths:
+            file_recorder = UsageRecorder(max_entries=max_entries)
+            with _open_text(path, "r") as usage_file:
+                for line_idx, line in enumerate(usage_file, start=1):
+                    line = line.strip()
+                    if (not line) or line.startswith("#"):
+                        continue
+
+                    try:
+                        count_str, purpose_str, number_str = line.split("\t")
+                        number_key = get_number_key(normalize_number(number_str))
+                        file_recorder.counts[
+                            (FormatPurpose[purpose_str.upper()], number_key)
+                        ] = int(count_str)
+                    except (KeyError, ValueError, ArithmeticError) as err:
+                        raise ValueError(
+                            f"Invalid usage entry at {path}:{line_idx}: {line!r}"
+                        ) from err
+
+            recorder.update(file_recorder)
+
+        return recorder
+
+
+@dataclass
+class WarmUpResult:
+    """Statistics about a warm-up."""
+
+    num_rendered: int
+    """Number of results added to the cache."""
+
+    num_failed: int
+    """Number of entries that couldn't be formatted."""
+
+    coverage: float
+    """Fraction of recorded calls that are answered from the cache."""
+
+    seconds: float
+    """Time taken to warm up."""
+
+    is_complete: bool
+    """False if the time budget or max_results ran out before the last entry."""
+
+
+def warm_up(
+    engine: RbnfEngine,
+    usage: UsageRecorder,
+    time_budget_seconds: Optional[float] = 1.0,
+    max_results: Optional[int] = 10_000,
+) -> WarmUpResult:
+    """Pre-render the most common numbers into engine.result_cache.
+
+    Lazily computed rule lookups are resolved first, then entries are rendered
+    from most to least common until the time budget or max_results runs out.
+    The new cache replaces the old one in a single assignment, so it's safe to
+    warm up an engine that is in use (including frozen engines).
+    """
+    start_time = time.perf_counter()
+    deadline: Optional[float] = None
+    if time_budget_seconds is not None:
+        deadline = start_time + time_budget_seconds
+
+    for ruleset in engine.rulesets.values():
+        ruleset.get_sorted_numbers()
+
+    result_cache: Dict[UsageKey, FormatResult] = {}
+    num_failed = 0
+    num_covered = 0
+    is_complete = True
+    entries = usage.most_common()
+    for (purpose, number_key), count in entries:
+        if ((max_results is not None) and (len(result_cache) >= max_results)) or (
+            (deadline is not None) and (time.perf_counter() >= deadline)
+        ):
+            is_complete = False
+            break
+
+        try:
+            # Bypasses the recorder, so warming up doesn't skew the histogram
+            result = engine._format_number_value(  # pylint: disable=protected-access
+                normalize_number(number_key), purpose
+            )
+        except (RbnfError, ArithmeticError, ValueError):
+            num_failed += 1
+            continue
+
+        result_cache[(purpose, number_key)] = result
+        num_covered += count
+
+    engine.result_cache = result_cache
+
+    total = sum(count for _key, count in entries)
+    return WarmUpResult(
+        num_rendered=len(result_cache),
+        num_failed=num_failed,
+        coverage=(num_covered / total) if total > 0 else 0.0,
+        seconds=time.perf_counter() - start_time,
+        is_complete=is_complete,
+    )
+
+
+def _open_text(path: PathType, mode: str) -> IO[str]:
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+
+    return open(path, mode, encoding="utf-8")  # pylint: disable=consider-using-with